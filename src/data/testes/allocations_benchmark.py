@@ -0,0 +1,159 @@
+#Memória temporária alocada por chamada no caminho quente da física (tracemalloc)
+'''
+    Mede, com tracemalloc, quanto cada função do caminho quente aloca por chamada:
+
+    - pico: maior memória temporária durante a chamada (bytes acima do início). Qualquer array
+      temporário vivo junto com os demais temporários da chamada aumenta o pico;
+    - retido: memória que ficou alocada depois de todas as chamadas (vazamentos e caches),
+      descontado o que o próprio tracemalloc retém numa função vazia.
+
+    O tracemalloc só enxerga blocos vivos, então o orçamento é sobre o pico médio por chamada e
+    não sobre o número de alocações. Sai com código 1 se alguma função passar do orçamento de
+    BUDGETS ou reter mais que RETAINED_BUDGET, para que a integração contínua acuse regressões
+    (ex: voltar a criar np.array ou .copy() por passo).
+
+    Uso (na raiz do repositório):
+        python src/data/testes/allocations_benchmark.py [--calls 2000]
+'''
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import contextlib
+import gc
+import io
+import tracemalloc
+import numpy as np
+
+from simulator import kernels
+from simulator.engine import SimulationEngine
+
+# Pico médio de memória temporária aceito por chamada (bytes). Escalares do NumPy (24 B) e a
+# conversão de escalares nas ufuncs com out= (~100 B) continuam; um array temporário de 2
+# posições custa ~130 B. Antes dos arrays de trabalho: 656, 240, 336, 720, 7232, 9263 e 9351 B.
+BUDGETS = {
+    "Robot.move":                           544,
+    "Robot.set_wheel_speeds":               192,
+    "Robot.apply_impulse":                  208,
+    "Ball.update_position":                 432,
+    "Ball.apply_impulse":                   208,
+    "resolve_collision_with_field (bola)":  784,
+    "resolve_collision_with_field (robô)":  2112,
+}
+RETAINED_BUDGET = 8192     # Bytes retidos além da função vazia, somando todas as chamadas
+
+
+def _engine():
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = SimulationEngine(party_time=100000)
+    engine.ball.velocity = np.array([80.0, 30.0])
+    for bot in engine.bots:
+        bot.set_wheel_speeds(30.0, 40.0)
+    return engine
+
+
+def measure(function, calls, warmup=50):
+    '''
+        Chama function() calls vezes sob o tracemalloc.
+
+        :return: Tupla (maior pico por chamada, pico médio por chamada, bytes retidos no fim).
+    '''
+    for _ in range(warmup):
+        function()
+
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    peaks = np.empty(calls)
+    for k in range(calls):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks[k] = peak - before
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.enable()
+    return float(peaks.max()), float(peaks.mean()), end - start
+
+
+def scenarios(engine):
+    '''
+        Funções sem argumento para cada ponto do caminho quente, com estado preparado fora da medição.
+    '''
+    dt = engine.dt
+    robot, ball = engine.bots[0], engine.ball
+    manager = engine.physics.collision_manager
+    impulse = np.array([0.5, -0.25])
+    point = robot.position + np.array([2.0, 1.0])
+
+    def robot_move():
+        robot.move(dt)
+
+    def robot_wheels():
+        robot.set_wheel_speeds(30.0, 40.0)
+
+    def robot_impulse():
+        robot.apply_impulse(impulse, point)
+
+    def ball_update():
+        ball.velocity[:] = (80.0, 30.0)
+        ball.update_position(dt)
+
+    def ball_impulse():
+        ball.apply_impulse(impulse, ball.position)
+        ball.impulse = None
+
+    # MTV que empurra o corpo para dentro do campo, recriado no lugar a cada chamada
+    mtv = np.zeros(2)
+
+    def field_ball():
+        mtv[:] = (0.0, 0.1)
+        ball.velocity[:] = (20.0, -60.0)
+        manager.resolve_collision_with_field(ball.collision_object, None, mtv)
+
+    def field_robot():
+        mtv[:] = (0.1, 0.0)
+        robot.velocity[:] = (-60.0, 10.0)
+        manager.resolve_collision_with_field(robot.collision_object, None, mtv)
+
+    return {
+        "Robot.move":                           robot_move,
+        "Robot.set_wheel_speeds":               robot_wheels,
+        "Robot.apply_impulse":                  robot_impulse,
+        "Ball.update_position":                 ball_update,
+        "Ball.apply_impulse":                   ball_impulse,
+        "resolve_collision_with_field (bola)":  field_ball,
+        "resolve_collision_with_field (robô)":  field_robot,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Memória temporária por chamada no caminho quente da física.")
+    parser.add_argument("--calls", type=int, default=2000, help="Chamadas medidas por função.")
+    args = parser.parse_args()
+    kernels.ENABLED = False     # Mede o caminho NumPy (os kernels Numba não alocam)
+
+    engine = _engine()
+    _, _, floor = measure(lambda: None, args.calls)
+    print(f"[Alocações]: {args.calls} chamadas por função")
+    print(f"  {'função':<38} {'pico máx (B)':>13} {'pico médio (B)':>15} {'retido (B)':>11} {'orçamento':>10}")
+    ok = True
+    for name, function in scenarios(engine).items():
+        worst, mean, retained = measure(function, args.calls)
+        retained -= floor
+        budget = BUDGETS[name]
+        passed = mean <= budget and retained <= RETAINED_BUDGET
+        ok &= passed
+        print(f"  {name:<38} {worst:>13.0f} {mean:>15.1f} {retained:>11d} {budget:>10d}" + ("" if passed else "  <- acima"))
+
+    # Passo completo só como referência (a colisão ainda cria listas e dicionários por passo)
+    with contextlib.redirect_stdout(io.StringIO()):
+        worst, mean, retained = measure(engine.physics.update, min(args.calls, 500))
+    retained -= floor
+    print(f"  {'Physics.update (referência)':<38} {worst:>13.0f} {mean:>15.1f} {retained:>11d} {'-':>10}")
+
+    print("[Alocações]: OK" if ok else "[Alocações]: orçamento excedido")
+    sys.exit(0 if ok else 1)
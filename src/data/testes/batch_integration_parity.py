@@ -0,0 +1,86 @@
+#Paridade e tempo entre a integração dos robôs em lote e o Robot.move por robô
+'''
+    Roda a mesma partida headless duas vezes, uma com Physics._move_bots_batched e outra com o
+    Robot.move de cada robô, com os mesmos comandos de roda aleatórios a cada passo, e compara as
+    poses de todos os corpos passo a passo. Também mede o tempo do update_bots em cada caminho.
+
+    Uso (na raiz do repositório):
+        python src/data/testes/batch_integration_parity.py [--steps 3000] [--kernels]
+'''
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import contextlib
+import io
+import time
+import numpy as np
+
+from simulator import kernels
+from simulator.engine import SimulationEngine
+
+TOLERANCE = 1e-9    # cm / rad
+
+
+def _engine(batch):
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = SimulationEngine(party_time=10000)
+    engine.physics.batch_integration = batch
+    engine.ball.velocity = np.array([90.0, 40.0])
+    return engine
+
+
+def run(batch, steps, seed=7):
+    '''
+        Executa a partida e retorna (poses (steps, N, 3), tempo total do update_bots em s).
+    '''
+    engine = _engine(batch)
+    rng = np.random.default_rng(seed)
+    physics = engine.physics
+
+    elapsed = 0.0
+    update_bots = physics.update_bots
+    def timed_update_bots():
+        nonlocal elapsed
+        start = time.perf_counter()
+        update_bots()
+        elapsed += time.perf_counter() - start
+    physics.update_bots = timed_update_bots
+
+    poses = np.empty((steps, physics.world.n_bodies, 3))
+    for k in range(steps):
+        # Comandos novos a cada 20 passos, com trechos parados para os robôs dormirem
+        if k % 20 == 0:
+            commands = rng.uniform(-60, 60, (len(engine.bots), 2)) * (rng.random((len(engine.bots), 1)) < 0.7)
+        for bot, (v_l, v_r) in zip(engine.bots, commands):
+            bot.set_wheel_speeds(v_l, v_r)
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.step()
+        poses[k] = engine.get_poses()
+    return poses, elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Paridade entre a integração em lote e o Robot.move.")
+    parser.add_argument("--steps", type=int, default=3000, help="Passos de física.")
+    parser.add_argument("--kernels", action="store_true", help="Força os kernels (interpretados se não houver Numba).")
+    args = parser.parse_args()
+    if args.kernels:
+        kernels.ENABLED = True
+
+    print(f"[Integração]: {args.steps} passos, kernels {'ligados' if kernels.ENABLED else 'desligados'}")
+    per_robot, time_per_robot = run(False, args.steps)
+    batched, time_batched = run(True, args.steps)
+
+    error = np.abs(per_robot - batched)
+    error[..., 2] = np.minimum(error[..., 2], 2 * np.pi - error[..., 2])
+    worst = float(error.max())
+    first = int(np.argmax(error.reshape(args.steps, -1).max(axis=1) > TOLERANCE)) if worst > TOLERANCE else None
+
+    print(f"  Robot.move por robô   update_bots {time_per_robot * 1e6 / args.steps:8.1f} µs/passo")
+    print(f"  Integração em lote    update_bots {time_batched * 1e6 / args.steps:8.1f} µs/passo")
+    print(f"  Maior diferença nas poses: {worst:.3e}" + (f" (primeira no passo {first})" if first is not None else ""))
+    ok = worst <= TOLERANCE
+    print("[Integração]: paridade OK" if ok else "[Integração]: paridade FALHOU")
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,129 @@
+#Precisão, estabilidade e desempenho dos integradores da física para vários passos de tempo
+'''
+    Para cada integrador ("legacy", "semi_implicit_euler", "verlet", "rk4") e cada dt:
+
+    - Erro: voo livre (sem colisões nem árbitro) de --horizon segundos com comandos de roda
+      constantes por robô e a bola rolando. O erro é o maior desvio de posição (cm) no fim, contra
+      uma referência RK4 com dt = --reference-dt do mesmo modelo contínuo.
+    - Desempenho: partida headless completa (colisões, árbitro) de --duration segundos com
+      comandos aleatórios, medida em segundos simulados por segundo real.
+    - Estabilidade: na mesma partida, estados finitos, velocidades abaixo de MAX_SPEED e a bola
+      nunca fora do campo (SDF do campo) por mais de um raio.
+
+    No fim, mostra para cada integrador o maior dt estável com erro abaixo de --tolerance.
+
+    Uso (na raiz do repositório):
+        python src/data/testes/integrators_benchmark.py [--integrators rk4 verlet] [--dts 0.004 0.008]
+'''
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import contextlib
+import io
+import time
+import numpy as np
+
+from simulator.engine import SimulationEngine
+from simulator.integrators import INTEGRATORS
+
+NAMES = ["legacy"] + list(INTEGRATORS)
+DTS = [1 / 960, 1 / 480, 1 / 240, 1 / 120, 1 / 60, 1 / 30, 1 / 15]
+MAX_SPEED = 5000.0  # cm/s
+
+
+def _engine(dt, integrator):
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = SimulationEngine(dt=dt, party_time=100000)
+    engine.physics.set_integrator(integrator)
+    return engine
+
+
+def free_flight(integrator, dt, horizon, seed=3):
+    '''
+        Voo livre sem colisões: retorna as posições (N, 2) de todos os corpos após horizon segundos.
+    '''
+    engine = _engine(dt, integrator)
+    physics = engine.physics
+    physics.check_collisions = lambda: None
+    physics.sleeping_bodies = False
+
+    rng = np.random.default_rng(seed)
+    world = physics.world
+    world.wheel_speeds[physics.bot_indices] = rng.uniform(-80, 80, (len(physics.bot_indices), 2))
+    engine.ball.velocity = np.array([120.0, -70.0])
+
+    steps = int(round(horizon / dt))
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(steps):
+            physics.update()
+    return world.positions.copy()
+
+
+def match(integrator, dt, duration, seed=5):
+    '''
+        Partida completa com comandos aleatórios: retorna (segundos simulados por segundo real, estável).
+    '''
+    engine = _engine(dt, integrator)
+    sdf = engine.field.sdf
+    world = engine.physics.world
+    rng = np.random.default_rng(seed)
+
+    steps = int(round(duration / dt))
+    period = max(1, int(round(0.25 / dt)))
+    stable = True
+    elapsed = 0.0
+    for k in range(steps):
+        if k % period == 0:
+            commands = rng.uniform(-100, 100, (len(engine.bots), 2))
+            if k % (8 * period) == 0:
+                angle = rng.uniform(0, 2 * np.pi)
+                engine.ball.velocity = np.array([np.cos(angle), np.sin(angle)]) * rng.uniform(100, 300)
+        for bot, (v_l, v_r) in zip(engine.bots, commands):
+            bot.set_wheel_speeds(v_l, v_r)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.step()
+        elapsed += time.perf_counter() - start
+
+        distance, _ = sdf.sample(world.positions[:1])
+        if (not np.isfinite(world.positions).all() or not np.isfinite(world.velocities).all()
+                or np.abs(world.velocities).max() > MAX_SPEED or distance[0] < -engine.ball.radius):
+            stable = False
+            break
+    return steps * dt / elapsed if elapsed > 0 else float("inf"), stable
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compara os integradores da física.")
+    parser.add_argument("--integrators", nargs="+", default=NAMES, choices=NAMES, help="Integradores avaliados.")
+    parser.add_argument("--dts", nargs="+", type=float, default=DTS, help="Passos de tempo (s).")
+    parser.add_argument("--horizon", type=float, default=2.0, help="Duração do voo livre (s).")
+    parser.add_argument("--reference-dt", type=float, default=1e-4, help="dt da referência RK4 (s).")
+    parser.add_argument("--duration", type=float, default=5.0, help="Duração da partida de desempenho (s).")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Erro máximo aceito (cm).")
+    args = parser.parse_args()
+
+    print(f"[Integradores]: referência RK4 com dt={args.reference_dt:g}s, voo livre de {args.horizon:g}s")
+    reference = free_flight("rk4", args.reference_dt, args.horizon)
+
+    print(f"  {'integrador':<20} {'dt (s)':>9} {'erro (cm)':>11} {'sim-s/s':>9}  estável")
+    best = {}
+    for name in args.integrators:
+        for dt in sorted(args.dts):
+            error = float(np.linalg.norm(free_flight(name, dt, args.horizon) - reference, axis=1).max())
+            speed, stable = match(name, dt, args.duration)
+            print(f"  {name:<20} {dt:>9.5f} {error:>11.4f} {speed:>9.1f}  {'sim' if stable else 'NÃO'}")
+            if stable and error <= args.tolerance:
+                best[name] = (dt, speed)
+
+    print(f"[Integradores]: maior dt estável com erro <= {args.tolerance:g} cm")
+    for name in args.integrators:
+        if name in best:
+            dt, speed = best[name]
+            print(f"  {name:<20} dt={dt:.5f}s  ({speed:.1f} sim-s/s)")
+        else:
+            print(f"  {name:<20} nenhum")
+    sys.exit(0 if best else 1)
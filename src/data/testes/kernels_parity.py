@@ -0,0 +1,201 @@
+#Paridade entre o caminho NumPy e os kernels (Numba) da física
+'''
+    Verifica que os kernels de simulator/kernels.py reproduzem o caminho NumPy dentro de uma tolerância:
+    cada rotina com entradas aleatórias e, no fim, uma partida headless completa com os dois backends.
+
+    Sem Numba instalado, os kernels rodam como Python puro (mesmo código), o que ainda valida as contas.
+
+    Uso (na raiz do repositório):
+        python src/data/testes/kernels_parity.py [--cases 2000] [--steps 1500]
+'''
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import contextlib
+import io
+import numpy as np
+
+from ui.interface_config import *
+from simulator import kernels
+from simulator.collision.collision import CollisionRectangle, CollisionCircle, ContinuousCollisionDetector
+
+TOLERANCE = 1e-9            # Rotinas isoladas
+TRAJECTORY_TOLERANCE = 1e-6 # Partida completa (cm / rad)
+
+
+class _Reference:
+    def __init__(self):
+        self.velocity = np.zeros(2)
+        self.angular_velocity = 0.0
+        self.type_object = ROBOT_OBJECT
+
+
+@contextlib.contextmanager
+def backend(enabled):
+    '''
+        Liga ou desliga os kernels temporariamente (mesmo sem Numba, para testar o código dos kernels).
+    '''
+    previous = kernels.ENABLED
+    kernels.ENABLED = enabled
+    try:
+        yield
+    finally:
+        kernels.ENABLED = previous
+
+
+def _report(name, errors, tolerance):
+    worst = max(errors) if errors else 0.0
+    status = "ok" if worst <= tolerance else "FALHOU"
+    print(f"  {name:<24} {len(errors):>6} casos   erro máx {worst:.3e}   {status}")
+    return worst <= tolerance
+
+
+def _random_rectangle(rng):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return CollisionRectangle(*rng.uniform(0, 20, 2), *rng.uniform(2, 10, 2), MOVING_OBJECTS,
+                                  angle=rng.uniform(0, 360), reference=_Reference())
+
+
+def check_collision_kernels(rng, cases):
+    ok = True
+
+    # SAT retângulo-retângulo, por par e em lote
+    errors, rects_a, rects_b = [], [], []
+    for _ in range(cases):
+        a, b = _random_rectangle(rng), _random_rectangle(rng)
+        rects_a.append(a)
+        rects_b.append(b)
+        with backend(False):
+            hit_np, mtv_np = a.check_collision_with_rectangle(b)
+        with backend(True):
+            hit_k, mtv_k = a.check_collision_with_rectangle(b)
+        if hit_np != hit_k:
+            errors.append(np.inf)
+        elif hit_np:
+            errors.append(float(np.max(np.abs(mtv_np - mtv_k))))
+    ok &= _report("sat_rectangles", errors, TOLERANCE)
+
+    from simulator.collision.collision import batch_sat_rectangles
+    corners = np.stack([r.get_corners_array() for r in rects_a + rects_b])
+    centers = np.array([(r.x, r.y) for r in rects_a + rects_b])
+    first, second = np.arange(cases), np.arange(cases, 2 * cases)
+    hit_np, mtv_np = batch_sat_rectangles(corners[first], corners[second], centers[first], centers[second])
+    hit_k, mtv_k = np.zeros(cases, dtype=bool), np.zeros((cases, 2))
+    kernels.sat_rectangles_batch(corners, centers, first, second, 1e-2, hit_k, mtv_k)
+    errors = list(np.where(hit_np != hit_k, np.inf, np.max(np.abs(mtv_np - mtv_k), axis=1)))
+    ok &= _report("sat_rectangles_batch", errors, TOLERANCE)
+
+    # Círculo contra retângulo
+    errors = []
+    for _ in range(cases):
+        rect = _random_rectangle(rng)
+        with contextlib.redirect_stdout(io.StringIO()):
+            circle = CollisionCircle(*rng.uniform(0, 20, 2), rng.uniform(0.5, 4), MOVING_OBJECTS)
+        with backend(False):
+            hit_np, mtv_np = rect.check_collision_with_circle(circle)
+        with backend(True):
+            hit_k, mtv_k = rect.check_collision_with_circle(circle)
+        if hit_np != hit_k:
+            errors.append(np.inf)
+        elif hit_np:
+            errors.append(float(np.max(np.abs(mtv_np - mtv_k))))
+    ok &= _report("circle_rectangle", errors, TOLERANCE)
+
+    # Varredura de círculo contra segmento (CCD)
+    errors, ccd = [], ContinuousCollisionDetector()
+    for _ in range(cases):
+        cx, cy, mx, my, ax, ay, bx, by = rng.uniform(-10, 10, 8)
+        radius = rng.uniform(0.5, 3)
+        with backend(False):
+            t_np, n_np = ccd._swept_circle_segment(cx, cy, radius, mx, my, (ax, ay), (bx, by))
+        with backend(True):
+            t_k, n_k = ccd._swept_circle_segment(cx, cy, radius, mx, my, (ax, ay), (bx, by))
+        if (t_np is None) != (t_k is None):
+            errors.append(np.inf)
+        elif t_np is not None:
+            errors.append(max(abs(t_np - t_k), float(np.max(np.abs(n_np - n_k)))))
+    ok &= _report("swept_circle_segment", errors, TOLERANCE)
+    return ok
+
+
+def _engine(seed):
+    from simulator.engine import SimulationEngine
+    engine = SimulationEngine(party_time=1000)
+    rng = np.random.default_rng(seed)
+    for bot in engine.bots:
+        bot.set_wheel_speeds(*rng.uniform(-40, 40, 2))
+    engine.ball.velocity = rng.uniform(-120, 120, 2)
+    return engine
+
+
+def check_integration_kernels(rng, cases):
+    ok = True
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine_np, engine_k = _engine(0), _engine(0)
+
+    # Um passo de integração de cada corpo, a partir de estados aleatórios iguais
+    errors = []
+    for _ in range(cases):
+        state = rng.uniform(-50, 50, 7)
+        for bot in (engine_np.bots[0], engine_k.bots[0]):
+            bot.position = state[0:2] + 80
+            bot.velocity = state[2:4].copy()
+            bot.angle = state[4] % (2 * np.pi)
+            bot.direction = np.array([np.cos(bot.angle), np.sin(bot.angle)])
+            bot.angular_velocity = state[5] / 10
+            bot.set_wheel_speeds(state[6], -state[6] / 2)
+        with backend(False):
+            engine_np.bots[0].move(PHYSICS_DT)
+        with backend(True):
+            engine_k.bots[0].move(PHYSICS_DT)
+        a, b = engine_np.bots[0], engine_k.bots[0]
+        errors.append(max(float(np.max(np.abs(a.position - b.position))), float(np.max(np.abs(a.velocity - b.velocity))),
+                          abs(a.angle - b.angle), abs(a.angular_velocity - b.angular_velocity)))
+    ok &= _report("robot_move", errors, TOLERANCE)
+
+    errors = []
+    for _ in range(cases):
+        state = rng.uniform(-200, 200, 4)
+        state[2:4] *= rng.integers(0, 2)      # Metade dos casos parte do repouso
+        for ball in (engine_np.ball, engine_k.ball):
+            ball.position = np.array([85.0, 65.0]) + state[0:2] / 10
+            ball.velocity = state[2:4].copy()
+            ball.impulse = None
+            ball.angular_velocity = 0.0
+        with backend(False):
+            engine_np.ball.update_position(PHYSICS_DT)
+        with backend(True):
+            engine_k.ball.update_position(PHYSICS_DT)
+        a, b = engine_np.ball, engine_k.ball
+        errors.append(max(float(np.max(np.abs(a.position - b.position))), float(np.max(np.abs(a.velocity - b.velocity))),
+                          abs(a.angular_velocity - b.angular_velocity)))
+    ok &= _report("ball_update", errors, TOLERANCE)
+    return ok
+
+
+def check_trajectory(steps):
+    poses = []
+    for enabled in (False, True):
+        with contextlib.redirect_stdout(io.StringIO()), backend(enabled):
+            engine = _engine(1)
+            engine.step(steps)
+            poses.append(engine.get_poses())
+    return _report(f"partida ({steps} passos)", [float(np.max(np.abs(poses[0] - poses[1])))], TRAJECTORY_TOLERANCE)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Paridade entre o caminho NumPy e os kernels da física.")
+    parser.add_argument("--cases", type=int, default=2000, help="Casos aleatórios por rotina.")
+    parser.add_argument("--steps", type=int, default=1500, help="Passos da partida completa.")
+    args = parser.parse_args()
+
+    mode = "Numba (compilado)" if kernels.NUMBA_AVAILABLE else "Python puro (numba não instalado)"
+    print(f"[Kernels]: comparando NumPy com os kernels em {mode}")
+    rng = np.random.default_rng(1234)
+    ok = check_collision_kernels(rng, args.cases)
+    ok &= check_integration_kernels(rng, args.cases)
+    ok &= check_trajectory(args.steps)
+    print("[Kernels]: paridade OK" if ok else "[Kernels]: paridade FALHOU")
+    sys.exit(0 if ok else 1)
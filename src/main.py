@@ -8,7 +8,8 @@ from simulator.objects.field import Field
 from simulator.objects.robot import Robot
 
 from simulator.game_logic import *
-from simulator.objects.timer import Stopwatch
+from simulator.objects.world_state import interpolate_poses
+from simulator.objects.timer import SimulationClock
 
 from simulator.rules.rules  import *
 
@@ -50,11 +51,13 @@ bots = blue_team.robots + red_team.robots
 
 # Gerando clock do jogo
 clock = pygame.time.Clock()
-timer = Stopwatch(TIMER_PARTY) #Gerando cronometro 
+timer = SimulationClock(TIMER_PARTY) #Gerando cronometro (tempo simulado)
 
     
-#Gerando motor físico para atualizar a simulação
-Physics_Engine = Physics(allies=blue_team,enemies=red_team,ball=ball,dt=1.0/FPS,field=field,screen=screen)
+#Gerando motor físico para atualizar a simulação (passo fixo, independente do FPS)
+Physics_Engine = Physics(allies=blue_team,enemies=red_team,ball=ball,dt=PHYSICS_DT,field=field,screen=screen)
+accumulator = 0.0
+previous_poses = Physics_Engine.world.get_poses()   # Poses antes do último passo, para interpolar o desenho
 
 # === Estados do Jogo ===
 game_started = False
@@ -70,7 +73,7 @@ selected_robot = None
 arbitrator = Arbitrator(ball, field, blue_team,red_team,interface,timer)
 
 #Método para resetar configurações
-def reset_simulation(timer:Stopwatch):
+def reset_simulation(timer:SimulationClock):
     timer.reset()
     timer.duration = TIMER_PARTY
 
@@ -84,7 +87,7 @@ def reset_simulation(timer:Stopwatch):
 print("\n[Simulador] ======== simulação PRONTA para iniciar ========")
 # === Loop Principal ===
 while running:
-    dt = clock.tick(FPS) / 1000.0
+    dt = min(clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
     # --- Eventos ---
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -172,27 +175,41 @@ while running:
     if not is_game_paused:
         # --- Atualização do Jogo ---
         if game_started:
-            # Atualizando o dt para contabilizar a modificação dos clocks ou bugs
-            Physics_Engine.dt = dt 
-            Physics_Engine.collision_manager.dt = dt 
-
-            # Aplico o controle nos robôs
-            for bot in blue_team.robots:
-                bot.set_wheel_speeds(20,20)
-            
-            for bot in red_team.robots:
-                bot.set_wheel_speeds(10,15)
+            # Acumulador de passo fixo: executa quantos passos de PHYSICS_DT couberem no quadro
+            accumulator += dt
+            while game_started and accumulator >= PHYSICS_DT:
+                accumulator -= PHYSICS_DT
+
+                # Aplico o controle nos robôs
+                for bot in blue_team.robots:
+                    bot.set_wheel_speeds(20,20)
+                
+                for bot in red_team.robots:
+                    bot.set_wheel_speeds(10,15)
 
 
-            #Atualizo a física do jogo e as posições dos robôs
-            Physics_Engine.update()
+                #Atualizo a física do jogo e as posições dos robôs
+                previous_poses = Physics_Engine.world.get_poses()
+                Physics_Engine.update()
+                timer.tick(PHYSICS_DT)
 
-            # O arbitro analisa a situação do game
-            if arbitrator.analyzer() == Decisions.FINISH:
-                game_started = False
-                reset_simulation(timer)
+                # O arbitro analisa a situação do game
+                decision = arbitrator.analyzer()
+                if decision is not None:
+                    # Após reposicionamentos do árbitro não há o que interpolar
+                    previous_poses = Physics_Engine.world.get_poses()
+                if decision == Decisions.FINISH:
+                    game_started = False
+                    accumulator = 0.0
+                    reset_simulation(timer)
 
     # --- Renderização ---
+    # Entre dois passos de física, desenha a pose interpolada pela sobra do acumulador
+    poses = Physics_Engine.world.get_poses()
+    if game_started and not is_game_paused:
+        poses = interpolate_poses(previous_poses, poses, accumulator / PHYSICS_DT)
+    else:
+        previous_poses = poses  # Parado (pausa, reset, arrasto): nada a interpolar ao retomar
     interface.get_states(draw_collision_objects=draw_collision_objects, running=game_started, is_game_paused=is_game_paused, draw_grid_collision = draw_grid_collision)
     interface.draw(
         time_left=timer.get_time_left(),
@@ -200,6 +217,7 @@ while running:
         ball=ball,
         field=field,
         robots=blue_team.robots + red_team.robots,
+        poses=poses,
     )
 
     # -- Atualização do Display ---
@@ -0,0 +1,349 @@
+#Passo de tempo adaptativo da física headless, com localização de eventos (impactos e gols)
+'''
+    AdaptiveTimestep escolhe o dt de cada passo de SimulationEngine.run_adaptive:
+
+    - Fase ampla: cada corpo é envolvido por um círculo (raio da bola ou meia diagonal do robô) e
+      a folga entre pares, até as paredes (SDF do campo) e da bola até os gols, dividida por um
+      limite da velocidade de aproximação, dá o tempo mínimo até um possível contato.
+    - Pares que podem se tocar dentro de ADAPTIVE_MAX_DT passam pela colisão contínua
+      (ContinuousCollisionDetector e FieldSDF.cast): o passo termina no tempo de impacto previsto.
+
+    Com todos os corpos longe e lentos o passo chega a ADAPTIVE_MAX_DT; perto de impactos e da
+    linha do gol cai até ADAPTIVE_MIN_DT. Impactos e gols viram PhysicsEvent no tempo exato do
+    cruzamento, e não no fim do passo em que foram detectados.
+
+    Com robôs encostados uns nos outros o passo seria ADAPTIVE_MIN_DT de qualquer forma: esses
+    passos são fixos, sem previsão (fixed_step), e novos impactos neles são os contatos resolvidos
+    pela física, com a precisão do passo fixo. Assim o jogo com muito contato custa o mesmo que o
+    passo fixo e só o jogo sem contato fica mais rápido.
+'''
+from simulator.collision.collision import *
+from ui.interface_config import *
+from dataclasses import dataclass
+import math
+import numpy as np
+
+
+@dataclass
+class PhysicsEvent:
+    '''
+        Evento localizado dentro de um passo adaptativo.
+    '''
+    time: float             # Tempo simulado do cronômetro no instante do evento (s)
+    kind: str               # "impact" ou "goal"
+    bodies: tuple           # Corpos envolvidos (ex: ("ball", "BLUE_0"), ("ball", "wall"), ("ball", "ALLY"))
+    position: np.ndarray    # Centro do primeiro corpo no instante do evento (cm)
+    speed: float            # Velocidade de aproximação na normal (impacto) ou da bola (gol), em cm/s
+
+
+def _quadratic_roots(a, b, c):
+    '''
+        Raízes reais de a*t² + b*t + c = 0 (também o caso linear).
+    '''
+    if abs(a) < 1e-12:
+        return [] if abs(b) < 1e-12 else [-c / b]
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return []
+    root = math.sqrt(discriminant)
+    return [(-b - root) / (2 * a), (-b + root) / (2 * a)]
+
+
+class AdaptiveTimestep:
+    '''
+        Escolhe o passo de tempo a partir do estado atual da física e localiza os eventos do passo.
+    '''
+    def __init__(self, physics, field, min_dt=ADAPTIVE_MIN_DT, max_dt=ADAPTIVE_MAX_DT,
+                 safety=ADAPTIVE_SAFETY, margin=ADAPTIVE_CONTACT_MARGIN):
+        '''
+            :param physics (Physics): Física da partida.
+
+            :param field (Field): Campo, com a SDF e as áreas dos gols.
+
+            :param min_dt (float): Menor passo (s), usado em contato e perto de impactos.
+
+            :param max_dt (float): Maior passo (s), com os corpos longe e lentos.
+
+            :param safety (float): Fração do tempo até um possível contato usada como passo.
+
+            :param margin (float): Folga (cm) abaixo da qual um par é tratado como em contato.
+        '''
+        self.physics = physics
+        self.field = field
+        self.min_dt = min_dt
+        self.max_dt = max_dt
+        self.safety = safety
+        self.margin = margin
+        self.ccd = physics.collision_manager.ccd
+
+        # Corpos na ordem do WorldState: raio do círculo envolvente e nome nos eventos
+        world = physics.world
+        self.collision_objects = [body.collision_object for body in world.bodies]
+        self.radii = np.array([obj.radius if isinstance(obj, CollisionCircle) else 0.5 * math.hypot(obj.width, obj.height)
+                               for obj in self.collision_objects])
+        self.names = ["ball"] + [f"{bot.team}_{k}" for team in (physics.allies, physics.enemies) for k, bot in enumerate(team)]
+        self.pairs = np.triu_indices(world.n_bodies, 1)
+
+        # Chave de par do CollisionManagerSAT (ids ordenados) -> índices dos corpos
+        self.pair_keys = {tuple(sorted((id(self.collision_objects[a]), id(self.collision_objects[b])))): (a, b)
+                          for a, b in zip(*(indices.tolist() for indices in self.pairs))}
+
+        # Gol do time que marca: a bola dentro da área do gol adversário (mesmo critério do Arbitrator)
+        self.goals = [("ALLY", field.goal_area_enemy), ("ENEMY", field.goal_area_ally)]
+        # Caixa alinhada aos eixos de cada área, para descartar a bola longe do gol sem o teste exato
+        self.goal_boxes = [(*(area.get_corners_array().min(axis=0) - 1e-6).tolist(),
+                            *(area.get_corners_array().max(axis=0) + 1e-6).tolist()) for _, area in self.goals]
+
+        self.touching = set()       # Pares (i, j) ou (i, "wall") em contato, que não geram novo impacto
+        self.predicted = []         # Impactos previstos no passo: (tempo, i, j, velocidade)
+        self.start_positions = None # Posições e velocidades no início do passo (movimento dos impactos)
+        self.start_velocities = None
+        self.last_dt = min_dt
+        self.fixed_step = False     # Último passo foi fixo (par em contato), sem previsão de impactos
+        self.wall_sample = None     # (x, y, distância) da última consulta à SDF no centro da bola
+
+    # =============================|ESCOLHA DO PASSO|============================
+    def _speed_bounds(self):
+        '''
+            Limite da velocidade de cada corpo ao longo de um passo máximo: linear, giro dos
+            cantos do círculo envolvente e o que a aceleração das rodas e forças pode somar.
+        '''
+        world = self.physics.world
+        awake = world.sleeping == 0
+        acceleration = (np.abs(world.wheel_speeds.sum(axis=1)) / 2 +
+                        np.hypot(world.forces[:, 0], world.forces[:, 1]) / world.masses)
+        speeds = (np.hypot(world.velocities[:, 0], world.velocities[:, 1]) +
+                  np.abs(world.angular_velocities) * self.radii + acceleration * self.max_dt)
+        return np.where(awake, speeds, 0.0), awake
+
+    def _wall_distances(self):
+        '''
+            Distância de cada corpo até as paredes pela SDF do campo: centro menos o raio para a
+            bola e o canto mais próximo para os robôs (o círculo envolvente de um robô encostado
+            de lado na parede a atravessaria mesmo sem contato).
+        '''
+        world = self.physics.world
+        corners = np.concatenate([obj.get_corners_array() for obj in self.collision_objects[1:]])
+        distance, _ = self.field.sdf.sample(np.concatenate((world.positions[:1], corners)))
+        return np.concatenate(([distance[0] - self.radii[0]], distance[1:].reshape(-1, 4).min(axis=1)))
+
+    def _goal_distance(self, point):
+        '''
+            Menor distância do ponto até as áreas dos gols (0 se estiver dentro).
+        '''
+        distance = math.inf
+        for _, area in self.goals:
+            local = self._to_local(area, point)
+            dx = max(abs(local[0]) - area.width / 2, 0.0)
+            dy = max(abs(local[1]) - area.height / 2, 0.0)
+            distance = min(distance, math.hypot(dx, dy))
+        return distance
+
+    @staticmethod
+    def _to_local(area, vector, translate=True):
+        '''
+            Vetor no referencial do retângulo (centro e rotação da área).
+        '''
+        x, y = (vector[0] - area.x, vector[1] - area.y) if translate else (vector[0], vector[1])
+        radians = math.radians(area.angle)
+        cos, sin = math.cos(radians), math.sin(radians)
+        return (cos * x + sin * y, -sin * x + cos * y)
+
+    def next_dt(self):
+        '''
+            Passo para o estado atual. Também guarda os impactos previstos dentro dele.
+
+            :return: dt em [min_dt, max_dt].
+        '''
+        world = self.physics.world
+        positions, velocities = world.positions, world.velocities
+        self.start_positions, self.start_velocities = positions.copy(), velocities.copy()
+
+        # Robôs em contato: o passo é o mínimo de qualquer forma, então não há o que prever
+        sleeping = world.sleeping
+        self.fixed_step = any(b != "wall" and not (sleeping[a] and sleeping[b]) for a, b in self.touching)
+        if self.fixed_step:
+            self.predicted = []
+            self.last_dt = self.min_dt
+            return self.last_dt
+
+        speeds, awake = self._speed_bounds()
+        limit = self.max_dt
+        impacts = []
+
+        # Paredes: folga até a SDF do campo (centro menos o raio para a bola, cantos para os robôs)
+        moving = awake & (speeds > 0)
+        if moving.any():
+            wall_gaps = np.maximum(self._wall_distances() - self.margin, 0.0)
+            limit = min(limit, self.safety * float(np.min(wall_gaps[moving] / speeds[moving])))
+
+        # Bola: gols e varredura na SDF do campo (tempo de impacto com a parede)
+        ball_speed = float(np.hypot(velocities[0, 0], velocities[0, 1]))
+        if awake[0] and ball_speed > 0:
+            limit = min(limit, self.safety * self._goal_distance(positions[0]) / ball_speed)
+        if awake[0] and ball_speed > 0 and (0, "wall") not in self.touching:
+            ball = self.collision_objects[0]
+            hit, t, normal = self.field.sdf.cast(positions[0], velocities[0] * self.max_dt, ball.radius,
+                                                 self.ccd.max_iterations, self.ccd.tolerance)
+            if hit:
+                impacts.append((t * self.max_dt, 0, "wall", max(0.0, -float(velocities[0] @ normal))))
+
+        # Pares: folga entre os círculos envolventes e, nos que podem se tocar, colisão contínua
+        i, j = self.pairs
+        gaps = np.hypot(*(positions[i] - positions[j]).T) - self.radii[i] - self.radii[j]
+        closing = speeds[i] + speeds[j]
+        candidates = (awake[i] | awake[j]) & (gaps <= closing * self.max_dt + self.margin)
+
+        # Pares parados ou se afastando não passam pela colisão contínua: a aproximação dos centros
+        # mais o que giro e aceleração podem somar (a folga do limite de velocidade) não é positiva
+        offsets = positions[i] - positions[j]
+        distances = np.maximum(np.hypot(offsets[:, 0], offsets[:, 1]), 1e-9)
+        approach = -np.einsum("ij,ij->i", velocities[i] - velocities[j], offsets) / distances
+        linear = np.hypot(velocities[:, 0], velocities[:, 1])
+        slack = speeds - np.where(awake, linear, 0.0)
+        candidates &= approach + slack[i] + slack[j] > 0
+
+        for a, b in zip(i[candidates].tolist(), j[candidates].tolist()):
+            # Par já em contato: passo mínimo, sem varredura (o impacto já foi registrado)
+            if (a, b) in self.touching:
+                limit = self.min_dt
+                continue
+            hit, t, normal = self.ccd.check_continuous_collision(self.collision_objects[a], self.collision_objects[b], self.max_dt)
+            if hit:
+                speed = max(0.0, -float((velocities[a] - velocities[b]) @ normal))
+                impacts.append((t * self.max_dt, a, b, speed))
+
+        # O passo termina no primeiro impacto previsto (ou no passo mínimo, se já em contato)
+        if impacts:
+            limit = min(limit, min(impact[0] for impact in impacts))
+
+        self.predicted = impacts
+        self.last_dt = float(np.clip(limit, self.min_dt, self.max_dt))
+        return self.last_dt
+
+    # =============================|EVENTOS|============================
+    def localize_events(self, start_time, dt):
+        '''
+            Eventos do passo que acabou de ser integrado, no tempo exato do cruzamento. Deve ser
+            chamado depois de Physics.update e antes do árbitro (que reposiciona a bola no gol).
+
+            :param start_time (float): Tempo do cronômetro no início do passo (s).
+
+            :param dt (float): Passo integrado (s).
+
+            :return: Lista de PhysicsEvent em ordem de tempo.
+        '''
+        world = self.physics.world
+        events = []
+        ball_gap, wall_normal = self._ball_wall_gap()
+        if self.fixed_step:
+            self._contact_impacts(start_time, dt, ball_gap, wall_normal)
+
+        # Impactos previstos dentro do passo, só na primeira vez que o par se toca
+        for time, a, b, speed in self.predicted:
+            key = (a, b)
+            if time > dt + 1e-12 or key in self.touching:
+                continue
+            self.touching.add(key)
+            position = self.start_positions[a] + self.start_velocities[a] * time
+            name = "wall" if b == "wall" else self.names[b]
+            events.append(PhysicsEvent(float(start_time + time), "impact", (self.names[a], name), position, speed))
+
+        # Pares que se afastaram voltam a gerar impacto
+        for key in list(self.touching):
+            a, b = key
+            if b == "wall":
+                gap = math.inf if ball_gap is None else ball_gap
+            else:
+                gap = float(np.hypot(*(world.positions[a] - world.positions[b]))) - self.radii[a] - self.radii[b]
+            if gap > self.margin:
+                self.touching.discard(key)
+
+        goal = self._localize_goal(start_time, dt)
+        if goal is not None:
+            events.append(goal)
+        return sorted(events, key=lambda event: event.time)
+
+    def _ball_wall_gap(self):
+        '''
+            Folga da bola até as paredes (SDF no centro menos o raio) e a normal da parede. A SDF
+            muda no máximo o quanto a bola anda, então enquanto a última consulta menos o
+            deslocamento desde ela passar da margem de contato, não consulta a SDF de novo.
+
+            :return: Tupla (folga, normal), ou (None, None) se a folga certamente passa da margem.
+        '''
+        x, y = self.physics.world.positions[0].tolist()
+        radius = self.radii[0]
+        if self.wall_sample is not None:
+            x0, y0, distance = self.wall_sample
+            if distance - math.hypot(x - x0, y - y0) - radius > self.margin:
+                return None, None
+        distance, normal = self.field.sdf.sample(self.physics.world.positions[:1])
+        self.wall_sample = (x, y, float(distance[0]))
+        return float(distance[0]) - radius, normal[0]
+
+    def _contact_impacts(self, start_time, dt, ball_gap, wall_normal):
+        '''
+            Impactos de um passo fixo: pares que a física resolveu neste passo e a bola encostando
+            na parede, no fim do passo (mesma precisão do passo fixo). Entram em self.predicted.
+
+            :param ball_gap (float): Folga da bola até as paredes no fim do passo (None se longe).
+
+            :param wall_normal (array): Normal da parede (para dentro do campo) no centro da bola.
+        '''
+        positions, velocities = self.start_positions, self.start_velocities
+        for key in self.physics.collision_manager.contact_points_cache:
+            pair = self.pair_keys.get(key)
+            if pair is None or pair in self.touching:
+                continue
+            a, b = pair
+            offset = positions[a] - positions[b]
+            distance = max(float(np.hypot(*offset)), 1e-9)
+            speed = max(0.0, -float((velocities[a] - velocities[b]) @ offset) / distance)
+            self.predicted.append((dt, a, b, speed))
+
+        if ball_gap is None or (0, "wall") in self.touching:
+            return
+        speed = -float(velocities[0] @ wall_normal)
+        if ball_gap <= self.margin and speed > 0:
+            self.predicted.append((dt, 0, "wall", speed))
+
+    def _localize_goal(self, start_time, dt):
+        '''
+            Se a bola terminou o passo dentro de uma área de gol, encontra o instante exato em que o
+            centro entrou nela. O movimento no passo é tomado com aceleração constante, ajustada às
+            posições inicial e final e à velocidade final: p(t) = p0 + v0*t + a*t²/2, exato para o
+            rolamento livre e para os integradores do passo.
+        '''
+        ball = self.physics.ball
+        x, y = ball.position.tolist()
+        for (side, area), (x_min, y_min, x_max, y_max) in zip(self.goals, self.goal_boxes):
+            if not (x_min <= x <= x_max and y_min <= y <= y_max) or not ball.is_inside_goal(area):
+                continue
+
+            p0, p1, v1 = ball.previous_pos, ball.position, ball.velocity
+            acceleration = 2 * (v1 * dt - (p1 - p0)) / (dt * dt)
+            v0 = v1 - acceleration * dt
+
+            # Referencial da área: cada eixo vira uma parábola u(t); candidatos são t = 0 e as
+            # raízes de u(t) = ±meia largura dentro do passo
+            u0 = self._to_local(area, p0)
+            w0 = self._to_local(area, v0, translate=False)
+            b0 = self._to_local(area, acceleration, translate=False)
+            halves = (area.width / 2, area.height / 2)
+            candidates = [0.0]
+            for axis in range(2):
+                for bound in (-halves[axis], halves[axis]):
+                    candidates += [t for t in _quadratic_roots(0.5 * b0[axis], w0[axis], u0[axis] - bound) if 0.0 <= t <= dt]
+
+            crossing = dt
+            for t in sorted(candidates):
+                inside = all(abs(u0[axis] + w0[axis] * t + 0.5 * b0[axis] * t * t) <= halves[axis] + 1e-9 for axis in range(2))
+                if inside:
+                    crossing = t
+                    break
+
+            position = p0 + v0 * crossing + 0.5 * acceleration * crossing * crossing
+            speed = float(np.hypot(*(v0 + acceleration * crossing)))
+            return PhysicsEvent(float(start_time + crossing), "goal", ("ball", side), position, speed)
+        return None
@@ -2,10 +2,10 @@ from __future__ import annotations  # Permite usar strings para tipagem tardia
 import numpy as np
 from typing import TYPE_CHECKING
 from ui.interface_config import *
+from simulator import kernels
+from simulator.objects.world_state import ScratchBuffers
 from collections import defaultdict
-from shapely.geometry import Polygon, LineString, Point
 import math
-import pygame 
 
 
 # Importações para tipagem tardia, evitando problemas de importação circular
@@ -419,12 +419,19 @@ class CollisionRectangle(CollisionObject):
     """
     def __init__(self, x, y, width, height, type_object, angle=0, reference = None):
         super().__init__(type_object)
-        self.x = x
-        self.y = y
+        # Pose guardada em atributos privados: os setters marcam a geometria em cache como suja
+        self._x = x
+        self._y = y
+        self._angle = angle
         self.width = width
         self.height = height
-        self.angle = angle
         self.corners = []
+
+        # Normais dos lados no referencial do retângulo: constantes, só precisam ser rotacionadas.
+        # Lados de comprimento nulo ficam com normal nula (o SAT as ignora)
+        self._local_normals = (
+            (0.0, 1.0 if width else 0.0), (-1.0 if height else 0.0, 0.0),
+            (0.0, -1.0 if width else 0.0), (1.0 if height else 0.0, 0.0))
         self.update_corners()
 
         
@@ -433,14 +440,84 @@ class CollisionRectangle(CollisionObject):
         #Pai dessa classe de colisão.
         self.reference = reference 
 
+    # Geometria em cache (cantos, normais dos lados e AABB), recalculada apenas quando x, y ou
+    # angle realmente mudam. Paredes fixas do campo calculam uma única vez.
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        if value != self._x:
+            self._x = value
+            self._dirty = True
+
+    @property
+    def y(self):
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        if value != self._y:
+            self._y = value
+            self._dirty = True
+
+    @property
+    def angle(self):
+        return self._angle
+
+    @angle.setter
+    def angle(self, value):
+        if value != self._angle:
+            self._angle = value
+            self._dirty = True
+
     def update_corners(self):
         """
-        Atualiza os cantos do retângulo com base na posição e rotação.
+        Recalcula a geometria em cache: cantos, normais dos lados e AABB.
         """
-        self.corners = self.get_corners()
-        '''for i, corner in enumerate(self.get_corners()):
-            print(f"Canto {i}: {corner}")
-        '''
+        half_width = self.width / 2
+        half_height = self.height / 2
+        radians = math.radians(self._angle)
+        cos, sin = math.cos(radians), math.sin(radians)
+
+        # Mesma ordem e rotação (anti-horária) de sempre, em torno do centro (x, y)
+        local = ((-half_width, -half_height), (half_width, -half_height), (half_width, half_height), (-half_width, half_height))
+        corners = np.array([[cos * lx - sin * ly + self._x, sin * lx + cos * ly + self._y] for lx, ly in local])
+
+        # Normal de cada lado (c[i] -> c[i+1]) girada de 90° no sentido anti-horário
+        normals = np.array([[cos * nx - sin * ny, sin * nx + cos * ny] for nx, ny in self._local_normals])
+
+        self._corners_array = corners
+        self._corner_list = list(corners)
+        self._normals = normals
+        self._aabb = (corners[:, 0].min(), corners[:, 1].min(), corners[:, 0].max(), corners[:, 1].max())
+        self.corners = self._corner_list
+        self._dirty = False
+
+    def get_corners_array(self):
+        """
+        Retorna os cantos em cache como array (4, 2). Não deve ser modificado.
+        """
+        if self._dirty:
+            self.update_corners()
+        return self._corners_array
+
+    def get_normals(self):
+        """
+        Retorna as normais unitárias dos 4 lados, array (4, 2), na ordem dos cantos.
+        """
+        if self._dirty:
+            self.update_corners()
+        return self._normals
+
+    def get_aabb(self):
+        """
+        Retorna a caixa alinhada aos eixos (min_x, min_y, max_x, max_y).
+        """
+        if self._dirty:
+            self.update_corners()
+        return self._aabb
 
     def get_edges(self):
         corners = self.get_corners()
@@ -458,32 +535,13 @@ class CollisionRectangle(CollisionObject):
         Calcula os cantos (vértices) do retângulo considerando sua posição, dimensão e rotação.
         
         Retorna:
-            Uma lista de vetores (np.array) representando os 4 cantos do retângulo no espaço global.
+            Uma lista de vetores (np.array) representando os 4 cantos do retângulo no espaço global
+            (inferior esquerdo, inferior direito, superior direito, superior esquerdo antes da rotação).
+            Vem do cache, recalculado só quando a pose muda; os vetores não devem ser modificados.
         """
-
-        # Calcula metade da largura e altura para facilitar o posicionamento em torno do centro (self.x, self.y)
-        half_width = self.width / 2
-        half_height = self.height / 2
-
-        # Define os 4 cantos do retângulo no sistema local (sem rotação e centralizado na origem)
-        corners = [
-            np.array([-half_width, -half_height]),  # canto inferior esquerdo
-            np.array([half_width, -half_height]),   # canto inferior direito
-            np.array([half_width, half_height]),    # canto superior direito
-            np.array([-half_width, half_height])    # canto superior esquerdo
-        ]
-
-        # Converte o ângulo de rotação de graus para radianos
-        radians = np.radians(self.angle)
-
-        # Cria a matriz de rotação 2D (sentido anti-horário)
-        rotation_matrix = np.array([
-            [np.cos(radians), -np.sin(radians)],
-            [np.sin(radians),  np.cos(radians)]
-        ])
-
-        # Aplica a rotação e depois a translação (para a posição global [self.x, self.y])
-        return [np.dot(rotation_matrix, corner) + np.array([self.x, self.y]) for corner in corners]
+        if self._dirty:
+            self.update_corners()
+        return list(self._corner_list)
     
     #Posso enviar os corners diretamente para o retângulo
     def set_corners(self, corners):
@@ -593,6 +651,11 @@ class CollisionRectangle(CollisionObject):
         4. Suporte a colisões em alta velocidade
         5. Correção de edge cases
         """
+        if kernels.ENABLED:
+            hit, mtv_x, mtv_y = kernels.circle_rectangle(circle.x, circle.y, circle.radius, self.x, self.y,
+                                                         self.width, self.height, self.angle)
+            return [True, np.array([mtv_x, mtv_y])] if hit else [False, None]
+
         # 1. Obter dados básicos do círculo
         cx, cy = circle.x, circle.y
         radius = circle.radius
@@ -719,24 +782,17 @@ class CollisionRectangle(CollisionObject):
             [True, mtv] se houver colisão,
             [False, None] caso contrário.
         """
+        if kernels.ENABLED:
+            hit, mtv_x, mtv_y = kernels.sat_rectangles(self.get_corners_array(), other.get_corners_array(),
+                                                       self.x, self.y, other.x, other.y, 1e-2)
+            return [True, np.array([mtv_x, mtv_y])] if hit else [False, None]
+
         corners1 = self.get_corners()         # Cantos do primeiro retângulo
         corners2 = other.get_corners()        # Cantos do segundo retângulo
-        axes = []
 
-        # Função auxiliar para calcular a normal de um lado do retângulo
-        def get_normals(corners):
-            normals = []
-            for i in range(len(corners)):
-                edge = corners[(i + 1) % len(corners)] - corners[i]  # Vetor do lado
-                if np.linalg.norm(edge) == 0:
-                    continue  # Evita divisões por zero (casos degenerados)
-                normal = np.array([-edge[1], edge[0]])               # Normal perpendicular
-                normals.append(normal / np.linalg.norm(normal))      # Normaliza
-            return normals
-
-        # Adiciona todas as normais (eixos candidatos) dos dois retângulos
-        axes.extend(get_normals(corners1))
-        axes.extend(get_normals(corners2))
+        # Normais em cache (eixos candidatos) dos dois retângulos, ignorando lados degenerados
+        axes = [normal for normal in self.get_normals() if normal.any()]
+        axes.extend(normal for normal in other.get_normals() if normal.any())
 
         # MTV tracking
         min_overlap = float('inf')
@@ -1039,12 +1095,649 @@ class CollisionGroup(CollisionObject):
         self.aabb_corners = self._generate_aabb()
 
 
+### Fase estreita em lote (NumPy)
+def batch_rectangle_corners(centers, sizes, angles):
+    """
+    Calcula os cantos de N retângulos rotacionados de uma vez, na mesma ordem de CollisionRectangle.get_corners().
+
+    :param centers: Array (N, 2) com os centros.
+    :param sizes: Array (N, 2) com [largura, altura].
+    :param angles: Array (N,) com os ângulos em graus.
+    :return: Array (N, 4, 2) com os cantos.
+    """
+    half = np.asarray(sizes, dtype=float) / 2
+    local = np.stack([
+        np.stack([-half[:, 0], -half[:, 1]], axis=-1),
+        np.stack([ half[:, 0], -half[:, 1]], axis=-1),
+        np.stack([ half[:, 0],  half[:, 1]], axis=-1),
+        np.stack([-half[:, 0],  half[:, 1]], axis=-1),
+    ], axis=1)
+
+    radians = np.radians(angles)
+    cos, sin = np.cos(radians)[:, None], np.sin(radians)[:, None]
+    rotated = np.stack([
+        cos * local[..., 0] - sin * local[..., 1],
+        sin * local[..., 0] + cos * local[..., 1],
+    ], axis=-1)
+    return rotated + np.asarray(centers, dtype=float)[:, None, :]
+
+
+def batch_sat_rectangles(corners1, corners2, centers1, centers2, min_overlap_mtv=1e-2):
+    """
+    SAT para M pares de retângulos em uma única passada: eixos, projeções, sobreposições e MTVs.
+    Equivale a chamar CollisionRectangle.check_collision_with_rectangle para cada par.
+
+    :param corners1, corners2: Arrays (M, 4, 2) com os cantos dos retângulos de cada par.
+    :param centers1, centers2: Arrays (M, 2) com os centros.
+    :param min_overlap_mtv: Abaixo dessa sobreposição, usa os cantos mais próximos como direção do MTV.
+    :return: (hit, mtv) com hit (M,) booleano e mtv (M, 2), do segundo para o primeiro retângulo.
+    """
+    m = np.arange(len(corners1))
+
+    # Normais dos 4 lados de cada retângulo: 8 eixos candidatos por par
+    edges = np.concatenate([
+        np.roll(corners1, -1, axis=1) - corners1,
+        np.roll(corners2, -1, axis=1) - corners2,
+    ], axis=1)
+    normals = np.stack([-edges[..., 1], edges[..., 0]], axis=-1)
+    lengths = np.linalg.norm(normals, axis=-1)
+    valid = lengths > 0
+    normals = normals / np.where(valid, lengths, 1.0)[..., None]
+
+    # Projeções (M, 8, 4) e intervalos em cada eixo
+    proj1 = np.einsum('mkd,mcd->mkc', normals, corners1)
+    proj2 = np.einsum('mkd,mcd->mkc', normals, corners2)
+    min1, max1 = proj1.min(axis=2), proj1.max(axis=2)
+    min2, max2 = proj2.min(axis=2), proj2.max(axis=2)
+
+    separated = ((max1 < min2) | (max2 < min1)) & valid
+    hit = ~separated.any(axis=1)
+
+    # Eixo de menor sobreposição
+    overlap = np.minimum(max1, max2) - np.maximum(min1, min2)
+    overlap[~valid] = np.inf
+    best = np.argmin(overlap, axis=1)
+    min_overlap = overlap[m, best]
+    axis = normals[m, best]
+
+    # MTV aponta do segundo para o primeiro
+    direction = np.asarray(centers1, dtype=float) - np.asarray(centers2, dtype=float)
+    axis[np.einsum('md,md->m', direction, axis) < 0] *= -1
+
+    # Sobreposição muito pequena: usa o vetor entre os cantos mais próximos
+    small = hit & (min_overlap < min_overlap_mtv)
+    if small.any():
+        s = np.nonzero(small)[0]
+        diff = corners2[s, None, :, :] - corners1[s, :, None, :]          # (S, 4, 4, 2)
+        closest = np.argmin(np.linalg.norm(diff, axis=-1).reshape(len(s), 16), axis=1)
+        alt_axis = diff.reshape(len(s), 16, 2)[np.arange(len(s)), closest]
+        alt_norm = np.linalg.norm(alt_axis, axis=1)
+        ok = alt_norm != 0
+        axis[s[ok]] = alt_axis[ok] / alt_norm[ok, None]
+        min_overlap[s[ok]] = min_overlap_mtv
+
+    mtv = axis * min_overlap[:, None]
+    mtv[~hit] = 0.0
+    return hit, mtv
+
+
+### Pontos de contato analíticos (sem shapely)
+# Rotinas com poucos vértices: contas escalares em floats do Python, mais rápidas que NumPy nesse tamanho.
+def closest_point_on_polygon_boundary(corners, point):
+    """
+    Ponto do contorno de um polígono (ex: retângulo orientado) mais próximo de um ponto, como o
+    centro da bola. Vale também para pontos dentro do polígono.
+
+    :param corners: Vértices em ordem, (K, 2).
+    :param point: Ponto [x, y].
+    :return: Ponto [x, y] no contorno.
+    """
+    vertices = np.asarray(corners, dtype=float).tolist()
+    px, py = float(point[0]), float(point[1])
+    best, best_distance = None, math.inf
+    for i in range(len(vertices)):
+        ax, ay = vertices[i]
+        bx, by = vertices[(i + 1) % len(vertices)]
+        ex, ey = bx - ax, by - ay
+        t = ((px - ax) * ex + (py - ay) * ey) / (ex * ex + ey * ey)
+        t = min(max(t, 0.0), 1.0)
+        qx, qy = ax + t * ex, ay + t * ey
+        distance = (qx - px) ** 2 + (qy - py) ** 2
+        if distance < best_distance:
+            best, best_distance = (qx, qy), distance
+    return np.array(best)
+
+
+def _outward_normals(vertices):
+    """ Normais externas unitárias dos lados de um polígono convexo (vértices em sentido anti-horário). """
+    normals = []
+    for i in range(len(vertices)):
+        ax, ay = vertices[i]
+        bx, by = vertices[(i + 1) % len(vertices)]
+        length = math.hypot(bx - ax, by - ay)
+        normals.append(((by - ay) / length, -(bx - ax) / length))
+    return normals
+
+
+def box_box_contact_manifold(corners1, corners2, normal, tolerance=0.05):
+    """
+    Manifold de contato entre dois retângulos orientados por recorte de arestas (face de
+    referência x face incidente).
+
+    :param corners1, corners2: Cantos (4, 2) em sentido anti-horário.
+    :param normal: Direção da colisão, do segundo para o primeiro retângulo (ex: o MTV).
+    :param tolerance: Pontos até essa distância do mais profundo também entram no manifold (cm).
+    :return: Array (1 ou 2, 2) com os pontos de contato.
+    """
+    vertices1 = np.asarray(corners1, dtype=float).tolist()
+    vertices2 = np.asarray(corners2, dtype=float).tolist()
+    nx, ny = float(normal[0]), float(normal[1])
+    length = math.hypot(nx, ny)
+    nx, ny = nx / length, ny / length
+    normals1 = _outward_normals(vertices1)
+    normals2 = _outward_normals(vertices2)
+
+    # Face de cada retângulo voltada para o outro; a mais alinhada com a normal é a referência
+    align1 = [-(ax * nx + ay * ny) for ax, ay in normals1]
+    align2 = [ax * nx + ay * ny for ax, ay in normals2]
+    face1 = align1.index(max(align1))
+    face2 = align2.index(max(align2))
+    if align1[face1] >= align2[face2] - 1e-6:
+        reference, ref_normals, incident, inc_normals, ref_face = vertices1, normals1, vertices2, normals2, face1
+    else:
+        reference, ref_normals, incident, inc_normals, ref_face = vertices2, normals2, vertices1, normals1, face2
+
+    rnx, rny = ref_normals[ref_face]
+    v1 = reference[ref_face]
+    v2 = reference[(ref_face + 1) % 4]
+
+    # Face incidente: a mais oposta à normal de referência
+    opposition = [ax * rnx + ay * rny for ax, ay in inc_normals]
+    inc_face = opposition.index(min(opposition))
+    points = [incident[inc_face], incident[(inc_face + 1) % 4]]
+
+    # Recorta a aresta incidente pelos planos laterais da face de referência
+    tx, ty = v2[0] - v1[0], v2[1] - v1[1]
+    length = math.hypot(tx, ty)
+    tx, ty = tx / length, ty / length
+    for sx, sy, offset in ((-tx, -ty, -(tx * v1[0] + ty * v1[1])), (tx, ty, tx * v2[0] + ty * v2[1])):
+        d0 = points[0][0] * sx + points[0][1] * sy - offset
+        d1 = points[1][0] * sx + points[1][1] * sy - offset
+        if d0 > 0 and d1 > 0:
+            break
+        if d0 * d1 < 0:
+            t = d0 / (d0 - d1)
+            crossing = [points[0][0] + (points[1][0] - points[0][0]) * t, points[0][1] + (points[1][1] - points[0][1]) * t]
+            points = [crossing, points[1]] if d0 > 0 else [points[0], crossing]
+
+    # Mantém os pontos mais profundos em relação à face de referência
+    separation = [(px - v1[0]) * rnx + (py - v1[1]) * rny for px, py in points]
+    deepest = min(separation)
+    return np.array([p for p, s in zip(points, separation) if s <= deepest + tolerance])
+
+
+def convex_polygon_distance(polygon1, polygon2):
+    """
+    Distância entre dois polígonos convexos disjuntos: o menor valor entre cada vértice de um
+    e as arestas do outro. Polígonos sobrepostos retornam a menor distância entre as fronteiras.
+
+    :param polygon1: Vértices [(x, y), ...] do primeiro polígono.
+    :param polygon2: Vértices [(x, y), ...] do segundo polígono.
+    :return: (distância, normal (nx, ny) unitária de polygon2 para polygon1).
+    """
+    best, normal = float('inf'), (0.0, 0.0)
+    for vertices, edges, sign in ((polygon1, polygon2, 1.0), (polygon2, polygon1, -1.0)):
+        n = len(edges)
+        for px, py in vertices:
+            for i in range(n):
+                ax, ay = edges[i]
+                bx, by = edges[(i + 1) % n]
+                ex, ey = bx - ax, by - ay
+                length2 = ex * ex + ey * ey
+                t = ((px - ax) * ex + (py - ay) * ey) / length2 if length2 > 0 else 0.0
+                t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+                dx, dy = px - (ax + t * ex), py - (ay + t * ey)
+                distance2 = dx * dx + dy * dy
+                if distance2 < best:
+                    best, normal = distance2, (sign * dx, sign * dy)
+
+    distance = math.sqrt(best)
+    if distance > 0:
+        normal = (normal[0] / distance, normal[1] / distance)
+    return distance, normal
+
+
+### Fase ampla: sweep and prune
+def collision_bounds(collision_obj):
+    """
+    Retorna a caixa alinhada aos eixos (min_x, min_y, max_x, max_y) de um objeto de colisão simples.
+    Objetos desconhecidos são tratados como um ponto em (x, y).
+    """
+    if isinstance(collision_obj, CollisionLine):
+        return (min(collision_obj.start[0], collision_obj.end[0]), min(collision_obj.start[1], collision_obj.end[1]),
+                max(collision_obj.start[0], collision_obj.end[0]), max(collision_obj.start[1], collision_obj.end[1]))
+    if isinstance(collision_obj, CollisionRectangle):
+        return collision_obj.get_aabb()
+    if isinstance(collision_obj, CollisionCircle):
+        return (collision_obj.x - collision_obj.radius, collision_obj.y - collision_obj.radius,
+                collision_obj.x + collision_obj.radius, collision_obj.y + collision_obj.radius)
+    return (collision_obj.x, collision_obj.y, collision_obj.x, collision_obj.y)
+
+
+def _flatten_collision_objects(objects):
+    """ Expande os CollisionGroup recursivamente, retornando apenas objetos simples. """
+    for obj in objects:
+        if isinstance(obj, CollisionGroup):
+            yield from _flatten_collision_objects(obj.objects)
+        else:
+            yield obj
+
+
+class SweepAndPrune:
+    """
+    Fase ampla por sweep and prune no eixo x.
+
+    Mantém uma lista de extremos [x, é_máximo, id] ordenada entre os passos. Como os corpos andam
+    pouco a cada passo, a lista já chega quase ordenada e a ordenação por inserção custa perto de O(n).
+    Em seguida, uma varredura única gera os vizinhos de cada objeto móvel, sem repetições.
+    """
+    def __init__(self, margin=SAP_MARGIN):
+        """
+        :param margin (float): Folga (cm) somada às caixas dos objetos móveis.
+        """
+        self.margin = margin
+        self.objects = {}           # id -> objeto de colisão
+        self.bounds = {}            # id -> [min_x, min_y, max_x, max_y]
+        self.endpoints = []         # Extremos no eixo x: [valor, 0 (mínimo) ou 1 (máximo), id]
+        self.object_endpoints = {}  # id -> (extremo mínimo, extremo máximo)
+        self.static_ids = set()
+        self.neighbors = {}         # id -> lista de vizinhos do último passo
+
+    def clear(self):
+        """ Remove todos os objetos, inclusive os estáticos. """
+        self.objects.clear()
+        self.bounds.clear()
+        self.endpoints.clear()
+        self.object_endpoints.clear()
+        self.static_ids.clear()
+        self.neighbors.clear()
+
+    def add_static(self, collision_obj):
+        """
+        Adiciona um objeto fixo (ou um grupo), cuja caixa é calculada uma única vez.
+        """
+        for obj in _flatten_collision_objects([collision_obj]):
+            if id(obj) not in self.objects:
+                self._insert(obj, collision_bounds(obj))
+                self.static_ids.add(id(obj))
+
+    def _insert(self, obj, box):
+        key = id(obj)
+        self.objects[key] = obj
+        self.bounds[key] = list(box)
+        low, high = [box[0], 0, key], [box[2], 1, key]
+        self.endpoints += [low, high]
+        self.object_endpoints[key] = (low, high)
+
+    def _remove(self, keys):
+        for key in keys:
+            del self.objects[key], self.bounds[key], self.object_endpoints[key]
+            self.neighbors.pop(key, None)
+        self.endpoints = [endpoint for endpoint in self.endpoints if endpoint[2] not in keys]
+
+    def update(self, objects, dt=0.0):
+        """
+        Atualiza as caixas dos objetos móveis, reordena os extremos e refaz a lista de vizinhos.
+
+        :param objects (list): Objetos de colisão móveis (grupos são expandidos).
+
+        :param dt (float): Passo de tempo. As caixas são estendidas pelo deslocamento |v| * dt,
+            para que a colisão contínua da bola encontre os vizinhos antes do contato.
+        """
+        seen = set()
+        for obj in _flatten_collision_objects(objects):
+            key = id(obj)
+            seen.add(key)
+
+            min_x, min_y, max_x, max_y = collision_bounds(obj)
+            pad_x = pad_y = self.margin
+            reference = getattr(obj, "reference", None)
+            velocity = getattr(reference, "velocity", None)
+            if velocity is not None and dt > 0:
+                pad_x += abs(velocity[0]) * dt
+                pad_y += abs(velocity[1]) * dt
+            box = (min_x - pad_x, min_y - pad_y, max_x + pad_x, max_y + pad_y)
+
+            if key not in self.objects:
+                self._insert(obj, box)
+            else:
+                self.bounds[key][:] = box
+                low, high = self.object_endpoints[key]
+                low[0], high[0] = box[0], box[2]
+
+        stale = {key for key in self.objects if key not in seen and key not in self.static_ids}
+        if stale:
+            self._remove(stale)
+
+        self._sort_endpoints()
+        self._sweep(seen)
+
+    def _sort_endpoints(self):
+        """ Ordenação por inserção (estável), eficiente para listas quase ordenadas. """
+        endpoints = self.endpoints
+        for i in range(1, len(endpoints)):
+            current = endpoints[i]
+            value, kind = current[0], current[1]
+            j = i - 1
+            while j >= 0 and (endpoints[j][0] > value or (endpoints[j][0] == value and endpoints[j][1] > kind)):
+                endpoints[j + 1] = endpoints[j]
+                j -= 1
+            endpoints[j + 1] = current
+
+    def _sweep(self, moving_ids):
+        """ Varre os extremos em x e testa a sobreposição em y dos intervalos ativos. """
+        bounds, objects, static_ids = self.bounds, self.objects, self.static_ids
+        neighbors = {key: [] for key in moving_ids}
+        active = []
+
+        for _, is_max, key in self.endpoints:
+            if is_max:
+                active.remove(key)
+                continue
+
+            box = bounds[key]
+            is_static = key in static_ids
+            for other in active:
+                other_static = other in static_ids
+                if is_static and other_static:
+                    continue
+                other_box = bounds[other]
+                if box[1] <= other_box[3] and other_box[1] <= box[3]:
+                    if not is_static:
+                        neighbors[key].append(objects[other])
+                    if not other_static:
+                        neighbors[other].append(objects[key])
+            active.append(key)
+
+        self.neighbors = neighbors
+
+    def get_neighbors(self, collision_obj):
+        """ Retorna os vizinhos do objeto encontrados na última atualização. """
+        return self.neighbors.get(id(collision_obj), [])
+
+
 ## Classe principal para controle das colisões
+### Resolução de contatos: impulsos sequenciais com warm starting
+class ContactManifold:
+    """
+    Contato entre dois corpos em um passo: normal, penetração, pontos do manifold e os impulsos
+    acumulados em cada ponto (que viram o warm starting do passo seguinte).
+    """
+    def __init__(self, body1, body2, key, normal, depth, points, restitution, friction):
+        """
+        :param body1 (object): Corpo móvel (bola ou robô).
+        :param body2 (object): Outro corpo móvel, ou None para estruturas fixas (massa infinita).
+        :param key (tuple): Chave do par (ver CollisionManagerSAT._get_pair_key).
+        :param normal (tuple): Normal unitária (nx, ny), do segundo corpo para o primeiro.
+        :param depth (float): Penetração ao longo da normal (cm).
+        :param points (array): Pontos de contato (K, 2) em cm.
+        :param restitution (float): Coeficiente de restituição do par.
+        :param friction (float): Coeficiente de atrito do par.
+        """
+        self.body1 = body1
+        self.body2 = body2
+        self.key = key
+        self.normal = normal
+        self.depth = depth
+        self.points = np.asarray(points, dtype=float).reshape(-1, 2)
+        self.restitution = restitution
+        self.friction = friction
+
+        # Por ponto: impulsos acumulados e termos pré-calculados em ContactSolver._prepare
+        count = len(self.points)
+        self.normal_impulses = [0.0] * count
+        self.tangent_impulses = [0.0] * count
+        self.arms = [None] * count                 # (r1x, r1y, r2x, r2y)
+        self.normal_masses = [0.0] * count
+        self.tangent_masses = [0.0] * count
+        self.target_velocities = [0.0] * count     # Velocidade normal de saída (restituição)
+
+
+class ContactSolver:
+    """
+    Resolve todos os contatos do passo juntos, por impulsos sequenciais (Gauss-Seidel projetado):
+    as velocidades são corrigidas contato a contato por algumas iterações, com impulsos acumulados
+    limitados (normal >= 0 e atrito no cone de Coulomb). Os impulsos do passo anterior são
+    reaplicados no início (warm starting), então pilhas de robôs convergem em poucas iterações
+    mesmo com passos de tempo grandes. A penetração é corrigida depois, em posição, pela fração
+    SOLVER_BAUMGARTE do que passa de SOLVER_SLOP.
+    """
+    def __init__(self, velocity_iterations=SOLVER_VELOCITY_ITERATIONS, position_iterations=SOLVER_POSITION_ITERATIONS,
+                 warm_start=SOLVER_WARM_START):
+        """
+        :param velocity_iterations (int): Iterações de velocidade por passo.
+        :param position_iterations (int): Iterações da correção de penetração por passo.
+        :param warm_start (float): Fração dos impulsos do passo anterior reaplicada (0 desliga).
+        """
+        self.velocity_iterations = int(velocity_iterations)
+        self.position_iterations = int(position_iterations)
+        self.warm_start = float(warm_start)
+
+        # Chave do par -> (normal, pontos, impulsos normais, impulsos tangentes) do último passo
+        self.impulse_cache = {}
+
+    def solve(self, manifolds):
+        """
+        Resolve os contatos e escreve velocidades e posições de volta nos corpos.
+        :param manifolds (list): ContactManifold do passo.
+        """
+        if not manifolds:
+            self.impulse_cache = {}
+            return
+
+        bodies = self._gather_bodies(manifolds)
+        self._prepare(manifolds, bodies)
+        if self.warm_start > 0:
+            self._warm_start(manifolds, bodies)
+
+        for _ in range(self.velocity_iterations):
+            for manifold in manifolds:
+                self._solve_velocity(manifold, bodies)
+
+        self.impulse_cache = {m.key: (m.normal, m.points, tuple(m.normal_impulses), tuple(m.tangent_impulses))
+                              for m in manifolds}
+        self._correct_positions(manifolds, bodies)
+        self._write_back(bodies)
+
+    # =============================|Estado do warm starting|============================
+    def get_state(self):
+        """
+        Cópia dos impulsos guardados para o warm starting, que fazem parte do estado da simulação.
+        :return: Dicionário chave do par -> (normal, pontos, impulsos normais, impulsos tangentes).
+        """
+        return {key: (normal, points.copy(), normal_impulses, tangent_impulses)
+                for key, (normal, points, normal_impulses, tangent_impulses) in self.impulse_cache.items()}
+
+    def set_state(self, state):
+        """
+        Restaura os impulsos de um get_state(). O mesmo estado pode ser restaurado várias vezes.
+        """
+        self.impulse_cache = {key: (normal, points.copy(), normal_impulses, tangent_impulses)
+                              for key, (normal, points, normal_impulses, tangent_impulses) in state.items()}
+
+    def reset(self):
+        """
+        Descarta os impulsos do passo anterior (ex: após reposicionar os corpos).
+        """
+        self.impulse_cache = {}
+
+    # =============================|Estado dos corpos|============================
+    @staticmethod
+    def _gather_bodies(manifolds):
+        """
+        Estado de trabalho de cada corpo em floats do Python: [vx, vy, w, 1/m, 1/I, cx, cy, dx, dy, corpo].
+        Estruturas fixas ficam com massa e inércia infinitas (chave None). A rotação da bola é de
+        rolamento (não gira no plano), então ela entra sem inércia rotacional.
+        """
+        bodies = {None: [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, None]}
+        for manifold in manifolds:
+            for body in (manifold.body1, manifold.body2):
+                if body is None or id(body) in bodies:
+                    continue
+                rotates = body.type_object != BALL_OBJECT
+                bodies[id(body)] = [
+                    float(body.velocity[0]), float(body.velocity[1]),
+                    float(body.angular_velocity) if rotates else 0.0,
+                    1.0 / body.mass, 1.0 / body.inertia if rotates else 0.0,
+                    float(body.position[0]), float(body.position[1]), 0.0, 0.0, body]
+        return bodies
+
+    @staticmethod
+    def _state(bodies, body):
+        return bodies[None] if body is None else bodies[id(body)]
+
+    @staticmethod
+    def _apply(state1, state2, px, py, arms):
+        """ Aplica o impulso (px, py) no ponto de contato: +P no primeiro corpo e -P no segundo. """
+        r1x, r1y, r2x, r2y = arms
+        state1[0] += px * state1[3]
+        state1[1] += py * state1[3]
+        state1[2] += (r1x * py - r1y * px) * state1[4]
+        state2[0] -= px * state2[3]
+        state2[1] -= py * state2[3]
+        state2[2] -= (r2x * py - r2y * px) * state2[4]
+
+    @staticmethod
+    def _relative_velocity(state1, state2, arms):
+        """ Velocidade do primeiro corpo em relação ao segundo no ponto de contato (v + w x r). """
+        r1x, r1y, r2x, r2y = arms
+        return (state1[0] - state1[2] * r1y - state2[0] + state2[2] * r2y,
+                state1[1] + state1[2] * r1x - state2[1] - state2[2] * r2x)
+
+    # =============================|Iterações|============================
+    def _prepare(self, manifolds, bodies):
+        """
+        Braços, massas efetivas (normal e tangente) e velocidade alvo de cada ponto de contato.
+        """
+        for manifold in manifolds:
+            state1, state2 = self._state(bodies, manifold.body1), self._state(bodies, manifold.body2)
+            nx, ny = manifold.normal
+            tx, ty = -ny, nx
+            for i, (px, py) in enumerate(manifold.points.tolist()):
+                arms = (px - state1[5], py - state1[6], px - state2[5], py - state2[6]) if manifold.body2 is not None \
+                    else (px - state1[5], py - state1[6], 0.0, 0.0)
+                r1x, r1y, r2x, r2y = arms
+                inverse_masses = state1[3] + state2[3]
+                rn1, rn2 = r1x * ny - r1y * nx, r2x * ny - r2y * nx
+                rt1, rt2 = r1x * ty - r1y * tx, r2x * ty - r2y * tx
+                normal_mass = inverse_masses + rn1 * rn1 * state1[4] + rn2 * rn2 * state2[4]
+                tangent_mass = inverse_masses + rt1 * rt1 * state1[4] + rt2 * rt2 * state2[4]
+
+                manifold.arms[i] = arms
+                manifold.normal_masses[i] = 1.0 / normal_mass if normal_mass > 0 else 0.0
+                manifold.tangent_masses[i] = 1.0 / tangent_mass if tangent_mass > 0 else 0.0
+
+                # Quique apenas para aproximações acima do limiar (contatos em repouso não vibram)
+                vx, vy = self._relative_velocity(state1, state2, arms)
+                approach = vx * nx + vy * ny
+                manifold.target_velocities[i] = -manifold.restitution * approach if approach < -SOLVER_RESTITUTION_THRESHOLD else 0.0
+
+    def _warm_start(self, manifolds, bodies):
+        """
+        Reaplica os impulsos do passo anterior nos pontos que continuam no mesmo lugar
+        (mesmo par, normal parecida e ponto a menos de SOLVER_WARM_START_DISTANCE).
+        """
+        for manifold in manifolds:
+            cached = self.impulse_cache.get(manifold.key)
+            if cached is None:
+                continue
+            old_normal, old_points, old_normal_impulses, old_tangent_impulses = cached
+            nx, ny = manifold.normal
+            if old_normal[0] * nx + old_normal[1] * ny < 0.95:
+                continue
+
+            state1, state2 = self._state(bodies, manifold.body1), self._state(bodies, manifold.body2)
+            for i, point in enumerate(manifold.points):
+                distances = np.hypot(*(old_points - point).T)
+                nearest = int(np.argmin(distances))
+                if distances[nearest] > SOLVER_WARM_START_DISTANCE:
+                    continue
+                jn = old_normal_impulses[nearest] * self.warm_start
+                jt = old_tangent_impulses[nearest] * self.warm_start
+                manifold.normal_impulses[i], manifold.tangent_impulses[i] = jn, jt
+                self._apply(state1, state2, jn * nx - jt * ny, jn * ny + jt * nx, manifold.arms[i])
+
+    def _solve_velocity(self, manifold, bodies):
+        """
+        Uma iteração de um manifold: atrito (limitado pelo impulso normal acumulado) e depois o
+        impulso normal (acumulado nunca negativo), ponto a ponto.
+        """
+        state1, state2 = self._state(bodies, manifold.body1), self._state(bodies, manifold.body2)
+        nx, ny = manifold.normal
+        tx, ty = -ny, nx
+        for i, arms in enumerate(manifold.arms):
+            # Atrito
+            vx, vy = self._relative_velocity(state1, state2, arms)
+            limit = manifold.friction * manifold.normal_impulses[i]
+            old = manifold.tangent_impulses[i]
+            new = min(max(old - (vx * tx + vy * ty) * manifold.tangent_masses[i], -limit), limit)
+            manifold.tangent_impulses[i] = new
+            if new != old:
+                self._apply(state1, state2, (new - old) * tx, (new - old) * ty, arms)
+
+            # Normal
+            vx, vy = self._relative_velocity(state1, state2, arms)
+            old = manifold.normal_impulses[i]
+            new = max(old + (manifold.target_velocities[i] - (vx * nx + vy * ny)) * manifold.normal_masses[i], 0.0)
+            manifold.normal_impulses[i] = new
+            if new != old:
+                self._apply(state1, state2, (new - old) * nx, (new - old) * ny, arms)
+
+    def _correct_positions(self, manifolds, bodies):
+        """
+        Corrige a penetração de cada par, dividida pelo inverso das massas, descontando o que as
+        iterações anteriores já moveram os dois corpos ao longo da normal.
+        """
+        for _ in range(self.position_iterations):
+            for manifold in manifolds:
+                state1, state2 = self._state(bodies, manifold.body1), self._state(bodies, manifold.body2)
+                inverse_masses = state1[3] + state2[3]
+                if inverse_masses == 0:
+                    continue
+                nx, ny = manifold.normal
+                moved = (state1[7] - state2[7]) * nx + (state1[8] - state2[8]) * ny
+                correction = SOLVER_BAUMGARTE * (manifold.depth - moved - SOLVER_SLOP)
+                if correction <= 0:
+                    continue
+                correction /= inverse_masses
+                state1[7] += nx * correction * state1[3]
+                state1[8] += ny * correction * state1[3]
+                state2[7] -= nx * correction * state2[3]
+                state2[8] -= ny * correction * state2[3]
+
+    @staticmethod
+    def _write_back(bodies):
+        """ Escreve velocidades (limitadas) e posições corrigidas nos corpos. """
+        for key, (vx, vy, w, _, inverse_inertia, _, _, dx, dy, body) in bodies.items():
+            if key is None:
+                continue
+            speed = math.hypot(vx, vy)
+            if speed > SOLVER_MAX_VELOCITY:
+                vx, vy = vx * SOLVER_MAX_VELOCITY / speed, vy * SOLVER_MAX_VELOCITY / speed
+            body.velocity = (vx, vy)
+            if inverse_inertia > 0:
+                body.angular_velocity = min(max(w, -SOLVER_MAX_ANGULAR_VELOCITY), SOLVER_MAX_ANGULAR_VELOCITY)
+            if dx or dy:
+                body.position = (body.position[0] + dx, body.position[1] + dy)
+
+
 class CollisionManagerSAT:
-    def __init__(self, cell_size=CELL_SIZE, screen=None, dt = float(0.0)):
+    def __init__(self, cell_size=CELL_SIZE, screen=None, dt = float(0.0), broadphase=BROADPHASE, contact_solver=CONTACT_SOLVER):
         """
         Gerenciador de colisões usando SAT com otimização por Spatial Hashing.
         :param cell_size: Tamanho de cada célula da grade para particionamento espacial.
+        :param broadphase: Fase ampla usada, "grid" ou "sap" (padrão em BROADPHASE).
+        :param contact_solver: Resolução dos contatos, "sequential" ou "pairwise" (padrão em CONTACT_SOLVER).
         Otimizando o tratamento de colisões
 
         Em geral, divido o mapa em várias celular com um certo tamanho, e verifico as colisões dentro dessas celulas.
@@ -1052,6 +1745,26 @@ class CollisionManagerSAT:
         self.cell_size = cell_size
         self.grid = defaultdict(list)
 
+        # Grid estático: estruturas fixas (campo) inseridas uma única vez, fora da limpeza de cada passo
+        self.static_grid = defaultdict(list)
+        self.static_objects = {}
+
+        # Fase ampla: "grid" (spatial hashing) ou "sap" (sweep and prune incremental)
+        if broadphase not in ("grid", "sap"):
+            raise ValueError(f"Fase ampla desconhecida: {broadphase}")
+        self.broadphase = broadphase
+        self.sweep_and_prune = SweepAndPrune()
+
+        # Resolução: todos os contatos juntos (impulsos sequenciais) ou um par de cada vez, na ordem da detecção
+        if contact_solver not in ("sequential", "pairwise"):
+            raise ValueError(f"Resolvedor de contatos desconhecido: {contact_solver}")
+        self.contact_solver = ContactSolver() if contact_solver == "sequential" else None
+
+        # Paredes do campo testadas pela SDF (ver set_field_sdf); os colisores substituídos saem da fase ampla
+        self.field_sdf = None
+        self.field_posts = []
+        self.sdf_replaced = set()
+
         #Ter conhecimento do dt do código
         self.dt = float(dt)
 
@@ -1061,10 +1774,17 @@ class CollisionManagerSAT:
         #Cache para os pontos de contato
         self.contact_points_cache  = {}
         self.collision_pairs_cache = set()
+        self.contact_count = 0          # Colisões resolvidas no último passo
+
+        # Arrays de trabalho da resolução por par (sem temporários por contato)
+        self.scratch = ScratchBuffers()
+
+        # SAT em lote para os pares retângulo-retângulo (o SAT por par fica como alternativa)
+        self.batch_narrowphase = BATCH_NARROWPHASE
 
         # Adicionar o detector de colisão contínua
         self.ccd = ContinuousCollisionDetector()
-        self.ccd_threshold = 50.0 #Velocidade mínima para usar CDD (em)
+        self.ccd_threshold = CCD_MIN_SPEED #Velocidade mínima para usar CDD (cm/s)
 
 
     def detect_and_resolve(self, objects):
@@ -1075,17 +1795,30 @@ class CollisionManagerSAT:
         self.clear()
         self.collision_pairs_cache.clear()
 
-        #1. Verifica se são objetos de colisão apenas e passa todos para o grid
+        #1. Verifica se são objetos de colisão apenas e passa os móveis para a fase ampla.
+        #   As estruturas fixas entram na fase ampla apenas na primeira vez
+        moving = []
         for obj in objects:
-            if hasattr(obj, "reference"):
+            if not hasattr(obj, "reference"):
+                continue
+            if obj.type_object == STRUCTURE_OBJECTS:
+                if id(obj) not in self.sdf_replaced:
+                    self.add_static_object(obj)
+            elif self.broadphase == "sap":
+                moving.append(obj)
+            else:
                 self.add_object(obj)
 
+        if self.broadphase == "sap":
+            self.sweep_and_prune.update(moving, self.dt)
+
 
         # Fase de detecção
         collisions = []
-        #2. Verifica colisões no grid
+        rectangle_pairs = []    # Índices em collisions dos pares retângulo-retângulo do SAT em lote
+        #2. Verifica colisões no grid. Corpos dormindo não procuram vizinhos (só são achados pelos acordados)
         for obj in objects:
-            if obj.type_object != MOVING_OBJECTS:
+            if obj.type_object != MOVING_OBJECTS or getattr(obj.reference, "is_sleeping", False):
                 continue 
                
             nearby = self._get_nearby_objects(obj)
@@ -1113,19 +1846,52 @@ class CollisionManagerSAT:
                     np.linalg.norm(other.reference.velocity) > self.ccd_threshold
                 ):
                     ccd_collision, t, normal = self.ccd.check_continuous_collision(obj, other, self.dt)
-                    if ccd_collision:
-                        mtv = normal * (1.0 - t) * np.linalg.norm(obj.reference.velocity) * self.dt
-                        collisions.append((obj, other, mtv))
+                    if ccd_collision and t > 0:
+                        # Contato previsto dentro do passo. Sobreposição atual (t = 0) fica com o teste discreto
+                        collisions.append((obj, other, self._ccd_mtv(normal)))
+                        continue
+
+                if self.batch_narrowphase and isinstance(obj, CollisionRectangle) and isinstance(other, CollisionRectangle):
+                    # Fica reservado na ordem original e é resolvido em lote abaixo
+                    rectangle_pairs.append(len(collisions))
+                    collisions.append((obj, other, None))
                 else:
                     has_collision, mtv = obj.check_collision(other)
                     if has_collision and np.linalg.norm(mtv) > 1e-6:
                         collisions.append((obj, other, mtv))
+                    elif isinstance(obj, CollisionRectangle) and isinstance(other, CollisionRectangle):
+                        mtv = self._robot_ccd_mtv(obj, other)
+                        if mtv is not None:
+                            collisions.append((obj, other, mtv))
+
+        if rectangle_pairs:
+            self._batch_rectangle_collisions(collisions, rectangle_pairs)
+            collisions = [collision for collision in collisions if collision[2] is not None]
+
+        # Paredes do campo pela SDF
+        if self.field_sdf is not None:
+            self._field_sdf_collisions(objects, collisions)
+
+        # Corpo dormindo tocado por um acordado volta à simulação
+        for _, other, _ in collisions:
+            if other is not None and getattr(other.reference, "is_sleeping", False):
+                other.reference.wake()
+        self.contact_count = len(collisions)
+
+        if self.contact_solver is not None:
+            self._solve_contacts(collisions)
+            return
 
         # Fase de resolução com pontos de contato
         for obj1, obj2, mtv in collisions:
+            # Parede da SDF: o mtv já aponta para dentro do campo
+            if obj2 is None:
+                self.resolve_collision_with_field(obj1, None, mtv)
+                continue
+
             #Apenas calcula, por enquanto, os pontos de contato para objetos que não são do campo
             if obj1.reference.type_object != FIELD_OBJECT and obj2.reference.type_object != FIELD_OBJECT:
-                contact_point = self.calculate_contact_point(obj1, obj2)
+                contact_point = self.calculate_contact_point(obj1, obj2, mtv)
             else:
                 contact_point = None 
                 
@@ -1138,6 +1904,226 @@ class CollisionManagerSAT:
             else:
                 self.resolve_moving_collision(obj1, obj2, mtv, contact_point)
 
+    def _solve_contacts(self, collisions):
+        """
+        Monta o manifold de cada colisão detectada e resolve todos juntos no ContactSolver.
+        Os pontos de contato do passo ficam em contact_points_cache, pela chave do par.
+        :param collisions: Lista (obj, other, mtv) da fase de detecção (other None para a SDF).
+        """
+        self.contact_points_cache.clear()
+        manifolds = []
+        for obj1, obj2, mtv in collisions:
+            manifold = self._contact_manifold(obj1, obj2, mtv)
+            if manifold is not None:
+                manifolds.append(manifold)
+                self.contact_points_cache[manifold.key] = manifold.points
+        self.contact_solver.solve(manifolds)
+
+    def _contact_manifold(self, obj1, obj2, mtv):
+        """
+        Normal, penetração, pontos de contato e coeficientes de uma colisão.
+        :param obj1: Objeto de colisão móvel.
+        :param obj2: Outro objeto de colisão, ou None para as paredes da SDF.
+        :param mtv: Vetor mínimo de translação do SAT / SDF.
+        :return: ContactManifold, ou None para colisões inválidas.
+        """
+        depth = math.hypot(mtv[0], mtv[1])
+        if depth < 1e-6:
+            return None
+        body1 = obj1.reference
+        static = obj2 is None or obj2.type_object == STRUCTURE_OBJECTS
+        body2 = None if static else obj2.reference
+        if body1.mass <= 0 or (body2 is not None and body2.mass <= 0):
+            return None
+
+        # Normal do segundo objeto para o primeiro (a SDF já aponta para dentro do campo)
+        nx, ny = mtv[0] / depth, mtv[1] / depth
+        if obj2 is not None:
+            if body2 is not None:
+                center = body2.position
+            else:
+                center = (obj2.x, obj2.y) if hasattr(obj2, 'x') else np.mean(obj2.get_corners(), axis=0)
+            if (body1.position[0] - center[0]) * nx + (body1.position[1] - center[1]) * ny < 0:
+                nx, ny = -nx, -ny
+
+        # Pontos de contato
+        if isinstance(obj1, CollisionRectangle) and isinstance(obj2, CollisionRectangle):
+            points = box_box_contact_manifold(obj1.get_corners(), obj2.get_corners(), (nx, ny), SOLVER_MANIFOLD_TOLERANCE)
+        elif isinstance(obj1, CollisionRectangle) and isinstance(obj2, CollisionCircle):
+            points = closest_point_on_polygon_boundary(obj1.get_corners(), (obj2.x, obj2.y))
+        elif isinstance(obj1, CollisionCircle) and isinstance(obj2, CollisionRectangle):
+            points = closest_point_on_polygon_boundary(obj2.get_corners(), (obj1.x, obj1.y))
+        elif isinstance(obj1, CollisionCircle):
+            points = (obj1.x - nx * obj1.radius, obj1.y - ny * obj1.radius)
+        elif isinstance(obj1, CollisionRectangle):
+            # Contra as paredes: cantos mais profundos ao longo da normal
+            corners = obj1.get_corners_array()
+            support = corners @ np.array([nx, ny])
+            points = corners[support <= support.min() + SOLVER_MANIFOLD_TOLERANCE]
+        else:
+            points = body1.position.copy()
+
+        # Coeficientes do par
+        types = {body1.type_object, body2.type_object} if body2 is not None else None
+        if types == {ROBOT_OBJECT, BALL_OBJECT}:
+            restitution, friction = COEFFICIENT_RESTITUTION_BALL_ROBOT, COEFICIENT_FRICTION_BALL_ROBOT
+        elif types == {ROBOT_OBJECT}:
+            restitution, friction = COEFFICIENT_RESTITUTION_ROBOT_ROBOT, COEFICIENT_FRICTION_ROBOT_ROBOT
+        elif types is not None:
+            restitution, friction = 0.5, 0.1
+        elif body1.type_object == BALL_OBJECT:
+            restitution, friction = COEFFICIENT_RESTITUTION_BALL_FIELD, COEFICIENT_FRICTION_BALL_FIELD
+        elif body1.type_object == ROBOT_OBJECT:
+            restitution, friction = COEFFICIENT_RESTITUTION_ROBOT_FIELD, COEFICIENT_FRICTION_ROBOT_FIELD
+        else:
+            restitution, friction = 0.3, 0.05
+
+        return ContactManifold(body1, body2, self._get_pair_key(obj1, obj2), (nx, ny), depth, points, restitution, friction)
+
+    def _batch_rectangle_collisions(self, collisions, indices):
+        """
+        Resolve a fase estreita de todos os pares retângulo-retângulo de uma vez, com os cantos
+        de todos os retângulos em um array (N, 4, 2). Pares sem colisão ficam com mtv None.
+        :param collisions: Lista (obj, other, mtv) da fase de detecção.
+        :param indices: Posições em collisions dos pares retângulo-retângulo.
+        """
+        rectangles = {}
+        for k in indices:
+            obj, other, _ = collisions[k]
+            rectangles.setdefault(id(obj), obj)
+            rectangles.setdefault(id(other), other)
+        order = {key: i for i, key in enumerate(rectangles)}
+
+        # Cantos em cache de cada retângulo (só são recalculados quando o retângulo se move)
+        corners = np.stack([r.get_corners_array() for r in rectangles.values()])
+        centers = np.array([(r.x, r.y) for r in rectangles.values()], dtype=float)
+
+        first  = np.array([order[id(collisions[k][0])] for k in indices])
+        second = np.array([order[id(collisions[k][1])] for k in indices])
+        if kernels.ENABLED:
+            hit, mtv = np.zeros(len(indices), dtype=bool), np.zeros((len(indices), 2))
+            kernels.sat_rectangles_batch(corners, centers, first, second, 1e-2, hit, mtv)
+        else:
+            hit, mtv = batch_sat_rectangles(corners[first], corners[second], centers[first], centers[second])
+        hit &= np.linalg.norm(mtv, axis=1) > 1e-6
+
+        for k, has_collision, pair_mtv in zip(indices, hit, mtv):
+            obj, other, _ = collisions[k]
+            if has_collision:
+                collisions[k] = (obj, other, pair_mtv)
+            else:
+                # Sem sobreposição agora: robôs rápidos ainda podem se encontrar dentro do passo
+                collisions[k] = (obj, other, self._robot_ccd_mtv(obj, other))
+
+    def _ccd_mtv(self, normal):
+        """
+        MTV de um contato previsto pela CCD. Os objetos ainda não se sobrepõem, então a correção de
+        posição é mínima (CCD_TOLERANCE): o mtv só carrega a normal, e o impulso da resolução inverte
+        a velocidade de aproximação antes que a integração do passo leve um objeto através do outro.
+        (Empurrar pela penetração prevista, que já é escalada pela velocidade na resolução,
+        injeta energia com passos de tempo grandes.)
+        :param normal: Normal unitária do contato.
+        """
+        return normal * self.ccd.tolerance
+
+    def _robot_ccd_mtv(self, rect1, rect2):
+        """
+        Avanço conservador para um par robô-robô sem sobreposição no início do passo. Só roda quando
+        o deslocamento relativo no passo passa de CCD_ROBOT_MIN_TRAVEL e os dois podem se alcançar.
+        :return: MTV do contato previsto ou None.
+        """
+        if rect1.type_object != MOVING_OBJECTS or rect2.type_object != MOVING_OBJECTS:
+            return None
+        reference1, reference2 = rect1.reference, rect2.reference
+        radius1 = 0.5 * math.hypot(rect1.width, rect1.height)
+        radius2 = 0.5 * math.hypot(rect2.width, rect2.height)
+        relative = reference1.velocity - reference2.velocity
+        bound = (math.hypot(relative[0], relative[1]) + abs(reference1.angular_velocity) * radius1 +
+                 abs(reference2.angular_velocity) * radius2)
+        travel = bound * self.dt
+        if travel < CCD_ROBOT_MIN_TRAVEL:
+            return None
+        if math.hypot(rect1.x - rect2.x, rect1.y - rect2.y) - radius1 - radius2 > travel:
+            return None
+
+        collided, t, normal = self.ccd.check_robot_robot_ccd(rect1, rect2, self.dt)
+        if not collided:
+            return None
+        # Robôs seguem empurrados pelos motores durante o passo: separa pela penetração prevista
+        return normal * max((1.0 - t) * bound * self.dt, self.ccd.tolerance)
+
+    def set_field_sdf(self, field_sdf, replaced=None, posts=()):
+        """
+        Passa a testar as paredes do campo pela SDF em vez dos colisores de estrutura.
+        :param field_sdf: FieldSDF do campo (None volta aos colisores).
+        :param replaced: Objeto de colisão das paredes (ex: Field.collision_object), que deixa a fase ampla.
+        :param posts: Círculos das traves, testados contra os robôs (a SDF só vê os cantos dos robôs).
+        """
+        self.field_sdf = field_sdf
+        self.field_posts = list(posts)
+        self.sdf_replaced = {id(replaced)} if (field_sdf is not None and replaced is not None) else set()
+        if id(replaced) in self.static_objects:
+            # Já estava na fase ampla: reconstrói sem ele
+            static = [obj for key, obj in self.static_objects.items() if key not in self.sdf_replaced]
+            self.clear_static()
+            for obj in static:
+                self.add_static_object(obj)
+
+    def _field_sdf_collisions(self, objects, collisions):
+        """
+        Testa bolas e robôs contra as paredes com uma única consulta à SDF: o centro de cada
+        círculo e os 4 cantos de cada retângulo. Os robôs ainda são testados contra as traves.
+        :param objects: Objetos de colisão do passo.
+        :param collisions: Lista (obj, other, mtv) onde entram as colisões, com other None para a SDF.
+        """
+        circles, rectangles, points = [], [], []
+        for obj in objects:
+            if getattr(obj, "type_object", None) != MOVING_OBJECTS or getattr(obj.reference, "is_sleeping", False):
+                continue
+            if isinstance(obj, CollisionCircle):
+                circles.append(obj)
+                points.append((obj.x, obj.y))
+            elif isinstance(obj, CollisionRectangle):
+                rectangles.append(obj)
+        if not circles and not rectangles:
+            return
+
+        query = np.array(points, dtype=float).reshape(-1, 2)
+        if rectangles:
+            query = np.concatenate([query] + [r.get_corners_array() for r in rectangles])
+        distance, normal = self.field_sdf.sample(query)
+
+        # Círculos: penetração do centro menos o raio. Círculos rápidos ainda fora da parede
+        # são varridos ao longo do passo (sphere tracing na SDF)
+        for i, circle in enumerate(circles):
+            depth = circle.radius - distance[i]
+            if depth > 0:
+                collisions.append((circle, None, normal[i] * depth))
+                continue
+
+            velocity = circle.reference.velocity
+            if math.hypot(velocity[0], velocity[1]) > self.ccd_threshold:
+                hit, t, wall_normal = self.field_sdf.cast(query[i], velocity * self.dt, circle.radius,
+                                                          self.ccd.max_iterations, self.ccd.tolerance)
+                if hit:
+                    collisions.append((circle, None, self._ccd_mtv(wall_normal)))
+
+        # Retângulos: canto mais profundo contra as paredes, e as traves contra os lados
+        offset = len(circles)
+        for k, rect in enumerate(rectangles):
+            corners = slice(offset + 4 * k, offset + 4 * k + 4)
+            deepest = offset + 4 * k + int(np.argmin(distance[corners]))
+            if distance[deepest] < 0:
+                collisions.append((rect, None, normal[deepest] * -distance[deepest]))
+
+            reach = 0.5 * math.hypot(rect.width, rect.height)
+            for post in self.field_posts:
+                if abs(post.x - rect.x) > reach + post.radius or abs(post.y - rect.y) > reach + post.radius:
+                    continue
+                has_collision, mtv = rect.check_collision(post)
+                if has_collision and np.linalg.norm(mtv) > 1e-6:
+                    collisions.append((rect, post, mtv))
+
     def _get_pair_key(self, obj1, obj2):
         ''' Retorna uma chave única para o par de objetos'''
         return tuple(sorted((id(obj1),id(obj2))))
@@ -1147,86 +2133,80 @@ class CollisionManagerSAT:
         return self.contact_points_cache.get(key, None)
 
     def clear(self):
-        """ Limpa o grid de detecção de colisões. """
+        """ Limpa o grid de detecção de colisões (o grid estático é mantido). """
         self.grid.clear()
 
+    def clear_static(self):
+        """ Limpa o grid estático (e o sweep and prune), para o caso de a geometria do campo mudar. """
+        self.static_grid.clear()
+        self.static_objects.clear()
+        self.sweep_and_prune.clear()
+
+    def add_static_object(self, collision_obj):
+        """
+        Adiciona um objeto fixo (ex: Field.collision_object) ao grid estático. Cada objeto é
+        inserido uma única vez, então os vértices das paredes não são recalculados a cada passo.
+        """
+        if id(collision_obj) in self.static_objects:
+            return
+        self.static_objects[id(collision_obj)] = collision_obj
+        if self.broadphase == "sap":
+            self.sweep_and_prune.add_static(collision_obj)
+        else:
+            self.add_object(collision_obj, grid=self.static_grid)
+
     def _hash_position(self, x, y):
         """ Retorna o índice da célula no grid baseada na posição. """
         return int(x // self.cell_size), int(y // self.cell_size)
 
-    def add_object(self, collision_obj):
+    def add_object(self, collision_obj, grid=None):
         """
         Adiciona um objeto ao grid com base na sua posição.
         :param obj: Objeto com propriedades .x e .y
+        :param grid: Grid de destino. Se None, usa o grid dos objetos móveis.
         """
+        if grid is None:
+            grid = self.grid
+
         if isinstance(collision_obj, CollisionGroup):
             for member in collision_obj.objects:
-                self.add_object(member)
+                self.add_object(member, grid)
             return 
         
-        #Se for uma linha, calcula bouding box 
-        if isinstance(collision_obj, CollisionLine):
-            min_x = min(collision_obj.start[0], collision_obj.end[0])
-            max_x = max(collision_obj.start[0], collision_obj.end[0])
-            min_y = min(collision_obj.start[1], collision_obj.end[1])
-            max_y = max(collision_obj.start[1], collision_obj.end[1])
-
-            start_cell = self._hash_position(min_x, min_y)
-            end_cell = self._hash_position(max_x, max_y)
-
-            for x in range(start_cell[0], end_cell[0] + 1):
-                for y in range(start_cell[1], end_cell[1] + 1):
-                    self.grid[(x, y)].append(collision_obj)
-            return
+        # Bounding box do objeto (linha, retângulo em cache, círculo ou ponto)
+        min_x, min_y, max_x, max_y = collision_bounds(collision_obj)
 
-        #Se for um retângulo, calcula bounding box com base nos vértices
-        elif isinstance(collision_obj, CollisionRectangle):
-            # Obtém os vértices do retângulo
-            vertices = collision_obj.get_corners()
-            xs = [v[0] for v in vertices]
-            ys = [v[1] for v in vertices]
-            min_x = min(xs)
-            max_x = max(xs)
-            min_y = min(ys)
-            max_y = max(ys)
-
-        # Se for um círculo, usa raio para criar a bounding box
-        elif isinstance(collision_obj, CollisionCircle):
-            min_x = collision_obj.x - collision_obj.radius
-            max_x = collision_obj.x + collision_obj.radius
-            min_y = collision_obj.y - collision_obj.radius
-            max_y = collision_obj.y + collision_obj.radius
-
-        # Caso contrário, assume que o objeto tem posição .x e .y (como ponto)
-        else:
-            min_x = max_x = collision_obj.x
-            min_y = max_y = collision_obj.y
-     
         # Calcula as céclulas que a bouding box cobre
         start_cell  = self._hash_position(min_x, min_y)
         end_cell    = self._hash_position(max_x, max_y)
 
         for x in range(start_cell[0], end_cell[0]+1):
             for y in range(start_cell[1],end_cell[1]+1):
-                self.grid[(x,y)].append(collision_obj)
+                grid[(x,y)].append(collision_obj)
         
 
     def _get_nearby_objects(self, obj):
         """
         Retorna objetos nas células vizinhas (incluindo a célula atual).
-        Retorna os objetos na célula atual e nas 8 células ao redor.
+        Retorna os objetos na célula atual e nas 8 células ao redor, dos grids móvel e estático.
+        Com o sweep and prune, retorna os objetos cujas caixas se sobrepõem à do objeto.
         """
+        if self.broadphase == "sap":
+            return self.sweep_and_prune.get_neighbors(obj)
+
         cx, cy = self._hash_position(obj.x, obj.y)
         nearby = []
         for dx in [-1, 0, 1]:
             for dy in [-1, 0, 1]:
                 cell = (cx + dx, cy + dy)
-                nearby.extend(self.grid.get(cell, []))
+                nearby.extend(self.grid.get(cell, ()))
+                nearby.extend(self.static_grid.get(cell, ()))
 
         return nearby   
     
     def draw_mtv(self, obj, mtv, color=(255,0,0)):
         if not self.screen: return 
+        import pygame   # Importação tardia: a física roda sem pygame
         #Desenhando o vetor mtv para debug
         start_pos = (int(obj.x), int(obj.y))
         end_pos = (int(obj.x + mtv[0]*10), int(obj.y + mtv[1]*10))  # escala para visual
@@ -1296,7 +2276,8 @@ class CollisionManagerSAT:
         # Verifica se MTV é suficiente (baseado em velocidade relativa)
         # Separação posicional proporcional à massa
         total_mass = obj1.mass + obj2.mass
-        correction = mtv * (1.01 + np.linalg.norm(obj1.velocity - obj2.velocity) * 0.01)
+        # O fator de velocidade é limitado: com passos grandes ele empurraria os objetos através de outros
+        correction = mtv * min(1.01 + np.linalg.norm(obj1.velocity - obj2.velocity) * 0.01, MAX_SEPARATION_SCALE)
         obj1.position += correction * (obj2.mass / total_mass)
         obj2.position -= correction * (obj1.mass / total_mass)
 
@@ -1312,18 +2293,8 @@ class CollisionManagerSAT:
                 collision_point = obj2.position.copy()
 
         elif {type1, type2} == {ROBOT_OBJECT}:
-            # Robô-Robô → ponto mais próximo entre as bordas dos retângulos
-            poly1 = Polygon(obj1.collision_object.get_corners())
-            poly2 = Polygon(obj2.collision_object.get_corners())
-
-            line1 = poly1.exterior
-            line2 = poly2.exterior
-
-            # Ponto mais próximo entre os contornos
-            p1, p2 = line1.interpolate(line1.project(line2.centroid)).coords[0], \
-                    line2.interpolate(line2.project(line1.centroid)).coords[0]
-
-            collision_point = (np.array(p1) + np.array(p2)) / 2
+            # Robô-Robô → centro do manifold de contato entre os retângulos (já separados)
+            collision_point = self.calculate_contact_point(obj1.collision_object, obj2.collision_object, mtv)
         else:
             collision_point = (obj1.position + obj2.position) / 2
 
@@ -1421,6 +2392,7 @@ class CollisionManagerSAT:
         """
         Resolve colisão entre objeto móvel e o campo (estrutura estática de massa infinita).
         Aplica múltiplos impulsos e torques realistas, agrupando pontos próximos.
+        Se objfield for None (parede da SDF), o mtv já vem orientado para dentro do campo.
         """
 
         obj = obj.reference
@@ -1430,18 +2402,32 @@ class CollisionManagerSAT:
             print("MTV nulo — colisão ignorada.")
             return
 
+        # Arrays de trabalho: pontos de contato (centro, ou 4 cantos e 4 meios de lado), normal,
+        # tangente, braço, velocidade no contato e impulso
+        scratch = self.scratch
+        points = scratch.get("field_points", (8, 2))
+        normal = scratch.get("field_normal")
+        tangent = scratch.get("field_tangent")
+        arm = scratch.get("field_arm")
+        contact_velocity = scratch.get("field_contact_velocity")
+        impulse = scratch.get("field_impulse")
+
         # Direção do MTV — deve ir de objfield → obj
-        pos_field = np.array([objfield.x, objfield.y]) if hasattr(objfield, 'x') else np.mean(objfield.get_corners(), axis=0)
-        object_pos = np.array([obj.x, obj.y])
-        normal = mtv / norm_mtv
-        if np.dot(object_pos - pos_field, normal) < 0:
-            normal = -normal
-            mtv = -mtv
+        object_x, object_y = obj.x, obj.y
+        np.divide(mtv, norm_mtv, out=normal)
+        if objfield is not None:
+            if hasattr(objfield, 'x'):
+                field_x, field_y = objfield.x, objfield.y
+            else:
+                field_x, field_y = np.mean(objfield.get_corners(), axis=0)
+            if (object_x - field_x) * normal[0] + (object_y - field_y) * normal[1] < 0:
+                np.negative(normal, out=normal)
+                np.negative(mtv, out=mtv)
 
         # Escala MTV com velocidade e dt (para garantir separação em velocidades altas)
         velocity_along_normal = np.dot(obj.velocity, normal)
         velocity_factor = abs(velocity_along_normal) * self.dt
-        mtv *= (1.0 + velocity_factor * 0.2)  # fator ajustável
+        mtv *= min(1.0 + velocity_factor * 0.2, MAX_SEPARATION_SCALE)  # fator ajustável (limitado)
 
         # Corrige posição
         obj.x += mtv[0]
@@ -1450,59 +2436,68 @@ class CollisionManagerSAT:
         obj.collision_object.y = obj.y
 
         # --- Parâmetros de colisão por tipo ---
+        # Os pontos são medidos a partir da posição antes da correção
+        points[0, 0], points[0, 1] = object_x, object_y
+        count = 1
         type_name = type(obj).__name__
         if 'Ball' in type_name:
             restitution = COEFFICIENT_RESTITUTION_BALL_FIELD
             friction = 0.0
-            contact_points = [object_pos.copy()]
         elif 'Robot' in type_name:
             restitution = COEFFICIENT_RESTITUTION_ROBOT_FIELD
             friction = COEFICIENT_FRICTION_ROBOT_FIELD
-            if hasattr(obj.collision_object, "get_corners"):
-                corners = obj.collision_object.get_corners()
-                mid_edges = [(corners[i] + corners[(i + 1) % 4]) / 2 for i in range(4)]
-                contact_points = corners + mid_edges
-            else:
-                contact_points = [object_pos.copy()]
+            if hasattr(obj.collision_object, "get_corners_array"):
+                corners = obj.collision_object.get_corners_array()
+                points[:4] = corners
+                np.add(corners[:3], corners[1:], out=points[4:7])
+                np.add(corners[3], corners[0], out=points[7])
+                points[4:] /= 2
+                count = 8
         else:
             restitution = 0.3
             friction = 0.05
-            contact_points = [object_pos.copy()]
 
         # --- Filtra pontos redundantes (agrupa próximos) ---
-        filtered_points = []
+        filtered = []
         eps = 1.0  # Tolerância em cm
-        for p in contact_points:
-            if all(np.linalg.norm(p - fp) > eps for fp in filtered_points):
-                filtered_points.append(p)
+        for k in range(count):
+            px, py = points[k, 0], points[k, 1]
+            for f in filtered:
+                if math.hypot(px - points[f, 0], py - points[f, 1]) <= eps:
+                    break
+            else:
+                filtered.append(k)
 
         # --- Aplica impulso e torque nos pontos filtrados ---
         obj_inv_mass = 1 / obj.mass
         obj_inv_inertia = 1 / obj.inertia
-
-        for point in filtered_points:
-            r = point - object_pos
-            vel_at_contact = obj.velocity + obj.angular_velocity * np.array([-r[1], r[0]])
-            vel_normal = np.dot(vel_at_contact, normal)
+        tangent[0], tangent[1] = -normal[1], normal[0]
+
+        for k in filtered:
+            point = points[k]
+            arm[0], arm[1] = point[0] - object_x, point[1] - object_y
+            contact_velocity[0], contact_velocity[1] = -arm[1], arm[0]
+            contact_velocity *= obj.angular_velocity
+            contact_velocity += obj.velocity
+            vel_normal = np.dot(contact_velocity, normal)
             if vel_normal >= 0:
                 continue
 
-            rn = np.cross(r, normal)
+            rn = arm[0] * normal[1] - arm[1] * normal[0]
             denom = obj_inv_mass + (rn ** 2) * obj_inv_inertia
             j = -(1 + restitution) * vel_normal / denom
 
-            j = np.clip(j, -100, 100)
+            j = min(max(j, -100), 100)
 
-            impulse = j * normal
+            np.multiply(normal, j, out=impulse)
             obj.apply_impulse(impulse, point)
 
             # Atrito
-            tangent = np.array([-normal[1], normal[0]])
-            vel_tangent = np.dot(vel_at_contact, tangent)
+            vel_tangent = np.dot(contact_velocity, tangent)
             jt = -vel_tangent / denom
-            jt = np.clip(jt, -abs(j) * friction, abs(j) * friction)
-            friction_impulse = jt * tangent
-            obj.apply_impulse(friction_impulse, point)
+            jt = min(max(jt, -abs(j) * friction), abs(j) * friction)
+            np.multiply(tangent, jt, out=impulse)
+            obj.apply_impulse(impulse, point)
             
         # Limita velocidades para evitar instabilidades numéricas
         MAX_VELOCITY = 200.0  # Limite de velocidade linear
@@ -1510,9 +2505,10 @@ class CollisionManagerSAT:
 
         velocity_magnitude = np.linalg.norm(obj.velocity)
         if velocity_magnitude > MAX_VELOCITY:
-            obj.velocity = (obj.velocity / velocity_magnitude) * MAX_VELOCITY
+            obj.velocity /= velocity_magnitude
+            obj.velocity *= MAX_VELOCITY
 
-        obj.angular_velocity = np.clip(obj.angular_velocity, -MAX_ANGULAR_VELOCITY, MAX_ANGULAR_VELOCITY)
+        obj.angular_velocity = min(max(obj.angular_velocity, -MAX_ANGULAR_VELOCITY), MAX_ANGULAR_VELOCITY)
 
         # Damping
         obj.velocity *= (1 - 0.02 * self.dt * 60)  # Aproximadamente 2% por frame a 60fps
@@ -1520,14 +2516,14 @@ class CollisionManagerSAT:
 
 
     # Método interessante para detectar os pontos de colisão
-    def calculate_contact_point(self, obj1, obj2):
+    def calculate_contact_point(self, obj1, obj2, mtv=None):
         """
-        Calcula o ponto de contato mais preciso entre dois objetos.
+        Calcula o ponto de contato mais preciso entre dois objetos, de forma analítica sobre os cantos.
         
         Args:
             obj1: Primeiro objeto de colisão
             obj2: Segundo objeto de colisão
-            mtv: Vetor mínimo de translação
+            mtv: Vetor mínimo de translação (direção da colisão). Se None, usa a direção entre os centros.
             
         Returns:
             np.array: Ponto de contato [x, y] no espaço do jogo
@@ -1541,166 +2537,243 @@ class CollisionManagerSAT:
             ball = obj1 if obj1.type_object == BALL_OBJECT else obj2
             robot = obj2 if obj1.type_object == BALL_OBJECT else obj1
             
-            # Para bola-robô, o ponto é o mais próximo no robô à bola
-            robot_corners = robot.collision_object.get_corners()
-            robot_poly = Polygon(robot_corners)
-            ball_point = Point(ball.position)
-            
-            # Projeta o centro da bola no contorno do robô
-            nearest_point = robot_poly.exterior.interpolate(
-                robot_poly.exterior.project(ball_point))
-            
-            return np.array(nearest_point.coords[0])
-
-        # Caso 2: Colisão robô-robô
-        elif obj1.type_object == ROBOT_OBJECT and obj2.type_object == ROBOT_OBJECT:
-            # Usa o ponto médio entre os pontos mais próximos
-            poly1 = Polygon(obj1.collision_object.get_corners())
-            poly2 = Polygon(obj2.collision_object.get_corners())
-            
-            p1 = poly1.exterior.interpolate(poly1.exterior.project(poly2.centroid))
-            p2 = poly2.exterior.interpolate(poly2.exterior.project(poly1.centroid))
-            
-            return (np.array(p1.coords[0]) + np.array(p2.coords[0])) / 2
-
-        # Caso 3: Colisão genérica (ponto médio da área de sobreposição)
+            # Para bola-robô, o ponto é o mais próximo do centro da bola no contorno do robô
+            return closest_point_on_polygon_boundary(robot.collision_object.get_corners(), ball.position)
+
+        # Caso 2: Colisão entre dois retângulos (robô-robô): centro do manifold de contato
+        elif hasattr(obj1.collision_object, "get_corners") and hasattr(obj2.collision_object, "get_corners"):
+            if mtv is None or np.linalg.norm(mtv) == 0:
+                mtv = obj1.position - obj2.position
+            if np.linalg.norm(mtv) == 0:
+                return (obj1.position + obj2.position) / 2
+            if np.dot(mtv, obj1.position - obj2.position) < 0:
+                mtv = -mtv
+
+            manifold = box_box_contact_manifold(
+                obj1.collision_object.get_corners(), obj2.collision_object.get_corners(), mtv)
+            return manifold.mean(axis=0)
+
+        # Caso 3: Colisão genérica: ponto médio entre os centros
         else:
-            try:
-                # Tenta calcular a área de sobreposição
-                poly1 = Polygon(obj1.collision_object.get_corners())
-                poly2 = Polygon(obj2.collision_object.get_corners())
-                overlap = poly1.intersection(poly2)
-                
-                if not overlap.is_empty:
-                    return np.array([overlap.centroid.x, overlap.centroid.y])
-            except:
-                pass
-            
-            # Fallback: ponto médio entre os centros
             return (obj1.position + obj2.position) / 2
         
     # Função para desenhar os pontos de colisão
     def draw_contact_points(self, screen):
         """Método para debug: desenha pontos de contato na tela"""
-        for point in self.contact_points_cache.values():
-            pos = virtual_to_screen(point)
-            pygame.draw.circle(screen, (255, 0, 0), pos, 5)
+        import pygame   # Importação tardia: a física roda sem pygame
+        for points in self.contact_points_cache.values():
+            if points is None:
+                continue
+            for point in np.reshape(points, (-1, 2)):
+                pos = virtual_to_screen(point)
+                pygame.draw.circle(screen, (255, 0, 0), pos, 5)
 
 
 
 class ContinuousCollisionDetector:
-    def __init__(self):
-        self.normal_cache = {}  # Cache para normais
-    
-    def get_edge_normal(self, p1, p2):
-        cache_key = (tuple(p1), tuple(p2))
-        if cache_key in self.normal_cache:
-            return self.normal_cache[cache_key]
-        
-        edge_vector = p2 - p1
-        normal = np.array([-edge_vector[1], edge_vector[0]])
-        norm = np.linalg.norm(normal)
-        
-        if norm > 1e-6:
-            normal = normal / norm
-        
-        self.normal_cache[cache_key] = normal
-        return normal
-    
-    def ray_segment_intersect(self, ro, rd, p1, p2):
-        """Testa interseção entre raio e segmento com tratamento de raio"""
-        v1 = ro - p1
-        v2 = p2 - p1
-        v3 = np.array([-rd[1], rd[0]])
-        
-        dot = np.dot(v2, v3)
-        if abs(dot) < 1e-6:
-            return False, None
-        
-        t1 = np.cross(v2, v1) / dot
-        t2 = np.dot(v1, v3) / dot
-        
-        if t1 >= 0 and 0 <= t2 <= 1:
-            return True, t1
-        
-        return False, None
-    
+    """
+    Detecção de colisão contínua (CCD): estima o instante t em [0, 1] do passo em que dois objetos
+    se tocam, para que objetos rápidos (ou passos de tempo grandes) não atravessem uns aos outros.
+
+    - Círculo contra segmento, retângulo e círculo: varredura analítica do círculo (movimento relativo).
+    - Retângulo contra retângulo (robô-robô): avanço conservador com translação e rotação.
+
+    Todos os casos retornam (colidiu, t, normal), com a normal apontando de objB para objA.
+    """
+    def __init__(self, max_iterations=CCD_MAX_ITERATIONS, tolerance=CCD_TOLERANCE):
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+
+    @staticmethod
+    def _motion(obj, dt):
+        """ Deslocamento (dx, dy) do objeto no passo, pela velocidade da referência (estruturas ficam paradas). """
+        velocity = getattr(obj.reference, "velocity", None)
+        if velocity is None or obj.type_object == STRUCTURE_OBJECTS:
+            return 0.0, 0.0
+        return float(velocity[0]) * dt, float(velocity[1]) * dt
+
+    @staticmethod
+    def _swept_circle_point(cx, cy, radius, mx, my, px, py):
+        """
+        Primeiro instante t em [0, 1] em que o círculo (centro c, movimento m) toca o ponto p.
+        Retorna None se não tocar no passo.
+        """
+        fx, fy = cx - px, cy - py
+        a = mx * mx + my * my
+        b = 2.0 * (fx * mx + fy * my)
+        c = fx * fx + fy * fy - radius * radius
+        if c <= 0:
+            return 0.0
+        if a == 0 or b >= 0:
+            return None
+        discriminant = b * b - 4 * a * c
+        if discriminant < 0:
+            return None
+        t = (-b - math.sqrt(discriminant)) / (2 * a)
+        return t if 0.0 <= t <= 1.0 else None
+
+    def _swept_circle_segment(self, cx, cy, radius, mx, my, p1, p2):
+        """
+        Varredura de um círculo contra um segmento (cápsula do segmento com o raio do círculo).
+        :return: (t, normal) do primeiro contato no passo, ou (None, None).
+        """
+        if kernels.ENABLED:
+            t, nx, ny = kernels.swept_circle_segment(cx, cy, radius, mx, my, float(p1[0]), float(p1[1]), float(p2[0]), float(p2[1]))
+            return (None, None) if t < 0 else (t, np.array([nx, ny]))
+
+        ax, ay = float(p1[0]), float(p1[1])
+        bx, by = float(p2[0]), float(p2[1])
+        ex, ey = bx - ax, by - ay
+        length = math.hypot(ex, ey)
+        if length == 0:
+            t = self._swept_circle_point(cx, cy, radius, mx, my, ax, ay)
+            if t is None:
+                return None, None
+            nx, ny = cx + mx * t - ax, cy + my * t - ay
+        else:
+            # Lado reto da cápsula: distância do centro à reta igual ao raio
+            nx, ny = -ey / length, ex / length
+            side = (cx - ax) * nx + (cy - ay) * ny
+            if side < 0:
+                nx, ny, side = -nx, -ny, -side
+            approach = -(mx * nx + my * ny)
+            t = None
+            if side <= radius:
+                t_line = 0.0
+            elif approach > 0:
+                t_line = (side - radius) / approach
+            else:
+                t_line = None
+            if t_line is not None and t_line <= 1.0:
+                along = ((cx + mx * t_line - ax) * ex + (cy + my * t_line - ay) * ey) / (length * length)
+                if 0.0 <= along <= 1.0:
+                    t = t_line
+
+            # Pontas arredondadas da cápsula
+            if t is None:
+                for px, py in ((ax, ay), (bx, by)):
+                    t_end = self._swept_circle_point(cx, cy, radius, mx, my, px, py)
+                    if t_end is not None and (t is None or t_end < t):
+                        t = t_end
+                        nx, ny = cx + mx * t_end - px, cy + my * t_end - py
+                if t is None:
+                    return None, None
+
+        norm = math.hypot(nx, ny)
+        if norm == 0:
+            return None, None
+        return t, np.array([nx / norm, ny / norm])
+
+    def _swept_circle_polygon(self, circle, corners, mx, my):
+        """ Varredura de um círculo contra as arestas de um polígono. Retorna (t, normal) ou (None, None). """
+        t_first, normal = None, None
+        for i in range(len(corners)):
+            t, edge_normal = self._swept_circle_segment(circle.x, circle.y, circle.radius, mx, my,
+                                                        corners[i], corners[(i + 1) % len(corners)])
+            if t is not None and (t_first is None or t < t_first):
+                t_first, normal = t, edge_normal
+        return t_first, normal
+
     def check_robot_ball_ccd(self, robot, ball, dt):
-        """CCD específico para retângulo (robô) e bola"""
-        # Acessa os objetos de referência corretamente
-        robot_ref = robot.reference
-        ball_ref = ball.reference
-        
-        # Calcula movimento previsto
-        start_pos = ball_ref.position
-        end_pos = ball_ref.position + ball_ref.velocity * dt
-        movement = end_pos - start_pos
-        
-        # Testa contra todas as arestas do robô
-        rect_corners = robot.get_corners()
-        t_first = float('inf')
-        collision_normal = None
-        
-        for i in range(4):
-            edge_p1 = rect_corners[i]
-            edge_p2 = rect_corners[(i+1)%4]
-            
-            # Testa interseção considerando o raio da bola
-            hit, t = self._swept_circle_edge_test(
-                start_pos, ball.radius,
-                movement, edge_p1, edge_p2
-            )
-            
-            if hit and t < t_first:
-                t_first = t
-                collision_normal = self.get_edge_normal(edge_p1, edge_p2)
-        
-        if t_first <= 1.0:
-            return True, t_first, collision_normal
-        
+        """CCD para retângulo (robô ou parede) e bola, com o movimento relativo da bola. Normal do retângulo para a bola."""
+        bx, by = self._motion(ball, dt)
+        rx, ry = self._motion(robot, dt)
+        t, normal = self._swept_circle_polygon(ball, robot.get_corners_array(), bx - rx, by - ry)
+        if t is None:
+            return False, None, None
+        return True, t, normal
+
+    def check_circle_circle_ccd(self, circle1, circle2, dt):
+        """CCD entre dois círculos (bola-bola ou bola-vértice). Normal de circle2 para circle1."""
+        m1x, m1y = self._motion(circle1, dt)
+        m2x, m2y = self._motion(circle2, dt)
+        mx, my = m1x - m2x, m1y - m2y
+        t = self._swept_circle_point(circle1.x, circle1.y, circle1.radius + circle2.radius, mx, my, circle2.x, circle2.y)
+        if t is None:
+            return False, None, None
+        nx, ny = circle1.x + mx * t - circle2.x, circle1.y + my * t - circle2.y
+        norm = math.hypot(nx, ny)
+        if norm == 0:
+            return False, None, None
+        return True, t, np.array([nx / norm, ny / norm])
+
+    def check_circle_line_ccd(self, circle, line, dt):
+        """CCD entre círculo e linha (segmento). Normal da linha para o círculo."""
+        cx, cy = self._motion(circle, dt)
+        lx, ly = self._motion(line, dt)
+        t, normal = self._swept_circle_segment(circle.x, circle.y, circle.radius, cx - lx, cy - ly, line.start, line.end)
+        if t is None:
+            return False, None, None
+        return True, t, normal
+
+    @staticmethod
+    def _corners_at(rect, time):
+        """ Cantos do retângulo avançado pelo tempo time (s) com a velocidade linear e angular da referência. """
+        reference = rect.reference
+        velocity = getattr(reference, "velocity", (0.0, 0.0))
+        angle = math.radians(rect.angle) + getattr(reference, "angular_velocity", 0.0) * time
+        x, y = rect.x + velocity[0] * time, rect.y + velocity[1] * time
+        cos, sin = math.cos(angle), math.sin(angle)
+        half_width, half_height = rect.width / 2, rect.height / 2
+        return [(x + cos * lx - sin * ly, y + sin * lx + cos * ly)
+                for lx, ly in ((-half_width, -half_height), (half_width, -half_height), (half_width, half_height), (-half_width, half_height))]
+
+    def check_robot_robot_ccd(self, rect1, rect2, dt):
+        """
+        Avanço conservador entre dois retângulos que transladam e giram no passo.
+
+        A cada iteração mede a distância entre os retângulos e avança o tempo o máximo possível
+        sem que se toquem: distância / (velocidade de aproximação + |ω| * meia diagonal de cada um).
+        Normal de rect2 para rect1.
+        """
+        reference1, reference2 = rect1.reference, rect2.reference
+        velocity1, velocity2 = reference1.velocity, reference2.velocity
+        vx, vy = float(velocity1[0] - velocity2[0]), float(velocity1[1] - velocity2[1])
+        spin = (abs(getattr(reference1, "angular_velocity", 0.0)) * 0.5 * math.hypot(rect1.width, rect1.height) +
+                abs(getattr(reference2, "angular_velocity", 0.0)) * 0.5 * math.hypot(rect2.width, rect2.height))
+
+        t, last_normal = 0.0, None
+        for _ in range(self.max_iterations):
+            distance, normal = convex_polygon_distance(self._corners_at(rect1, t * dt), self._corners_at(rect2, t * dt))
+            if distance > 0:
+                last_normal = normal
+            if distance <= self.tolerance:
+                # Encostados exatamente (distância nula): usa a normal da iteração anterior
+                if last_normal is None:
+                    return False, None, None
+                return True, t, np.array(last_normal)
+
+            approach = spin - (vx * normal[0] + vy * normal[1])
+            if approach <= 1e-9:
+                return False, None, None
+            t += float(distance / (approach * dt))
+            if t > 1.0:
+                return False, None, None
         return False, None, None
-    
-    def _swept_circle_edge_test(self, circle_pos, radius, movement, edge_p1, edge_p2):
-        """Testa interseção entre círculo em movimento e aresta"""
-        # Implementação mais precisa considerando o raio
-        edge_vec = edge_p2 - edge_p1
-        edge_len = np.linalg.norm(edge_vec)
-        edge_dir = edge_vec / edge_len if edge_len > 0 else np.zeros(2)
-        
-        # Calcula ponto mais próximo na aresta
-        to_circle = circle_pos - edge_p1
-        projection = np.dot(to_circle, edge_dir)
-        projection = max(0, min(edge_len, projection))
-        closest = edge_p1 + projection * edge_dir
-        
-        # Vetor do ponto mais próximo ao círculo
-        to_center = circle_pos - closest
-        dist_sq = np.dot(to_center, to_center)
-        
-        # Se já está colidindo no frame atual
-        if dist_sq <= radius**2:
-            return True, 0.0
-        
-        # Se está se movendo para longe
-        if np.dot(movement, to_center) >= 0:
-            return False, None
-        
-        # Testa interseção com cápsula (aresta + raio)
-        return self.ray_segment_intersect(
-            circle_pos, movement,
-            closest + to_center/np.sqrt(dist_sq)*radius,
-            closest + to_center/np.sqrt(dist_sq)*radius
-        )
-    
+
     def check_continuous_collision(self, objA, objB, dt):
-        """Verificação genérica de CCD"""
-        # Caso robô-bola
+        """
+        Verificação genérica de CCD.
+        :return: (colidiu, t, normal de objB para objA). Pares sem suporte retornam (False, None, None).
+        """
+        # Caso retângulo-círculo (robô-bola, parede-bola)
         if isinstance(objA, CollisionRectangle) and isinstance(objB, CollisionCircle):
-            return self.check_robot_ball_ccd(objA, objB, dt)
-        # Caso bola-robô (inverte a ordem)
+            collided, t, normal = self.check_robot_ball_ccd(objA, objB, dt)
+            return collided, t, -normal if normal is not None else None
+        # Caso círculo-retângulo
         elif isinstance(objA, CollisionCircle) and isinstance(objB, CollisionRectangle):
-            collided, t, normal = self.check_robot_ball_ccd(objB, objA, dt)
+            return self.check_robot_ball_ccd(objB, objA, dt)
+        # Caso círculo-círculo (bola-vértice do campo)
+        elif isinstance(objA, CollisionCircle) and isinstance(objB, CollisionCircle):
+            return self.check_circle_circle_ccd(objA, objB, dt)
+        # Casos com linhas
+        elif isinstance(objA, CollisionCircle) and isinstance(objB, CollisionLine):
+            return self.check_circle_line_ccd(objA, objB, dt)
+        elif isinstance(objA, CollisionLine) and isinstance(objB, CollisionCircle):
+            collided, t, normal = self.check_circle_line_ccd(objB, objA, dt)
             return collided, t, -normal if normal is not None else None
-        
-        # Adicione outros casos aqui (bola-bola, robô-robô)
-        return False, None, None
\ No newline at end of file
+        # Caso retângulo-retângulo (robô-robô)
+        elif isinstance(objA, CollisionRectangle) and isinstance(objB, CollisionRectangle):
+            return self.check_robot_robot_ccd(objA, objB, dt)
+
+        return False, None, None
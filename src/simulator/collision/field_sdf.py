@@ -0,0 +1,198 @@
+#Campo de distância com sinal (SDF) das paredes do campo
+from ui.interface_config import *
+import numpy as np
+import hashlib
+import os
+
+
+# Pasta padrão do cache em disco (src/data/temp), independente do diretório de execução
+SDF_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "temp")
+
+
+class FieldSDF:
+    '''
+        Distância com sinal até as paredes do campo, amostrada em uma grade regular.
+
+        O contorno do campo é um polígono fixo (cantos chanfrados e recortes dos gols), então a
+        distância e o seu gradiente são pré-calculados uma única vez e salvos em disco. Durante a
+        simulação, os testes contra as paredes viram uma consulta na grade com interpolação bilinear.
+
+        - Distância positiva dentro da área jogável e negativa dentro/atrás das paredes.
+        - A superfície fica a offset cm da linha do contorno (metade da espessura das paredes).
+        - O gradiente é unitário e aponta para dentro do campo (direção de separação).
+    '''
+    VERSION = 1
+
+    def __init__(self, polygon, resolution: float = FIELD_SDF_RESOLUTION, margin: float = FIELD_SDF_MARGIN,
+                 offset: float = THICKNESS / 2, cache_dir: str = SDF_CACHE_DIR):
+        '''
+        Carrega a SDF do cache ou, se não existir, calcula e salva.
+
+        :param polygon (list): Vértices do contorno do campo, em ordem (cm).
+
+        :param resolution (float): Tamanho da célula da grade em cm.
+
+        :param margin (float): Folga da grade além dos limites do contorno em cm.
+
+        :param offset (float): Distância da superfície da parede até a linha do contorno em cm.
+
+        :param cache_dir (str): Pasta do cache em disco. Se None, não usa cache.
+        '''
+        self.polygon = np.asarray(polygon, dtype=float)
+        self.resolution = float(resolution)
+        self.margin = float(margin)
+        self.offset = float(offset)
+
+        self.origin = self.polygon.min(axis=0) - self.margin
+        extent = self.polygon.max(axis=0) + self.margin - self.origin
+        self.shape = tuple(int(n) for n in np.ceil(extent / self.resolution).astype(int) + 1)   # (nx, ny)
+
+        # Vértices do contorno que avançam para dentro do campo (traves dos gols)
+        self.posts = self._inward_vertices(self.polygon)
+
+        path = self._cache_path(cache_dir) if cache_dir else None
+        if path and os.path.exists(path):
+            data = np.load(path)
+            self.distance, self.gradient = data["distance"], data["gradient"]
+            print(f"[Sistema]: SDF do campo carregada de {path}")
+        else:
+            self.distance, self.gradient = self._build()
+            if path:
+                try:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    np.savez(path, distance=self.distance, gradient=self.gradient)
+                    print(f"[Sistema]: SDF do campo calculada e salva em {path}")
+                except OSError:
+                    print("[Sistema]: SDF do campo calculada (cache em disco indisponível)")
+
+        # Tabela [distância, gx, gy] por nó, para buscar os 3 valores de uma vez na consulta
+        self._table = np.concatenate([self.distance[..., None], self.gradient], axis=2).reshape(-1, 3)
+        self._max_local = np.array(self.shape, dtype=float) - 1.000001
+
+    # =============================|Construção|============================
+    def _cache_path(self, cache_dir):
+        '''
+            Arquivo do cache, identificado pelo contorno e pelos parâmetros da grade.
+        '''
+        key = hashlib.sha1()
+        key.update(self.polygon.tobytes())
+        key.update(np.array([self.resolution, self.margin, self.offset, self.VERSION], dtype=float).tobytes())
+        return os.path.join(cache_dir, f"field_sdf_{key.hexdigest()[:16]}.npz")
+
+    @staticmethod
+    def _inward_vertices(polygon):
+        '''
+            Retorna os vértices reflexos (vistos de dentro do campo), que apontam para a área jogável.
+        '''
+        previous = np.roll(polygon, 1, axis=0)
+        following = np.roll(polygon, -1, axis=0)
+        e1, e2 = polygon - previous, following - polygon
+        cross = e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]
+
+        # Orientação do polígono pela área com sinal (fórmula do laço)
+        area = np.sum(previous[:, 0] * polygon[:, 1] - polygon[:, 0] * previous[:, 1])
+        return polygon[cross * np.sign(area) < 0]
+
+    def _build(self):
+        '''
+            Calcula a distância exata aos segmentos do contorno em cada nó da grade, o sinal
+            (dentro/fora do polígono) e o gradiente analítico.
+        '''
+        nx, ny = self.shape
+        xs = self.origin[0] + np.arange(nx) * self.resolution
+        ys = self.origin[1] + np.arange(ny) * self.resolution
+        gx, gy = np.meshgrid(xs, ys, indexing="ij")
+        points = np.stack([gx.ravel(), gy.ravel()], axis=1)                 # (M, 2)
+
+        a = self.polygon
+        b = np.roll(self.polygon, -1, axis=0)
+        edges = b - a                                                        # (S, 2)
+
+        # Ponto mais próximo de cada nó em cada segmento
+        rel = points[:, None, :] - a[None, :, :]                             # (M, S, 2)
+        t = np.clip(np.einsum("msk,sk->ms", rel, edges) / np.einsum("sk,sk->s", edges, edges), 0.0, 1.0)
+        closest = a[None, :, :] + t[:, :, None] * edges[None, :, :]
+        dist2 = np.sum((points[:, None, :] - closest) ** 2, axis=2)
+        nearest = np.argmin(dist2, axis=1)
+        closest = closest[np.arange(len(points)), nearest]
+        unsigned = np.sqrt(dist2[np.arange(len(points)), nearest])
+
+        # Sinal por paridade do raio horizontal (positivo dentro do campo)
+        y0, y1 = a[:, 1], b[:, 1]
+        crosses = (y0[None, :] > points[:, 1:2]) != (y1[None, :] > points[:, 1:2])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = a[:, 0] + (points[:, 1:2] - y0) * edges[:, 0] / edges[:, 1]
+        inside = np.sum(crosses & (points[:, 0:1] < x_cross), axis=1) % 2 == 1
+        sign = np.where(inside, 1.0, -1.0)
+
+        # Gradiente: do ponto mais próximo para o nó, orientado para dentro do campo
+        direction = points - closest
+        length = np.linalg.norm(direction, axis=1, keepdims=True)
+        gradient = np.divide(direction, length, out=np.zeros_like(direction), where=length > 0) * sign[:, None]
+
+        distance = (sign * unsigned - self.offset).reshape(nx, ny)
+        return distance, gradient.reshape(nx, ny, 2)
+
+    # =============================|Consulta|============================
+    def sample(self, points):
+        '''
+            Distância e normal (gradiente normalizado) nos pontos, por interpolação bilinear.
+            Pontos fora da grade usam a normal da borda e a distância da borda menos o quanto
+            estão além dela (limite inferior da distância real, que continua crescendo para fora).
+
+            :param points (array): Pontos (N, 2) em cm.
+
+            :return: Tupla (distance (N,), normal (N, 2)).
+        '''
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        local = (points - self.origin) / self.resolution
+        clipped = np.clip(local, 0.0, self._max_local)
+        beyond = np.hypot(*(local - clipped).T) * self.resolution
+        local = clipped
+
+        cell = local.astype(np.intp)
+        frac = local - cell
+        fx, fy = frac[:, 0:1], frac[:, 1:2]
+        base = cell[:, 0] * self.shape[1] + cell[:, 1]
+
+        # Interpola em x nas duas linhas da célula e depois em y
+        table = self._table
+        v00, v10 = table[base], table[base + self.shape[1]]
+        v01, v11 = table[base + 1], table[base + self.shape[1] + 1]
+        bottom = v00 + (v10 - v00) * fx
+        values = bottom + (v01 + (v11 - v01) * fx - bottom) * fy
+
+        normal = values[:, 1:]
+        length = np.sqrt(np.einsum("nd,nd->n", normal, normal))[:, None]
+        normal = np.divide(normal, length, out=np.zeros_like(normal), where=length > 0)
+        return values[:, 0] - beyond, normal
+
+    def cast(self, start, movement, radius: float = 0.0, max_iterations: int = CCD_MAX_ITERATIONS, tolerance: float = CCD_TOLERANCE):
+        '''
+            Varre um círculo ao longo do movimento (sphere tracing): a cada iteração avança a
+            distância livre até a parede, que nunca atravessa a superfície.
+
+            :param start (array): Centro inicial (cm).
+
+            :param movement (array): Deslocamento no passo (cm).
+
+            :param radius (float): Raio do círculo (cm).
+
+            :return: Tupla (colidiu, t em [0, 1], normal no contato).
+        '''
+        start = np.asarray(start, dtype=float)
+        movement = np.asarray(movement, dtype=float)
+        length = float(np.hypot(movement[0], movement[1]))
+        if length == 0:
+            return False, None, None
+
+        t = 0.0
+        for _ in range(max_iterations):
+            distance, normal = self.sample(start + movement * t)
+            gap = distance[0] - radius
+            if gap <= tolerance:
+                return True, t, normal[0]
+            t += gap / length
+            if t > 1.0:
+                return False, None, None
+        return False, None, None
@@ -0,0 +1,443 @@
+#Definição do motor de simulação headless
+from simulator.objects.field import Field
+from simulator.objects.ball import Ball
+from simulator.objects.team import Team, blue_team_positions, red_team_positions
+from simulator.objects.timer import SimulationClock
+from simulator.rules.rules import Arbitrator, Decisions
+from simulator.game_logic import Physics
+from simulator.objects.world_state import interpolate_poses
+from simulator.adaptive import AdaptiveTimestep, PhysicsEvent
+from simulator.integrators import make_integrator
+from simulator.intelligence.core.interface import ControlInterface
+from data.objects.logs import *
+from ui.interface_config import *
+from dataclasses import dataclass
+import numpy as np
+
+
+@dataclass
+class EngineSnapshot:
+    '''
+        Cópia compacta do estado do motor, feita de arrays e tuplas (sem objetos de colisão,
+        imagens ou o grafo de objetos). Criada por SimulationEngine.snapshot().
+    '''
+    world: dict                 # Arrays do WorldState
+    bots: np.ndarray            # get_control_state() de cada robô (velocidades de controle e PIDs)
+    ball_impulse: np.ndarray
+    ball_speed: float
+    clock: tuple
+    score: tuple
+    steps: int
+    is_started: bool
+    is_finished: bool
+    accumulator: float
+    previous_poses: np.ndarray
+    contact_impulses: dict      # Impulsos do warm starting do ContactSolver (None no resolvedor "pairwise")
+
+
+class SimulationEngine:
+    '''
+        Motor de simulação headless: monta o mundo (campo, bola, times, física e árbitro)
+        e avança a partida passo a passo, sem depender de QTimer, SimulatorWidget ou de um
+        loop de eventos do Qt. A velocidade é limitada apenas pela CPU.
+
+        O Simulator da interface gráfica é apenas um invólucro sobre este motor.
+    '''
+    def __init__(self, dt: float = PHYSICS_DT, party_time: float = TIMER_PARTY, load_images: bool = False, log_manager: LogManager = None):
+        '''
+        Inicializa o motor e cria os objetos da simulação.
+
+        :param dt (float): Passo de tempo da física em segundos.
+
+        :param party_time (float): Duração da partida em segundos.
+
+        :param load_images (bool): Carrega as imagens do pygame dos objetos (exige display inicializado).
+
+        :param log_manager (LogManager): Gerenciador de logs opcional.
+        '''
+        self.dt = float(dt)
+        self.party_time = party_time
+        self.load_images = load_images
+        self.log_manager = log_manager
+
+        # Objetos da simulação
+        self.field:     Field = None
+        self.ball:      Ball  = None
+        self.allies:    Team  = None
+        self.enemies:   Team  = None
+        self.bots = []
+
+        # Física, cronômetro (em tempo simulado) e árbitro
+        self.physics:    Physics    = None
+        self.cronometer: SimulationClock = None
+        self.arbitrator: Arbitrator = None
+
+        # Passo adaptativo (run_adaptive) e eventos localizados por ele
+        self.adaptive = ADAPTIVE_TIMESTEP
+        self.adaptive_stepper: AdaptiveTimestep = None
+        self.events: list[PhysicsEvent] = []
+
+        # Interface de controle dos robôs
+        self._control_strategy: ControlInterface = None
+
+        # Estados do motor
+        self.steps = 0              # Quantidade de passos de física executados
+        self.is_started = False     # Partida iniciada
+        self.is_finished = False    # Partida finalizada pelo árbitro
+
+        # Acumulador de passo fixo e poses do passo anterior para interpolação no desenho
+        self._accumulator = 0.0
+        self._previous_poses = None
+
+        self.create_objects()
+
+    # =============================|Construtores|============================
+    def create_objects(self):
+        '''
+            Cria os objetos da simulação na posição inicial padrão.
+        '''
+        self.field = Field()
+        self.ball = Ball(XVBALL_INIT, YVBALL_INIT, field=self.field, radius=BALL_RADIUS_CM, load_image=self.load_images)
+        self.allies = Team(blue_team_positions, BLUE_TEAM, initial_angle=0, load_images=self.load_images)
+        self.enemies = Team(red_team_positions, RED_TEAM, initial_angle=180, load_images=self.load_images)
+        self.bots = self.allies.robots + self.enemies.robots
+
+        self.cronometer = SimulationClock(self.party_time)
+        self.physics = Physics(
+            allies=self.allies,
+            enemies=self.enemies,
+            ball=self.ball,
+            dt=self.dt,
+            field=self.field,
+            screen=None
+        )
+        self.arbitrator = Arbitrator(self.ball, self.field, self.allies, self.enemies, None, self.cronometer)
+        self.adaptive_stepper = AdaptiveTimestep(self.physics, self.field)
+        self._previous_poses = self.get_poses()
+
+    # =============================|GETTERS E SETTERS|==============================
+    def set_dt(self, dt: float):
+        '''
+            Define o passo de tempo da física.
+
+            :param dt (float): Passo de tempo em segundos.
+        '''
+        self.dt = float(dt)
+        if self.physics:
+            self.physics.dt = self.dt
+            self.physics.collision_manager.dt = self.dt
+
+    def set_party_time(self, party_time: float):
+        '''
+            Define a duração da partida em segundos.
+        '''
+        self.party_time = party_time
+        self.cronometer.set_duration(party_time)
+
+    def set_control_strategy(self, strategy: ControlInterface):
+        '''
+            Define a estratégia de controle chamada a cada passo da simulação.
+
+            :param strategy (ControlInterface): Estratégia de controle dos robôs.
+        '''
+        self._control_strategy = strategy
+        if strategy is not None:
+            strategy.initialize(self)
+
+    # =============================|FUNÇÕES PRINCIPAIS|============================
+    def start(self):
+        '''
+            Inicia a partida (cronômetro e passos de física).
+        '''
+        if not self.is_started:
+            self.is_started = True
+            self.is_finished = False
+            self.cronometer.start()
+
+    def pause(self):
+        '''
+            Pausa o cronômetro da partida.
+        '''
+        self.cronometer.pause()
+
+    def resume(self):
+        '''
+            Retoma o cronômetro da partida.
+        '''
+        self.cronometer.resume()
+
+    def reset(self):
+        '''
+            Recoloca bola e robôs nas posições iniciais, zera placar, cronômetro e contadores.
+            Os objetos não são recriados, o que torna o reset barato para execuções em lote.
+        '''
+        self.ball.reset_position()
+        self.allies.reset_positions()
+        self.enemies.reset_positions()
+
+        self.arbitrator.ally_pontuation = 0
+        self.arbitrator.enemy_pontuation = 0
+        self.cronometer.reset()
+
+        self.steps = 0
+        self.is_started = False
+        self.is_finished = False
+        self.events = []
+        self.adaptive_stepper.touching.clear()
+        if self.physics.collision_manager.contact_solver is not None:
+            self.physics.collision_manager.contact_solver.reset()
+
+        self._accumulator = 0.0
+        self._previous_poses = self.get_poses()
+
+    def step(self, n: int = 1):
+        '''
+            Avança a simulação em n passos de física.
+
+            :param n (int): Quantidade de passos.
+
+            :return: Lista com as decisões do árbitro ocorridas nesses passos.
+        '''
+        if not self.is_started:
+            self.start()
+
+        decisions = []
+        for i in range(n):
+            if self.is_finished:
+                break
+
+            # Guarda as poses antes do último passo para a interpolação do desenho
+            if i == n - 1:
+                self._previous_poses = self.get_poses()
+
+            # Aciona a interface de controle
+            if self._control_strategy is not None:
+                self._control_strategy.update(self, self.dt)
+
+            # Atualiza física e lógica do jogo
+            self.physics.update()
+            self.cronometer.tick(self.dt)
+            self.steps += 1
+
+            # Verifica situação do jogo
+            self._arbitrate(decisions)
+
+        # Após reposicionamentos do árbitro não há o que interpolar
+        if decisions:
+            self._previous_poses = self.get_poses()
+
+        return decisions
+
+    def _arbitrate(self, decisions: list):
+        '''
+            Consulta o árbitro após um passo de física e repassa a decisão para a estratégia.
+
+            :param decisions (list): Lista onde a decisão, se houver, é acrescentada.
+        '''
+        decision = self.arbitrator.analyzer()
+        if decision is not None:
+            decisions.append(decision)
+            if self._control_strategy is not None:
+                self._control_strategy.on_event(self, decision.name, self.get_score())
+            if decision == Decisions.FINISH:
+                self.is_finished = True
+
+    def advance(self, frame_time: float, max_steps: int = None):
+        '''
+            Acumulador de passo fixo: soma o tempo do quadro e executa quantos passos de
+            física de tamanho dt couberem nele. A sobra fica para o próximo quadro e define
+            o fator de interpolação usado no desenho.
+
+            :param frame_time (float): Tempo a simular neste quadro (já multiplicado pela velocidade).
+
+            :param max_steps (int): Limite opcional de passos por chamada.
+
+            :return: Lista com as decisões do árbitro ocorridas nesses passos.
+        '''
+        self._accumulator += frame_time
+        steps = int(self._accumulator / self.dt)
+        if max_steps is not None and steps > max_steps:
+            # Descarta o atraso: melhor ficar mais lento que o pedido do que travar
+            steps = max_steps
+            self._accumulator = steps * self.dt
+        self._accumulator -= steps * self.dt
+
+        if steps == 0:
+            return []
+        return self.step(steps)
+
+    def run(self, duration: float):
+        '''
+            Avança a simulação pelo tempo simulado informado (em segundos).
+
+            :param duration (float): Tempo simulado em segundos.
+
+            :return: Lista com as decisões do árbitro ocorridas no período.
+        '''
+        if self.adaptive:
+            return self.run_adaptive(duration)
+        return self.step(max(1, int(round(duration / self.dt))))
+
+    def run_adaptive(self, duration: float):
+        '''
+            Avança a simulação pelo tempo simulado informado com passo adaptativo (ver
+            simulator/adaptive.py): longo com os corpos longe e lentos, curto perto de impactos e
+            da linha do gol. Impactos e gols entram em self.events (e no log) no tempo exato.
+
+            O amortecimento do integrador legado é por passo, então com INTEGRATOR = "legacy" os
+            passos variáveis usam ADAPTIVE_INTEGRATOR. Os passos fixos (robôs em contato, ver
+            AdaptiveTimestep.fixed_step) de tamanho igual ao dt do motor usam o integrador configurado,
+            como o passo fixo comum.
+
+            :param duration (float): Tempo simulado em segundos.
+
+            :return: Lista com as decisões do árbitro ocorridas no período.
+        '''
+        if not self.is_started:
+            self.start()
+
+        physics, stepper = self.physics, self.adaptive_stepper
+        integrator = physics.integrator
+        variable_integrator = integrator if integrator is not None else make_integrator(ADAPTIVE_INTEGRATOR)
+
+        decisions = []
+        remaining = float(duration)
+        try:
+            while remaining > 1e-9 and not self.is_finished:
+                dt = min(stepper.next_dt(), remaining)
+                physics.integrator = integrator if stepper.fixed_step and dt == self.dt else variable_integrator
+                self._previous_poses = self.get_poses()
+
+                if self._control_strategy is not None:
+                    self._control_strategy.update(self, dt)
+
+                physics.dt = physics.collision_manager.dt = dt
+                start_time = self.cronometer.get_elapsed()
+                physics.update()
+                self.cronometer.tick(dt)
+                self.steps += 1
+                remaining -= dt
+
+                # Eventos antes do árbitro, que reposiciona a bola depois de um gol
+                for event in stepper.localize_events(start_time, dt):
+                    self.events.append(event)
+                    self.log(f"[Física]: {event.kind} {' x '.join(event.bodies)} em t={event.time:.5f}s "
+                             f"({event.speed:.1f} cm/s)", LogType.DEBUG)
+
+                self._arbitrate(decisions)
+        finally:
+            physics.dt = physics.collision_manager.dt = self.dt
+            physics.integrator = integrator
+
+        if decisions:
+            self._previous_poses = self.get_poses()
+        return decisions
+
+    # =============================|SNAPSHOT|============================
+    def snapshot(self) -> EngineSnapshot:
+        '''
+            Guarda o estado completo da simulação (robôs, bola, PIDs, cronômetro, placar e
+            contadores) para ramificar simulações, ex: avaliar um chute e voltar.
+            A estratégia de controle guarda o próprio estado e não entra no snapshot.
+        '''
+        ball = self.ball
+        solver = self.physics.collision_manager.contact_solver
+        return EngineSnapshot(
+            world=self.physics.world.snapshot(),
+            bots=np.array([bot.get_control_state() for bot in self.bots]),
+            ball_impulse=None if ball.impulse is None else np.array(ball.impulse, dtype=float),
+            ball_speed=getattr(ball, "speed", 0.0),
+            clock=self.cronometer.get_state(),
+            score=(self.arbitrator.ally_pontuation, self.arbitrator.enemy_pontuation),
+            steps=self.steps,
+            is_started=self.is_started,
+            is_finished=self.is_finished,
+            accumulator=self._accumulator,
+            previous_poses=self._previous_poses.copy(),
+            contact_impulses=None if solver is None else solver.get_state(),
+        )
+
+    def restore(self, snapshot: EngineSnapshot):
+        '''
+            Volta ao estado guardado por snapshot(). O mesmo snapshot pode ser restaurado várias vezes.
+        '''
+        self.physics.world.restore(snapshot.world)
+        for bot, state in zip(self.bots, snapshot.bots):
+            bot.set_control_state(state)
+
+        ball = self.ball
+        ball.impulse = None if snapshot.ball_impulse is None else snapshot.ball_impulse.copy()
+        ball.speed = snapshot.ball_speed
+        ball.collision_object.x, ball.collision_object.y = ball.position
+
+        self.cronometer.set_state(snapshot.clock)
+        self.arbitrator.ally_pontuation, self.arbitrator.enemy_pontuation = snapshot.score
+        self.steps = snapshot.steps
+        self.is_started = snapshot.is_started
+        self.is_finished = snapshot.is_finished
+        self._accumulator = snapshot.accumulator
+        self._previous_poses = snapshot.previous_poses.copy()
+
+        solver = self.physics.collision_manager.contact_solver
+        if solver is not None:
+            # Snapshot de outro resolvedor não tem impulsos: começa sem warm starting
+            if snapshot.contact_impulses is None:
+                solver.reset()
+            else:
+                solver.set_state(snapshot.contact_impulses)
+
+    # =============================|LEITURA DE ESTADO|============================
+    def get_poses(self):
+        '''
+            Retorna as poses atuais [x, y, ângulo] da bola (linha 0) e dos robôs (linhas seguintes).
+        '''
+        return self.physics.world.get_poses()
+
+    def get_interpolated_poses(self, alpha: float = None):
+        '''
+            Retorna as poses interpoladas entre os dois últimos estados da física, para
+            desenhar em qualquer FPS sem saltos.
+
+            :param alpha (float): Fator de interpolação em [0, 1]. Se None, usa a sobra do acumulador.
+        '''
+        if alpha is None:
+            alpha = min(1.0, self._accumulator / self.dt)
+        return interpolate_poses(self._previous_poses, self.get_poses(), alpha)
+
+    def get_score(self):
+        '''
+            Retorna o placar atual no formato {'ally': int, 'enemy': int}.
+        '''
+        return {'ally': self.arbitrator.ally_pontuation, 'enemy': self.arbitrator.enemy_pontuation}
+
+    def get_state(self):
+        '''
+            Retorna uma cópia do estado atual do mundo, independente dos objetos internos.
+        '''
+        def bot_state(bot):
+            return {
+                'position': bot.position.copy(),
+                'angle': float(bot.angle),
+                'velocity': bot.velocity.copy(),
+                'angular_velocity': float(bot.angular_velocity),
+                'wheels': (float(bot.v_l), float(bot.v_r)),
+            }
+
+        return {
+            'steps': self.steps,
+            'time': self.cronometer.get_elapsed(),
+            'time_left': self.cronometer.get_time_left(),
+            'score': self.get_score(),
+            'ball': {
+                'position': self.ball.position.copy(),
+                'velocity': self.ball.velocity.copy(),
+            },
+            'allies':  [bot_state(bot) for bot in self.allies.robots],
+            'enemies': [bot_state(bot) for bot in self.enemies.robots],
+            'physics': self.physics.get_stats(),
+        }
+
+    # ================================ | Método para Log | ===========================
+    def log(self, message: str, type: LogType = LogType.INFO, system: LogSystem = LogSystem.SIMULATION, priority: LogPriority = LogPriority.MEDIUM):
+        if self.log_manager:
+            self.log_manager.add_log(Log(type, priority, message, system))
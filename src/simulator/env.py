@@ -0,0 +1,138 @@
+#Ambiente no estilo Gym para aprendizado por reforço
+from simulator.engine import SimulationEngine
+from simulator.rules.rules import Decisions
+from ui.interface_config import *
+import numpy as np
+
+
+class FoxSimEnv:
+    '''
+        Ambiente no estilo Gym sobre o motor headless (Physics + Arbitrator), com reset() e step(actions).
+        Não importa Qt nem pygame, para que os processos de treino iniciem rápido e fiquem leves.
+
+        - Ação: velocidades das rodas [v_l, v_r] dos 3 robôs do time controlado, formato (3, 2) em cm/s.
+        - Observação: array float32 pré-alocado, reescrito a cada passo (copie se precisar guardar):
+            [bola x, y, vx, vy] seguido de [x, y, cos θ, sin θ, vx, vy, ω] para cada robô,
+            primeiro os do time controlado e depois os adversários, em coordenadas globais (cm).
+        - Recompensa e fim de episódio vêm das Decisions do árbitro (gols e FINISH).
+    '''
+    BALL_FEATURES = 4
+    BOT_FEATURES = 7
+
+    def __init__(self, team: str = BLUE_TEAM, dt: float = PHYSICS_DT, party_time: float = TIMER_PARTY,
+                 frame_skip: int = ENV_FRAME_SKIP, max_wheel_speed: float = ENV_MAX_WHEEL_SPEED, opponent=None):
+        '''
+        Inicializa o ambiente e o motor de simulação.
+
+        :param team (str): Time controlado pelas ações (BLUE_TEAM ou RED_TEAM).
+
+        :param dt (float): Passo de tempo da física em segundos.
+
+        :param party_time (float): Duração do episódio (partida) em segundos.
+
+        :param frame_skip (int): Passos de física executados por chamada de step().
+
+        :param max_wheel_speed (float): Limite das velocidades das rodas aplicadas.
+
+        :param opponent (callable): Política opcional do adversário, opponent(env) -> ações (3, 2). Se None, fica parado.
+        '''
+        self.team = team
+        self.frame_skip = frame_skip
+        self.max_wheel_speed = max_wheel_speed
+        self.opponent = opponent
+
+        self.engine = SimulationEngine(dt=dt, party_time=party_time)
+        world = self.engine.physics.world
+
+        # Robôs controlados e adversários, e as linhas correspondentes no WorldState
+        allies, enemies = self.engine.allies.robots, self.engine.enemies.robots
+        if team == RED_TEAM:
+            allies, enemies = enemies, allies
+        self.controlled_bots = allies
+        self.opponent_bots = enemies
+        self._bot_rows = np.array([bot.world_index for bot in allies + enemies])
+
+        # Gol a favor e gol contra do time controlado
+        ally_goal = Decisions.ALLY_GOAL if team == BLUE_TEAM else Decisions.ENEMY_GOAL
+        enemy_goal = Decisions.ENEMY_GOAL if team == BLUE_TEAM else Decisions.ALLY_GOAL
+        self._rewards = {ally_goal: ENV_GOAL_REWARD, enemy_goal: -ENV_GOAL_REWARD}
+
+        # Placar do episódio contado pelas decisões (o árbitro zera o seu ao fim da partida)
+        self._score = {'ally': 0, 'enemy': 0}
+
+        # Buffer de observação e visões para cada bloco
+        n_bots = len(self._bot_rows)
+        self.observation_size = self.BALL_FEATURES + n_bots * self.BOT_FEATURES
+        self._observation = np.zeros(self.observation_size, dtype=np.float32)
+        self._ball_obs = self._observation[:self.BALL_FEATURES]
+        self._bots_obs = self._observation[self.BALL_FEATURES:].reshape(n_bots, self.BOT_FEATURES)
+        self._world = world
+
+        self.action_shape = (len(self.controlled_bots), 2)
+
+    # =============================|API|============================
+    def reset(self):
+        '''
+            Reinicia a partida.
+
+            :return: Tupla (observation, info).
+        '''
+        self.engine.reset()
+        self.engine.start()
+        self._score = {'ally': 0, 'enemy': 0}
+        return self._write_observation(), {'score': dict(self._score)}
+
+    def step(self, actions):
+        '''
+            Aplica as velocidades das rodas e avança frame_skip passos de física.
+
+            :param actions (array): Velocidades [v_l, v_r] dos robôs controlados, formato (3, 2).
+
+            :return: Tupla (observation, reward, terminated, truncated, info).
+        '''
+        self._apply_actions(self.controlled_bots, actions)
+        if self.opponent is not None:
+            self._apply_actions(self.opponent_bots, self.opponent(self))
+
+        decisions = self.engine.step(self.frame_skip)
+
+        reward = 0.0
+        for decision in decisions:
+            reward += self._rewards.get(decision, 0.0)
+            if decision == Decisions.ALLY_GOAL:
+                self._score['ally'] += 1
+            elif decision == Decisions.ENEMY_GOAL:
+                self._score['enemy'] += 1
+        terminated = self.engine.is_finished
+
+        info = {'score': dict(self._score), 'decisions': decisions}
+        return self._write_observation(), reward, terminated, False, info
+
+    # =============================|Auxiliares|============================
+    def _apply_actions(self, bots, actions):
+        '''
+            Limita e aplica as velocidades das rodas aos robôs informados.
+        '''
+        actions = np.clip(np.asarray(actions, dtype=float).reshape(len(bots), 2), -self.max_wheel_speed, self.max_wheel_speed)
+        for bot, (v_l, v_r) in zip(bots, actions):
+            bot.set_wheel_speeds(v_l, v_r)
+
+    def _write_observation(self):
+        '''
+            Escreve o estado atual no buffer de observação, direto dos arrays do WorldState.
+        '''
+        world = self._world
+        rows = self._bot_rows
+        ball = self.engine.physics.ball_index
+
+        self._ball_obs[0:2] = world.positions[ball]
+        self._ball_obs[2:4] = world.velocities[ball]
+
+        bots = self._bots_obs
+        angles = world.angles[rows]
+        bots[:, 0:2] = world.positions[rows]
+        bots[:, 2] = np.cos(angles)
+        bots[:, 3] = np.sin(angles)
+        bots[:, 4:6] = world.velocities[rows]
+        bots[:, 6] = world.angular_velocities[rows]
+        return self._observation
@@ -3,6 +3,9 @@ from simulator.objects.field import Field
 from simulator.objects.ball import Ball 
 from simulator.objects.robot import Robot 
 from simulator.objects.team import Team
+from simulator.objects.world_state import WorldState
+from simulator import kernels
+from simulator.integrators import make_integrator, integrate_robots, integrate_ball
 from simulator.rules.rules  import *
 import numpy as np
 
@@ -28,6 +31,22 @@ class Physics:
         #Lista de todos os robôs
         self.bots = self.allies + self.enemies 
 
+        # Estado do mundo em arrays contíguos: linha 0 é a bola e as seguintes são os robôs.
+        # Bola e robôs passam a ler e escrever diretamente nessas linhas.
+        self.world = WorldState.from_bodies(self.moving_objects)
+        self.ball_index = 0
+        self.bot_indices = np.arange(1, len(self.moving_objects))
+
+        # Corpos dormindo (ver update_sleep)
+        self.sleeping_bodies = SLEEPING_BODIES
+
+        # Integração dos robôs em lote (o Robot.move por robô fica para depuração)
+        self.batch_integration = BATCH_INTEGRATION
+        self.bot_wheel_distances = np.array([bot.distance_wheels for bot in self.bots], dtype=float)
+
+        # Integrador do modelo contínuo (None = integração legada, ver set_integrator)
+        self.integrator = make_integrator(INTEGRATOR)
+
         # Lista de todos objetos de colisão do sistema (móveis + estrutura do campo)
         self.all_collision_objects = [obj.collision_object for obj in self.moving_objects]
         self.all_collision_objects.append(self.field.collision_object)
@@ -35,14 +54,26 @@ class Physics:
         # Gerenciador de colisões (com Spatial Hashing e SAT)
         self.collision_manager = CollisionManagerSAT(cell_size=CELL_SIZE, screen=self.screen, dt=self.dt)
 
+        # O campo não se move: as paredes são testadas pela SDF pré-calculada do campo
+        # ou, sem ela, entram uma única vez no grid estático
+        if FIELD_SDF_COLLISIONS:
+            self.collision_manager.set_field_sdf(self.field.sdf, self.field.collision_object, self.field.post_objects)
+        else:
+            self.collision_manager.add_static_object(self.field.collision_object)
+
     # ===============================================================
 
     def update(self):
         '''
             Atualiza o estado físico da simulação a cada frame:
+            - Acorda corpos dormindo que receberam velocidade ou comando.
             - Detecta e resolve colisões.
             - Atualiza posições da bola e dos robôs.
+            - Põe para dormir os corpos parados.
         '''
+        if self.sleeping_bodies:
+            self.wake_moving_bodies()
+
         #Verifica colisões e física
         self.check_collisions()
 
@@ -51,6 +82,9 @@ class Physics:
 
         #Atualiza posição dos robôs
         self.update_bots()
+
+        if self.sleeping_bodies:
+            self.update_sleep()
     
     # ===============================================================
     def check_collisions(self):
@@ -63,16 +97,144 @@ class Physics:
         '''
             Atualiza os robôs aliados e inimigos com base nas velocidades das rodas.
         '''
-        #Atualiza posição dos robôs
+        if self.batch_integration or self.integrator is not None:
+            self._move_bots_batched()
+            return
+
+        #Atualiza posição dos robôs (os dormindo ficam parados)
         for bot in self.bots:
-            bot.move(self.dt)
+            if not bot.is_sleeping:
+                bot.move(self.dt)
+
+    def _move_bots_batched(self):
+        '''
+            Mesma integração do Robot.move para todos os robôs acordados de uma vez, direto nos
+            arrays do WorldState: força das rodas, velocidades, pose, direção e amortecimento.
+            Com um integrador do modelo contínuo (self.integrator), o passo é o de integrate_robots.
+            Depois só as poses dos objetos de colisão são sincronizadas robô a robô.
+        '''
+        world, dt = self.world, self.dt
+        awake = world.sleeping[self.bot_indices] == 0
+        indices = self.bot_indices[awake]
+        if len(indices) == 0:
+            return
+        # Robôs ocupam linhas contíguas: com todos acordados, fatias (visões) em vez de índices
+        rows = slice(indices[0], indices[-1] + 1) if awake.all() else indices
+
+        if self.integrator is not None:
+            integrate_robots(self.integrator, world, rows, self.bot_wheel_distances[awake], dt)
+        elif kernels.ENABLED:
+            kernels.robots_move_batch(world.positions, world.previous_positions, world.velocities, world.forces,
+                                      world.directions, world.angles, world.angular_velocities, world.torques,
+                                      world.wheel_speeds, world.masses, world.inertias,
+                                      self.bot_wheel_distances[awake], indices, dt)
+        else:
+            world.previous_positions[rows] = world.positions[rows]
+            mass = world.masses[rows]
+
+            # 1. Força das rodas e 2. acumula força e torque do controle
+            left_force = world.wheel_speeds[rows, 0] * mass
+            right_force = world.wheel_speeds[rows, 1] * mass
+            forces = world.forces[rows] + world.directions[rows] * ((left_force + right_force) / 2)[:, None]
+            torques = world.torques[rows] + (right_force - left_force) * self.bot_wheel_distances[awake] / 2
+
+            # 3. Integra aceleração linear e angular
+            velocities = world.velocities[rows] + forces / mass[:, None] * dt
+            angular_velocities = world.angular_velocities[rows] + (torques / world.inertias[rows]) * dt
+
+            # 4. Atualiza posição e rotação e 5. direção
+            world.positions[rows] += velocities * dt
+            angles = (world.angles[rows] + angular_velocities * dt) % (2 * np.pi)
+            world.angles[rows] = angles
+            world.directions[rows, 0] = np.cos(angles)
+            world.directions[rows, 1] = np.sin(angles)
+
+            # 6. Amortecimento (atrito com o solo)
+            world.velocities[rows] = velocities * (1 - 0.01)
+            world.angular_velocities[rows] = angular_velocities * (1 - 0.05)
+
+            # 8. Reseta acumuladores
+            world.forces[rows] = 0.0
+            world.torques[rows] = 0.0
+
+        # 7. Sincroniza colisão
+        degrees = np.degrees(np.arctan2(world.directions[rows, 1], world.directions[rows, 0])).tolist()
+        for index, x, y, angle in zip(indices.tolist(), world.positions[rows, 0].tolist(), world.positions[rows, 1].tolist(), degrees):
+            collision_object = world.bodies[index].collision_object
+            collision_object.x, collision_object.y, collision_object.angle = x, y, angle
 
 
     def update_ball(self):
         '''
             Atualizo a posição da bola na interface.
         '''
-        self.ball.update_position(self.dt)
+        if self.ball.is_sleeping:
+            return
+        # Com o rolamento em forma fechada ligado, o voo livre da bola é exato (Ball.roll)
+        if self.integrator is not None and not (self.ball.analytic_rolling and self.ball.in_free_flight):
+            integrate_ball(self.integrator, self.ball, self.dt)
+        else:
+            self.ball.update_position(self.dt)
+
+    def set_integrator(self, name: str):
+        '''
+            Troca o integrador da física.
+
+            :param name (str): "legacy", "semi_implicit_euler", "verlet" ou "rk4".
+        '''
+        self.integrator = make_integrator(name)
+
+    # =============================|CORPOS DORMINDO|============================
+    def wake_moving_bodies(self):
+        '''
+            Acorda os corpos dormindo que ganharam velocidade, força ou comando de roda desde o
+            último passo (ex: bola chutada ou velocidade escrita direto no WorldState).
+        '''
+        world = self.world
+        sleeping = world.sleeping > 0
+        if not sleeping.any():
+            return
+        active = (world.velocities != 0).any(axis=1) | (world.forces != 0).any(axis=1) | (world.wheel_speeds != 0).any(axis=1)
+        # A rotação da bola é de rolamento: só a dos robôs conta
+        active[self.bot_indices] |= world.angular_velocities[self.bot_indices] != 0
+        active[self.ball_index] |= self.ball.impulse is not None
+
+        woken = sleeping & active
+        world.sleeping[woken] = 0.0
+        world.sleep_frames[woken] = 0.0
+
+    def update_sleep(self):
+        '''
+            Conta os passos seguidos em repouso de cada corpo (velocidades abaixo de
+            SLEEP_LINEAR_VELOCITY / SLEEP_ANGULAR_VELOCITY e rodas paradas). Depois de SLEEP_FRAMES
+            passos o corpo dorme: fica com velocidade nula e sai da fase estreita e da integração
+            até ser tocado por um corpo acordado ou receber comando de roda.
+        '''
+        world = self.world
+        speed = np.hypot(world.velocities[:, 0], world.velocities[:, 1])
+        resting = (speed < SLEEP_LINEAR_VELOCITY) & (world.wheel_speeds == 0).all(axis=1)
+        resting[self.bot_indices] &= np.abs(world.angular_velocities[self.bot_indices]) < SLEEP_ANGULAR_VELOCITY
+
+        world.sleep_frames[:] = np.where(resting, world.sleep_frames + 1, 0.0)
+        asleep = world.sleep_frames >= SLEEP_FRAMES
+        world.sleeping[:] = asleep
+        world.velocities[asleep] = 0.0
+        asleep[self.ball_index] = False
+        world.angular_velocities[asleep] = 0.0
+
+    def get_stats(self):
+        '''
+            Estatísticas da física no último passo.
+
+            :return: Dicionário com a quantidade de corpos, de corpos dormindo e de colisões resolvidas.
+        '''
+        sleeping = int(np.count_nonzero(self.world.sleeping))
+        return {
+            'bodies': self.world.n_bodies,
+            'sleeping_bodies': sleeping,
+            'awake_bodies': self.world.n_bodies - sleeping,
+            'contacts': self.collision_manager.contact_count,
+        }
 
     def set_physics(self):
         '''
@@ -0,0 +1,190 @@
+#Integradores numéricos da física (modelo contínuo dos robôs e da bola)
+'''
+    Estratégias de integração escolhidas por INTEGRATOR (ou Physics.set_integrator).
+
+    "legacy" é o caminho original (Robot.move / Ball.update_position), com amortecimento aplicado
+    como uma fração fixa por passo: o resultado depende do dt. Os integradores deste módulo usam
+    o modelo contínuo equivalente, com taxas por segundo, e convergem para a mesma trajetória
+    quando o dt diminui:
+
+    - Robô:  x = [px, py, θ], v = [vx, vy, ω]
+             a = [v_médio * direção(θ) + F/m - c_lin * v,  τ_rodas/I + τ/I - c_ang * ω]
+    - Bola:  x = [px, py], v = [vx, vy]
+             a = F/m - BALL_ROLLING_DECELERATION * v/|v|   (para, sem inverter, ao zerar a velocidade)
+
+    Comandos de roda, forças e torques acumulados ficam constantes durante o passo.
+    A comparação de precisão e desempenho está em data/testes/integrators_benchmark.py.
+'''
+from ui.interface_config import *
+import numpy as np
+
+
+# =============================|Integradores|============================
+class Integrator:
+    '''
+        Integra um sistema de segunda ordem x'' = a(x, v) por um passo dt. x e v têm o mesmo
+        formato, com uma linha por corpo.
+    '''
+    name = None
+    evaluations = 0     # Avaliações da aceleração por passo
+
+    def step(self, x, v, acceleration, dt):
+        '''
+            :param x (array): Posições generalizadas no início do passo.
+
+            :param v (array): Velocidades no início do passo.
+
+            :param acceleration (callable): a(x, v), com o formato de v.
+
+            :param dt (float): Passo de tempo (s).
+
+            :return: Tupla (x, v) no fim do passo (arrays novos).
+        '''
+        raise NotImplementedError
+
+
+class SemiImplicitEuler(Integrator):
+    '''
+        Euler semi-implícito (simplético): atualiza a velocidade e depois a posição com a velocidade nova.
+    '''
+    name = "semi_implicit_euler"
+    evaluations = 1
+
+    def step(self, x, v, acceleration, dt):
+        v = v + acceleration(x, v) * dt
+        return x + v * dt, v
+
+
+class VelocityVerlet(Integrator):
+    '''
+        Velocity Verlet: posição com a aceleração do início do passo e velocidade com a média das
+        acelerações do início e do fim (a do fim avaliada com a meia velocidade, já que o
+        amortecimento depende da velocidade).
+    '''
+    name = "verlet"
+    evaluations = 2
+
+    def step(self, x, v, acceleration, dt):
+        a0 = acceleration(x, v)
+        x = x + v * dt + 0.5 * a0 * dt * dt
+        half = v + 0.5 * a0 * dt
+        return x, half + 0.5 * acceleration(x, half) * dt
+
+
+class RungeKutta4(Integrator):
+    '''
+        Runge-Kutta clássico de 4ª ordem sobre o par (x, v).
+    '''
+    name = "rk4"
+    evaluations = 4
+
+    def step(self, x, v, acceleration, dt):
+        k1x, k1v = v, acceleration(x, v)
+        k2x = v + 0.5 * dt * k1v
+        k2v = acceleration(x + 0.5 * dt * k1x, k2x)
+        k3x = v + 0.5 * dt * k2v
+        k3v = acceleration(x + 0.5 * dt * k2x, k3x)
+        k4x = v + dt * k3v
+        k4v = acceleration(x + dt * k3x, k4x)
+        return (x + dt / 6 * (k1x + 2 * k2x + 2 * k3x + k4x),
+                v + dt / 6 * (k1v + 2 * k2v + 2 * k3v + k4v))
+
+
+INTEGRATORS = {integrator.name: integrator for integrator in (SemiImplicitEuler, VelocityVerlet, RungeKutta4)}
+
+
+def make_integrator(name: str = INTEGRATOR):
+    '''
+        :param name (str): "legacy" ou uma das chaves de INTEGRATORS.
+
+        :return: Instância do integrador, ou None para "legacy".
+    '''
+    if name == "legacy":
+        return None
+    if name not in INTEGRATORS:
+        raise ValueError(f"Integrador desconhecido: {name}")
+    return INTEGRATORS[name]()
+
+
+# =============================|Modelo contínuo|============================
+def integrate_robots(integrator: Integrator, world, rows, wheel_distances, dt: float):
+    '''
+        Avança os robôs das linhas rows do WorldState com o modelo contínuo e zera os acumuladores.
+
+        :param world (WorldState): Estado do mundo.
+
+        :param rows (slice | array): Linhas dos robôs a integrar.
+
+        :param wheel_distances (array): Distância entre as rodas de cada robô (cm).
+
+        :param dt (float): Passo de tempo (s).
+    '''
+    mass = world.masses[rows]
+    inertia = world.inertias[rows]
+    v_l, v_r = world.wheel_speeds[rows, 0], world.wheel_speeds[rows, 1]
+
+    # Força das rodas por massa (F = v_médio * m no Robot.move) e acelerações constantes no passo
+    drive = (v_l + v_r) / 2
+    external = world.forces[rows] / mass[:, None]
+    angular = ((v_r - v_l) * mass * wheel_distances / 2 + world.torques[rows]) / inertia
+
+    def acceleration(x, v):
+        a = np.empty_like(v)
+        a[:, 0] = drive * np.cos(x[:, 2]) + external[:, 0] - ROBOT_LINEAR_DAMPING_RATE * v[:, 0]
+        a[:, 1] = drive * np.sin(x[:, 2]) + external[:, 1] - ROBOT_LINEAR_DAMPING_RATE * v[:, 1]
+        a[:, 2] = angular - ROBOT_ANGULAR_DAMPING_RATE * v[:, 2]
+        return a
+
+    x = np.column_stack((world.positions[rows], world.angles[rows]))
+    v = np.column_stack((world.velocities[rows], world.angular_velocities[rows]))
+    x, v = integrator.step(x, v, acceleration, dt)
+
+    world.previous_positions[rows] = world.positions[rows]
+    world.positions[rows] = x[:, :2]
+    angles = x[:, 2] % (2 * np.pi)
+    world.angles[rows] = angles
+    world.directions[rows, 0] = np.cos(angles)
+    world.directions[rows, 1] = np.sin(angles)
+    world.velocities[rows] = v[:, :2]
+    world.angular_velocities[rows] = v[:, 2]
+    world.forces[rows] = 0.0
+    world.torques[rows] = 0.0
+
+
+def integrate_ball(integrator: Integrator, ball, dt: float):
+    '''
+        Avança a bola com o modelo contínuo: impulso pendente aplicado no início, força acumulada
+        constante no passo e resistência ao rolamento contrária à velocidade. Se a resistência
+        inverteria o movimento, a bola para. A rotação segue o rolamento sem deslizar (|v| / raio).
+
+        :param ball (Ball): Bola da partida.
+
+        :param dt (float): Passo de tempo (s).
+    '''
+    ball.dt = dt
+    np.copyto(ball.previous_pos, ball.position)
+
+    velocity = ball.velocity.copy()
+    if ball.impulse is not None:
+        velocity += ball.impulse / ball.mass
+    external = ball.force / ball.mass
+
+    def acceleration(x, v):
+        speed = np.hypot(v[:, 0], v[:, 1])[:, None]
+        direction = np.divide(v, speed, out=np.zeros_like(v), where=speed > 0)
+        return external - direction * BALL_ROLLING_DECELERATION
+
+    x, v = integrator.step(ball.position[None, :], velocity[None, :], acceleration, dt)
+    if np.dot(v[0], velocity) < 0:
+        v[0] = 0.0
+
+    ball.position = x[0]
+    ball.velocity = v[0]
+    speed = float(np.hypot(v[0, 0], v[0, 1]))
+    ball.angular_velocity = speed / ball.radius
+    if speed > 0:
+        ball.direction = v[0] / speed
+
+    ball.force.fill(0.0)
+    ball.impulse = None
+    ball.torque = 0.0
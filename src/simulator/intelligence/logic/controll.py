@@ -64,5 +64,17 @@ class PIDController:
         self.integral = 0.0
         self.prev_error = 0.0 
 
+    def get_state(self):
+        '''
+            Retorna os acumuladores (integral, erro anterior) para snapshots
+        '''
+        return (self.integral, self.prev_error)
+
+    def set_state(self, state):
+        '''
+            Restaura os acumuladores retornados por get_state()
+        '''
+        self.integral, self.prev_error = state
+
 
 # Estratégias de controle por arvore das decisões para cada robô
\ No newline at end of file
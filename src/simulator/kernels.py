@@ -0,0 +1,338 @@
+#Kernels compilados (Numba) das rotinas mais quentes da física, com o caminho NumPy como alternativa
+'''
+    Backend opcional de kernels compilados.
+
+    As funções deste módulo são escritas com floats e laços simples (subconjunto nopython do Numba)
+    e reproduzem o caminho NumPy de cada rotina:
+
+    - sat_rectangles / sat_rectangles_batch  -> CollisionRectangle.check_collision_with_rectangle e batch_sat_rectangles
+    - circle_rectangle                       -> CollisionRectangle.check_collision_with_circle
+    - swept_circle_segment                   -> ContinuousCollisionDetector._swept_circle_segment
+    - robot_move / robots_move_batch         -> Robot.move (integração) e Physics._move_bots_batched
+    - ball_update                            -> Ball.update_position
+
+    O backend é escolhido na importação por KERNEL_BACKEND ("auto" usa Numba se estiver instalado).
+    Sem Numba as funções continuam importáveis como Python puro, mas o simulador segue pelo caminho NumPy.
+    A equivalência entre os dois caminhos é verificada por data/testes/kernels_parity.py.
+'''
+from ui.interface_config import *
+import numpy as np
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        '''
+            Sem Numba: devolve a própria função (mesmo código, interpretado).
+        '''
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+
+BACKEND = "numpy"       # Backend em uso: "numpy" ou "numba"
+ENABLED = False         # True quando o simulador chama os kernels no lugar do caminho NumPy
+
+
+def set_backend(backend: str = KERNEL_BACKEND):
+    '''
+        Escolhe o backend da física.
+
+        :param backend (str): "auto" (Numba se instalado), "numpy" ou "numba".
+
+        :return: Backend efetivamente em uso.
+    '''
+    global BACKEND, ENABLED
+    if backend == "auto":
+        backend = "numba" if NUMBA_AVAILABLE else "numpy"
+    if backend not in ("numpy", "numba"):
+        raise ValueError(f"Backend desconhecido: {backend}")
+    if backend == "numba" and not NUMBA_AVAILABLE:
+        raise ImportError("Backend 'numba' pedido, mas o pacote numba não está instalado")
+
+    BACKEND = backend
+    ENABLED = backend == "numba"
+    return BACKEND
+
+
+# =============================|Colisão|============================
+@njit(cache=True)
+def sat_rectangles(corners1, corners2, x1, y1, x2, y2, min_overlap_mtv):
+    '''
+        SAT entre dois retângulos (cantos (4, 2)). Retorna (colidiu, mtv_x, mtv_y), com o MTV do
+        segundo para o primeiro retângulo.
+    '''
+    min_overlap = np.inf
+    axis_x, axis_y = 0.0, 0.0
+
+    for k in range(8):
+        i = k % 4
+        j = (i + 1) % 4
+        if k < 4:
+            ex, ey = corners1[j, 0] - corners1[i, 0], corners1[j, 1] - corners1[i, 1]
+        else:
+            ex, ey = corners2[j, 0] - corners2[i, 0], corners2[j, 1] - corners2[i, 1]
+        length = math.sqrt(ex * ex + ey * ey)
+        if length == 0:
+            continue
+        nx, ny = -ey / length, ex / length
+
+        min1, max1, min2, max2 = np.inf, -np.inf, np.inf, -np.inf
+        for c in range(4):
+            p1 = corners1[c, 0] * nx + corners1[c, 1] * ny
+            p2 = corners2[c, 0] * nx + corners2[c, 1] * ny
+            min1, max1 = min(min1, p1), max(max1, p1)
+            min2, max2 = min(min2, p2), max(max2, p2)
+
+        if max1 < min2 or max2 < min1:
+            return False, 0.0, 0.0
+
+        overlap = min(max1, max2) - max(min1, min2)
+        if overlap < min_overlap:
+            min_overlap = overlap
+            axis_x, axis_y = nx, ny
+
+    if (x1 - x2) * axis_x + (y1 - y2) * axis_y < 0:
+        axis_x, axis_y = -axis_x, -axis_y
+
+    # Sobreposição muito pequena: direção entre os cantos mais próximos
+    if min_overlap < min_overlap_mtv:
+        best = np.inf
+        alt_x, alt_y = 0.0, 0.0
+        for a in range(4):
+            for b in range(4):
+                dx, dy = corners2[b, 0] - corners1[a, 0], corners2[b, 1] - corners1[a, 1]
+                distance = math.sqrt(dx * dx + dy * dy)
+                if distance < best:
+                    best = distance
+                    alt_x, alt_y = dx, dy
+        if best != 0:
+            axis_x, axis_y = alt_x / best, alt_y / best
+            min_overlap = min_overlap_mtv
+
+    return True, axis_x * min_overlap, axis_y * min_overlap
+
+
+@njit(cache=True)
+def sat_rectangles_batch(corners, centers, first, second, min_overlap_mtv, hit, mtv):
+    '''
+        SAT para os pares (first[p], second[p]) de retângulos, escrevendo em hit (P,) e mtv (P, 2).
+    '''
+    for p in range(first.shape[0]):
+        i, j = first[p], second[p]
+        collided, mtv_x, mtv_y = sat_rectangles(corners[i], corners[j], centers[i, 0], centers[i, 1],
+                                                centers[j, 0], centers[j, 1], min_overlap_mtv)
+        hit[p] = collided
+        mtv[p, 0] = mtv_x
+        mtv[p, 1] = mtv_y
+
+
+@njit(cache=True)
+def circle_rectangle(cx, cy, radius, rx, ry, width, height, angle_degrees):
+    '''
+        Círculo contra retângulo rotacionado. Retorna (colidiu, mtv_x, mtv_y).
+    '''
+    dx, dy = cx - rx, cy - ry
+    angle = -math.radians(angle_degrees)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    local_x = cos_a * dx - sin_a * dy
+    local_y = sin_a * dx + cos_a * dy
+
+    half_w, half_h = width / 2, height / 2
+    closest_x = max(-half_w, min(local_x, half_w))
+    closest_y = max(-half_h, min(local_y, half_h))
+
+    dist_x, dist_y = local_x - closest_x, local_y - closest_y
+    dist_sq = dist_x ** 2 + dist_y ** 2
+    if dist_sq > radius ** 2 + 1e-6:
+        return False, 0.0, 0.0
+
+    if dist_sq < 1e-12:
+        # Centro dentro do retângulo: empurra a partir do canto mais próximo
+        corner_x = half_w if local_x > 0 else -half_w
+        corner_y = half_h if local_y > 0 else -half_h
+        push_x, push_y = local_x - corner_x, local_y - corner_y
+        push_dist = max(math.sqrt(push_x ** 2 + push_y ** 2), 1e-6)
+        local_mtv_x, local_mtv_y = push_x * (radius / push_dist), push_y * (radius / push_dist)
+    else:
+        dist = math.sqrt(dist_sq)
+        penetration = radius - dist
+        if dist > 1e-6:
+            local_mtv_x, local_mtv_y = dist_x * (penetration / dist), dist_y * (penetration / dist)
+        else:
+            local_mtv_x, local_mtv_y = radius, 0.0
+        if dist < radius * 0.1:
+            local_mtv_x, local_mtv_y = local_mtv_x * 1.5, local_mtv_y * 1.5
+
+    mtv_x = cos_a * local_mtv_x - sin_a * local_mtv_y
+    mtv_y = sin_a * local_mtv_x + cos_a * local_mtv_y
+    mtv_norm = math.sqrt(mtv_x * mtv_x + mtv_y * mtv_y)
+    if mtv_norm < 1e-3 or not (math.isfinite(mtv_x) and math.isfinite(mtv_y)):
+        return False, 0.0, 0.0
+
+    min_mtv = radius * 0.01
+    if mtv_norm < min_mtv:
+        mtv_x, mtv_y = mtv_x / mtv_norm * min_mtv, mtv_y / mtv_norm * min_mtv
+    return True, mtv_x, mtv_y
+
+
+@njit(cache=True)
+def _swept_circle_point(cx, cy, radius, mx, my, px, py):
+    fx, fy = cx - px, cy - py
+    a = mx * mx + my * my
+    b = 2.0 * (fx * mx + fy * my)
+    c = fx * fx + fy * fy - radius * radius
+    if c <= 0:
+        return 0.0
+    if a == 0 or b >= 0:
+        return -1.0
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return -1.0
+    t = (-b - math.sqrt(discriminant)) / (2 * a)
+    return t if 0.0 <= t <= 1.0 else -1.0
+
+
+@njit(cache=True)
+def swept_circle_segment(cx, cy, radius, mx, my, ax, ay, bx, by):
+    '''
+        Varredura de um círculo (centro c, movimento m) contra o segmento ab.
+        Retorna (t, normal_x, normal_y), com t = -1 se não houver contato no passo.
+    '''
+    ex, ey = bx - ax, by - ay
+    length = math.hypot(ex, ey)
+    if length == 0:
+        t = _swept_circle_point(cx, cy, radius, mx, my, ax, ay)
+        if t < 0:
+            return -1.0, 0.0, 0.0
+        nx, ny = cx + mx * t - ax, cy + my * t - ay
+    else:
+        nx, ny = -ey / length, ex / length
+        side = (cx - ax) * nx + (cy - ay) * ny
+        if side < 0:
+            nx, ny, side = -nx, -ny, -side
+        approach = -(mx * nx + my * ny)
+        t = -1.0
+        t_line = -1.0
+        if side <= radius:
+            t_line = 0.0
+        elif approach > 0:
+            t_line = (side - radius) / approach
+        if 0.0 <= t_line <= 1.0:
+            along = ((cx + mx * t_line - ax) * ex + (cy + my * t_line - ay) * ey) / (length * length)
+            if 0.0 <= along <= 1.0:
+                t = t_line
+
+        if t < 0:
+            for end in range(2):
+                px, py = (ax, ay) if end == 0 else (bx, by)
+                t_end = _swept_circle_point(cx, cy, radius, mx, my, px, py)
+                if t_end >= 0 and (t < 0 or t_end < t):
+                    t = t_end
+                    nx, ny = cx + mx * t_end - px, cy + my * t_end - py
+            if t < 0:
+                return -1.0, 0.0, 0.0
+
+    norm = math.hypot(nx, ny)
+    if norm == 0:
+        return -1.0, 0.0, 0.0
+    return t, nx / norm, ny / norm
+
+
+# =============================|Integração|============================
+@njit(cache=True)
+def robot_move(position, velocity, force, direction, angle, angular_velocity, torque,
+               v_l, v_r, mass, inertia, distance_wheels, dt):
+    '''
+        Passo de integração do robô (mesma sequência de Robot.move). Atualiza position, velocity,
+        direction e zera force no lugar. Retorna (angle, angular_velocity).
+    '''
+    left_force = v_l * mass
+    right_force = v_r * mass
+    force_magnitude = (left_force + right_force) / 2
+
+    force[0] += direction[0] * force_magnitude
+    force[1] += direction[1] * force_magnitude
+    torque += (right_force - left_force) * distance_wheels / 2
+
+    velocity[0] += force[0] / mass * dt
+    velocity[1] += force[1] / mass * dt
+    angular_velocity += (torque / inertia) * dt
+
+    position[0] += velocity[0] * dt
+    position[1] += velocity[1] * dt
+    angle = (angle + angular_velocity * dt) % (2 * math.pi)
+
+    direction[0] = math.cos(angle)
+    direction[1] = math.sin(angle)
+
+    # Amortecimento (atrito com o solo)
+    velocity[0] *= (1 - 0.01)
+    velocity[1] *= (1 - 0.01)
+    angular_velocity *= (1 - 0.05)
+
+    force[0] = 0.0
+    force[1] = 0.0
+    return angle, angular_velocity
+
+
+@njit(cache=True)
+def robots_move_batch(positions, previous_positions, velocities, forces, directions, angles, angular_velocities,
+                      torques, wheel_speeds, masses, inertias, distance_wheels, indices, dt):
+    '''
+        Integra as linhas indices dos arrays do WorldState (robôs), como robot_move em cada uma.
+        distance_wheels tem um valor por índice.
+    '''
+    for k in range(len(indices)):
+        i = indices[k]
+        previous_positions[i, 0] = positions[i, 0]
+        previous_positions[i, 1] = positions[i, 1]
+        angles[i], angular_velocities[i] = robot_move(
+            positions[i], velocities[i], forces[i], directions[i], angles[i], angular_velocities[i], torques[i],
+            wheel_speeds[i, 0], wheel_speeds[i, 1], masses[i], inertias[i], distance_wheels[k], dt)
+        torques[i] = 0.0
+
+
+@njit(cache=True)
+def ball_update(position, velocity, force, direction, impulse_x, impulse_y, mass, radius, angular_velocity, dt):
+    '''
+        Passo de integração da bola (mesma sequência de Ball.update_position). Atualiza position,
+        velocity, direction e zera force no lugar. Retorna angular_velocity.
+    '''
+    velocity[0] += impulse_x / mass
+    velocity[1] += impulse_y / mass
+
+    velocity[0] += force[0] / mass * dt
+    velocity[1] += force[1] / mass * dt
+
+    speed = math.sqrt(velocity[0] ** 2 + velocity[1] ** 2)
+    if speed > 0:
+        # Resistência ao rolamento (bem menor que o atrito deslizante)
+        friction_accel = 0.002 * mass * 980 / mass
+        new_x = velocity[0] - velocity[0] / speed * friction_accel * dt
+        new_y = velocity[1] - velocity[1] / speed * friction_accel * dt
+        if new_x * velocity[0] + new_y * velocity[1] < 0:
+            velocity[0], velocity[1] = 0.0, 0.0
+        else:
+            velocity[0], velocity[1] = new_x, new_y
+        angular_velocity = math.sqrt(velocity[0] ** 2 + velocity[1] ** 2) / radius
+
+    position[0] += velocity[0] * dt
+    position[1] += velocity[1] * dt
+    angular_velocity += 0.995
+
+    speed = math.sqrt(velocity[0] ** 2 + velocity[1] ** 2)
+    if speed > 0:
+        direction[0] = velocity[0] / speed
+        direction[1] = velocity[1] / speed
+
+    force[0] = 0.0
+    force[1] = 0.0
+    return angular_velocity
+
+
+set_backend(KERNEL_BACKEND)
@@ -1,20 +1,26 @@
-import pygame
 import numpy as np  # Substitui math por numpy
 from simulator.collision.collision import * 
+from simulator.objects.world_state import WorldState, WorldBody
+from simulator import kernels
 from ui.interface_config import *
 
-class Ball:
-    def __init__(self, x, y, field, radius=BALL_RADIUS_CM):
+class Ball(WorldBody):
+    '''
+        Bola da partida. O estado físico fica em uma linha de um WorldState (ver WorldBody).
+    '''
+    def __init__(self, x, y, field, radius=BALL_RADIUS_CM, load_image=True):
         """
         Inicializa a bola.
         :param x: Posição X da bola na imagem principal
         :param y: Posição Y da bola na imagem principal
         :param radius: Raio da bola em cm.
+        :param load_image: Se False, não carrega a imagem (modo headless, sem display do pygame).
         """
         #Variáveis espaciais
         #Transforma as variáveis para o espaço virtual
-        # Espaço vetorial
-        self._position = np.array([x,y], dtype=float)
+        # Espaço vetorial (armazenamento próprio até ser ligado ao WorldState da física)
+        self._bind_world(WorldState(1), 0)
+        self._position[:] = (x, y)
         self.velocity = np.zeros(2, dtype=float) #(vx, vy)
         self.direction = np.array([1.0,0.0],dtype=float)
 
@@ -25,7 +31,10 @@ class Ball:
         scale = (2*BALL_RADIUS_CM / SCALE_PX_TO_CM, 2*BALL_RADIUS_CM / SCALE_PX_TO_CM)
 
         #imagem que representa a bola
-        self.image = pygame.transform.smoothscale(pygame.image.load("src/assets/ball.png").convert_alpha(), scale)
+        self.image = None
+        if load_image:
+            import pygame   # Importação tardia: o modo headless roda sem pygame
+            self.image = pygame.transform.smoothscale(pygame.image.load("src/assets/ball.png").convert_alpha(), scale)
         
         # Física
         self.radius = radius    
@@ -38,6 +47,10 @@ class Ball:
         self.force = np.zeros(2,dtype=float)
         self.torque = 0.0
         self.impulse = None 
+        self._impulse = np.zeros(2, dtype=float)   # Armazenamento do impulso acumulado (ver apply_impulse)
+
+        # Rolamento livre em forma fechada (ver roll)
+        self.analytic_rolling = BALL_ANALYTIC_ROLLING
 
         # Outros 
         self.type_object = BALL_OBJECT
@@ -56,9 +69,7 @@ class Ball:
     
     @position.setter
     def position(self, value):
-        if not isinstance(value, np.ndarray):
-            value = np.array(value, dtype=float)
-        self._position = np.array(value, dtype=float)
+        self._position[:] = value
         self.collision_object.x = self._position[0]
         self.collision_object.y = self._position[1]
 
@@ -80,6 +91,14 @@ class Ball:
         self._position[1] = value
         self.collision_object.y = value
 
+    @property
+    def previous_pos(self):
+        return self._previous_position
+
+    @previous_pos.setter
+    def previous_pos(self, value):
+        self._previous_position[:] = value
+
 
     def set_velocity(self, vx, vy):
         """
@@ -101,41 +120,70 @@ class Ball:
         - Força contínua
         - Rolamento com resistência
         - Perda progressiva da rotação
+
+        Com BALL_ANALYTIC_ROLLING e sem força acumulada, usa o rolamento exato de roll.
         """
+        if self.analytic_rolling and self.in_free_flight:
+            self.roll(dt)
+            return
+
         #Gambiarra para evitar crossing
         self.dt = dt
 
-        #Atualiza posição anterior
-        self.previous_pos = self.position.copy()
+        #Atualiza posição anterior (no lugar, sem cópia)
+        np.copyto(self._previous_position, self._position)
+
+        # Backend compilado: mesma integração em um kernel Numba
+        if kernels.ENABLED:
+            impulse = self.impulse if self.impulse is not None else (0.0, 0.0)
+            self.angular_velocity = kernels.ball_update(
+                self._position, self._velocity, self._force, self._direction, float(impulse[0]), float(impulse[1]),
+                self.mass, self.radius, self.angular_velocity, dt)
+            self.collision_object.x, self.collision_object.y = self._position
+            self.impulse = None
+            self.torque = 0.0
+            return
+
+        # Contas vetoriais no array de trabalho (out=), sem temporários por passo
+        work = self._scratch.get("ball_update")
+        velocity = self._velocity
+        mass = self.mass
+
         # 1. Aplica impulso (se existir)
         if self.impulse is not None:
-            self.velocity += self.impulse / self.mass
+            np.divide(self.impulse, mass, out=work)
+            velocity += work
             self.impulse = None
 
         # 2. Calcula aceleração linear e atualiza velocidade
-        acceleration = self.force / self.mass
-        self.velocity += acceleration * dt
+        np.divide(self._force, mass, out=work)
+        work *= dt
+        velocity += work
         
         # 3. Atrito com o solo (dinâmico linear)
-        if np.linalg.norm(self.velocity) > 0:
+        speed = np.linalg.norm(velocity)
+        if speed > 0:
             # Aproximação de desaceleração natural por rolamento
             rolling_resistance_coeff = 0.002  # Bem menor que atrito deslizante
-            friction_force_mag = rolling_resistance_coeff * self.mass * 980  # N = m.g
-            # A direção oposta à velocidade
-            friction_dir = -self.velocity / np.linalg.norm(self.velocity)
-            friction_accel = friction_dir * (friction_force_mag / self.mass)
-            
-            new_velocity = self.velocity + friction_accel * dt
-            if np.dot(new_velocity, self.velocity) < 0:
-                self.velocity = np.zeros(2)
+            friction_force_mag = rolling_resistance_coeff * mass * 980  # N = m.g
+            # A direção oposta à velocidade, e a nova velocidade v + a_atrito * dt em work
+            np.negative(velocity, out=work)
+            work /= speed
+            work *= friction_force_mag / mass
+            work *= dt
+            work += velocity
+            if np.dot(work, velocity) < 0:
+                velocity.fill(0.0)
             else:
-                self.velocity = new_velocity
+                np.copyto(velocity, work)
             # Atualiza rotação associada ao rolamento
-            linear_speed = np.linalg.norm(self.velocity)
-            self.angular_velocity = linear_speed / self.radius
+            speed = np.linalg.norm(velocity)
+            self.angular_velocity = speed / self.radius
 
         # 4. Atualiza posição com velocidade final
-        self.position += self.velocity * dt
+        np.multiply(velocity, dt, out=work)
+        self._position += work
+        self.collision_object.x, self.collision_object.y = self._position
 
 
         # 5. Calcula aceleração angular e atualiza velocidade angular
@@ -143,14 +191,78 @@ class Ball:
 
 
         # 6. Atualiza direção (para possíveis efeitos visuais)
-        if np.linalg.norm(self.velocity) > 0:
-            self.direction = self.velocity / np.linalg.norm(self.velocity)
+        if speed > 0:
+            np.divide(velocity, speed, out=self._direction)
 
         # 7. Reseta forças acumuladas
-        self.force = np.zeros(2, dtype=float)
+        self._force.fill(0.0)
         self.impulse = None
         self.torque = 0.0
 
+    # =============================|ROLAMENTO LIVRE|============================
+    @property
+    def in_free_flight(self):
+        '''
+            True se nenhuma força está acumulada: entre contatos a bola só sofre a resistência ao rolamento.
+        '''
+        return not self._force.any()
+
+    def rolling_state(self, t):
+        '''
+            Posição e velocidade exatas após t segundos de rolamento livre, sem alterar a bola.
+            Com desaceleração constante a = BALL_ROLLING_DECELERATION na direção do movimento:
+            s(t) = s0 - a*t e deslocamento s0*t - a*t²/2, até parar em t = s0/a.
+
+            :param t (float): Tempo à frente (s).
+
+            :return: Tupla (posição, velocidade), arrays novos.
+        '''
+        speed = float(np.hypot(self._velocity[0], self._velocity[1]))
+        if speed == 0.0:
+            return self._position.copy(), np.zeros(2, dtype=float)
+
+        direction = self._velocity / speed
+        stop_time = speed / BALL_ROLLING_DECELERATION
+        if t >= stop_time:
+            return self._position + direction * (0.5 * speed * stop_time), np.zeros(2, dtype=float)
+        distance = speed * t - 0.5 * BALL_ROLLING_DECELERATION * t * t
+        return self._position + direction * distance, direction * (speed - BALL_ROLLING_DECELERATION * t)
+
+    def predict_stop(self):
+        '''
+            Onde e quando a bola para se continuar rolando livre.
+
+            :return: Tupla (ponto de parada, tempo até parar em s). Parada: (posição atual, 0.0).
+        '''
+        speed = float(np.hypot(self._velocity[0], self._velocity[1]))
+        stop_time = speed / BALL_ROLLING_DECELERATION
+        return self.rolling_state(stop_time)[0], stop_time
+
+    def roll(self, dt):
+        '''
+            Avança a bola de forma exata por dt em rolamento livre (ver rolling_state): o resultado
+            não depende do tamanho do passo, então um único passo grande serve para avançar só a bola.
+            O impulso pendente é aplicado antes; a rotação segue o rolamento sem deslizar (|v| / raio).
+
+            :param dt (float): Passo de tempo (s).
+        '''
+        self.dt = dt
+        np.copyto(self._previous_position, self._position)
+
+        if self.impulse is not None:
+            self.velocity += self.impulse / self.mass
+            self.impulse = None
+
+        position, velocity = self.rolling_state(dt)
+        self.position = position
+        self.velocity = velocity
+
+        speed = float(np.hypot(velocity[0], velocity[1]))
+        self.angular_velocity = speed / self.radius
+        if speed > 0:
+            self.direction = velocity / speed
+        self.torque = 0.0
+
     def apply_force(self, force: np.ndarray, point: np.ndarray =None):
         '''
             Acumula uma força na bola
@@ -166,14 +278,19 @@ class Ball:
         '''
             Aplica um impulso na bola
         '''
+        # Acumula no array próprio da bola: o impulso de quem chama (muitas vezes um array de
+        # trabalho reaproveitado) não é guardado nem alterado
         if self.impulse is None:
-            self.impulse = impulse 
+            self.impulse = self._impulse
+            self._impulse[0], self._impulse[1] = impulse[0], impulse[1]
         else:
-            self.impulse +=impulse 
+            self.impulse += impulse 
 
         if contact_point is not None:
-            r = contact_point - np.array([self.x, self.y])
-            torque_impulse = np.cross(r, impulse)
+            # r × impulso em 2D, com as componentes escalares de r = ponto - centro
+            rx = contact_point[0] - self._position[0]
+            ry = contact_point[1] - self._position[1]
+            torque_impulse = rx * impulse[1] - ry * impulse[0]
             self.angular_velocity += torque_impulse / self.inertia
             
 
@@ -207,6 +324,7 @@ class Ball:
 
         self.collision_object.x = self.x
         self.collision_object.y = self.y
+        self.wake()
 
     
     def is_inside_goal(self, goal_area:CollisionRectangle):
@@ -219,22 +337,26 @@ class Ball:
         is_inside, mtv = goal_area.check_point_inside(self.collision_object)
         return is_inside
     
-    def _draw_(self, screen):
+    def _draw_(self, screen, pose=None):
         '''
             Método responsável por desenhar a bola no screen que foi configurado.
 
             :param screen: Superfície da SimulatorWidget configurada para desenho.
+
+            :param pose: Pose [x, y, ângulo] interpolada para o desenho. Se None, usa o estado atual.
         '''
 
         pass 
     
-    def draw(self, screen):
+    def draw(self, screen, pose=None):
         """
         Desenha a bola na tela.
         :param screen: Superfície do pygame onde a bola será desenhada.
+        :param pose: Pose [x, y, ângulo] interpolada para o desenho. Se None, usa o estado atual.
         """
         # Converte posição virtual para coordenada de tela
-        pos_img = virtual_to_screen([self.x, self.y])
+        x, y = (pose[0], pose[1]) if pose is not None else (self.x, self.y)
+        pos_img = virtual_to_screen([x, y])
 
         # Pega o retângulo da imagem da bola e centraliza na posição da bola
         ball_rect = self.image.get_rect(center=(pos_img[0], pos_img[1]))
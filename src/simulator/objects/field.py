@@ -1,5 +1,5 @@
-import pygame
 from simulator.collision.collision import *
+from simulator.collision.field_sdf import FieldSDF
 from ui.interface_config import *
 
 class Field:
@@ -65,6 +65,10 @@ class Field:
         dim_vertice = DIM_VERTICES
         thickness   = THICKNESS 
 
+        # Contorno do campo, em ordem (cantos chanfrados e recortes dos gols)
+        self.boundary = [Q1A1v, Q1A2v, Q2A1v, Q2A2v, GEI1v, GEI2v, GEI3v, GEI4v,
+                         Q3A1v, Q3A2v, Q4A1v, Q4A2v, GAI3v, GAI4v, GAI1v, GAI2v]
+
         # Objetos de colisão (linhas e áreas do campo)
         self.collision_object = CollisionGroup([
             self.line_to_thin_rectangle(Q1A1v, Q1A2v, thickness, reference=self, type_object=STRUCTURE_OBJECTS),
@@ -104,6 +108,13 @@ class Field:
 
         ], type_object=STRUCTURE_OBJECTS, reference=self)
 
+        # Distância com sinal até as paredes, calculada uma única vez (ou lida do cache em disco)
+        self.sdf = FieldSDF(self.boundary)
+
+        # Traves dos gols (vértices que avançam para dentro do campo), testadas contra os robôs junto com a SDF
+        self.post_objects = [CollisionCircle(post[0], post[1], thickness / 2, type_object=STRUCTURE_OBJECTS, reference=self)
+                             for post in self.sdf.posts]
+
         # --- Objetos especiais para detecção
         print("\n[Sistema]: Criando áreas do campo")
 
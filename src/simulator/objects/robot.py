@@ -1,4 +1,3 @@
-import pygame
 import numpy as np
 from ui.interface_config import (
     ROBOT_SIZE_CM,
@@ -11,6 +10,8 @@ from ui.interface_config import (
 from simulator.collision.collision import *
 from simulator.intelligence.logic.controll import *
 from simulator.intelligence.basicControl import *
+from simulator.objects.world_state import WorldState, WorldBody
+from simulator import kernels
 from enum import Enum 
 from typing import List, Optional
 
@@ -45,16 +46,20 @@ class BotId(str, Enum):
     def __str__(self):
         return self 
 
-class Robot:
+class Robot(WorldBody):
     '''
-        Implementação dinâmica de um robô controlado por controle diferencial
+        Implementação dinâmica de um robô controlado por controle diferencial.
+        O estado físico fica em uma linha de um WorldState (ver WorldBody).
     '''
     def __init__(self, x, y, team, role:BotRoles, id:BotId, image, initial_angle=0):
         '''
             Inicializando o objeto robô que será um objeto que irá se mover e interagir na simulação
         '''
+        # Armazenamento próprio até ser ligado ao WorldState da física
+        self._bind_world(WorldState(1), 0)
+
         #Coordenadas globais do robô no ambiente
-        self._position=np.array([x,y], dtype=float)
+        self._position[:] = (x, y)
         self.previous_position = np.array([0.0,0.0],dtype=float)    #Posição anterior para aplicar o crossing
 
         ''' Angulo theta com a horizontal em radianos'''
@@ -147,10 +152,34 @@ class Robot:
     
     @position.setter 
     def position(self, value):
-        self._position =np.array(value,dtype=float)
+        self._position[:] = value
         self.collision_object.x = self._position[0]
         self.collision_object.y = self._position[1]
 
+    @property
+    def previous_position(self):
+        return self._previous_position
+
+    @previous_position.setter
+    def previous_position(self, value):
+        self._previous_position[:] = value
+
+    @property
+    def v_l(self):
+        return self._world.wheel_speeds[self._index, 0]
+
+    @v_l.setter
+    def v_l(self, value):
+        self._world.wheel_speeds[self._index, 0] = value
+
+    @property
+    def v_r(self):
+        return self._world.wheel_speeds[self._index, 1]
+
+    @v_r.setter
+    def v_r(self, value):
+        self._world.wheel_speeds[self._index, 1] = value
+
     @property
     def x(self):
         return self.position[0]
@@ -187,6 +216,30 @@ class Robot:
         return v_l, v_r
 
 
+    def get_control_state(self):
+        '''
+            Retorna, em um array, o estado do robô que não fica no WorldState: velocidades de
+            controle e físicas, v, omega e os acumuladores dos três PIDs. Usado em snapshots.
+        '''
+        return np.array([
+            *self.control_velocity, *self.physical_velocity,
+            self.control_angular_velocity, self.v, self.omega,
+            *self.pid_linear.get_state(), *self.pid_heading.get_state(), *self.pid_angular.get_state(),
+        ], dtype=float)
+
+    def set_control_state(self, state):
+        '''
+            Restaura o estado retornado por get_control_state() e sincroniza o objeto de colisão.
+        '''
+        self.control_velocity = state[0:2].copy()
+        self.physical_velocity = state[2:4].copy()
+        self.control_angular_velocity, self.v, self.omega = state[4:7]
+        self.pid_linear.set_state(state[7:9])
+        self.pid_heading.set_state(state[9:11])
+        self.pid_angular.set_state(state[11:13])
+
+        self.sync_collision_object()
+
     def normalize_angle(self, angle):
         """
         Normaliza ângulos para o intervalo [-π, π] usando numpy.
@@ -199,6 +252,10 @@ class Robot:
         self.v_l = v_l
         self.v_r = v_r
 
+        # Comando de roda acorda o robô (ver Physics.update_sleep)
+        if v_l or v_r:
+            self.wake()
+
         #Atualizo a velocidade atual
         self.update_velocity_vector()
 
@@ -246,42 +303,59 @@ class Robot:
         self.sync_collision_object()
 
     def move(self, dt: float):
-        #Salvando posição anterior:
-        self.previous_position = self.position.copy()
+        #Salvando posição anterior (no lugar, sem cópia):
+        np.copyto(self._previous_position, self._position)
+
+        # Backend compilado: mesma integração em um kernel Numba
+        if kernels.ENABLED:
+            self.angle, self.angular_velocity = kernels.robot_move(
+                self._position, self._velocity, self._force, self._direction, self.angle, self.angular_velocity,
+                self.torque, self.v_l, self.v_r, self.mass, self.inertia, self.distance_wheels, dt)
+            self.sync_collision_object()
+            self.torque = 0.0
+            return
+
+        # Contas vetoriais no array de trabalho (out=), sem temporários por passo
+        work = self._scratch.get("robot_move")
+        mass = self.mass
+
         # 1. Força das rodas
-        left_force = self.v_l * self.mass
-        right_force = self.v_r * self.mass
+        left_force = self.v_l * mass
+        right_force = self.v_r * mass
         force_magnitude = (left_force + right_force) / 2
-        direction_force = self.direction * force_magnitude
+        np.multiply(self._direction, force_magnitude, out=work)
 
         # 2. Acumula força e torque do controle
-        self.force += direction_force
+        self._force += work
         self.torque += (right_force - left_force) * self.distance_wheels / 2
 
         # 3. Integra aceleração linear e angular
-        acceleration = self.force / self.mass
-        self.velocity += acceleration * dt
+        np.divide(self._force, mass, out=work)
+        work *= dt
+        self._velocity += work
         self.angular_velocity += (self.torque / self.inertia) * dt
 
         # 4. Atualiza posição e rotação
-        self.position += self.velocity * dt
-        self.angle += self.angular_velocity * dt
-        self.angle %= 2 * np.pi
+        np.multiply(self._velocity, dt, out=work)
+        self._position += work
+        angle = (self.angle + self.angular_velocity * dt) % (2 * np.pi)
+        self.angle = angle
 
         # 5. Atualiza direção
-        self.direction = np.array([np.cos(self.angle), np.sin(self.angle)], dtype=float)
+        self._direction[0] = np.cos(angle)
+        self._direction[1] = np.sin(angle)
 
         # 6. Damping realista (simula atrito com o solo)
         linear_damping = 0.01
         angular_damping = 0.05
-        self.velocity *= (1 - linear_damping)
+        self._velocity *= (1 - linear_damping)
         self.angular_velocity *= (1 - angular_damping)
 
         # 7. Sincroniza colisão
         self.sync_collision_object()
 
         # 8. Reseta acumuladores
-        self.force[:] = 0
+        self._force.fill(0.0)
         self.torque = 0.0
 
 
@@ -310,17 +384,20 @@ class Robot:
             contact_point: Ponto de contato onde o impulso é aplicado (em cm)
                         Se None, assume centro de massa
         """
-        # Atualiza velocidade linear
-        self.physical_velocity += impulse / self.mass
+        # Atualiza velocidade linear (no array de trabalho, sem temporário)
+        delta = self._scratch.get("robot_impulse")
+        np.divide(impulse, self.mass, out=delta)
+        self.physical_velocity += delta
         
         # Calcula torque apenas se o ponto de contato for especificado
         if contact_point is not None:
-            # Vetor do centro de massa ao ponto de contato
-            r = np.array(contact_point) - np.array([self.x, self.y])
+            # Vetor do centro de massa ao ponto de contato (componentes escalares)
+            rx = contact_point[0] - self._position[0]
+            ry = contact_point[1] - self._position[1]
             
             # Cálculo CORRETO do torque usando produto vetorial 2D
             # τ = r × impulse = r_x * impulse_y - r_y * impulse_x
-            torque_impulse = r[0] * impulse[1] - r[1] * impulse[0]
+            torque_impulse = rx * impulse[1] - ry * impulse[0]
             
             # Atualiza velocidade angular
             self.angular_velocity += torque_impulse / self.inertia
@@ -369,6 +446,7 @@ class Robot:
         self.image = self.initial_image 
         
         self.sync_collision_object()
+        self.wake()
 
     def set_position(self, x, y):
         """
@@ -390,6 +468,7 @@ class Robot:
         self.angular_velocity = self.initial_angular_velocity
 
         self.sync_collision_object()
+        self.wake()
 
     def new_position(self, x,y):
         """
@@ -401,6 +480,7 @@ class Robot:
         self.position = np.array([x, y], dtype=float)    
 
         self.sync_collision_object()
+        self.wake()
 
     def stop(self):
         """
@@ -411,9 +491,10 @@ class Robot:
 
     def sync_collision_object(self):
         """
-        Sincroniza a posição do objeto de colisão com a posição do robô.
+        Sincroniza a posição e o ângulo do objeto de colisão com os do robô.
         """
-        angle= np.degrees(np.arctan2(self.direction[1], self.direction[0]))
+        self.collision_object.x, self.collision_object.y = self._position
+        angle= np.degrees(np.arctan2(self._direction[1], self._direction[0]))
         self.collision_object.angle = angle
 
     def update_velocity_vector(self):
@@ -421,12 +502,13 @@ class Robot:
         Atualiza a velocidade vetorial do robô com base nas velocidades das rodas e direção atual.
         """
         v = (self.v_r + self.v_l) / 2  # velocidade linear
-        self.velocity = v * self.direction  # vetor velocidade
+        np.multiply(self._direction, v, out=self._velocity)  # vetor velocidade, no lugar
 
-    def _draw_(self, screen):
+    def _draw_(self, screen, pose=None):
         '''
         Nova função de desenho para o robô, que desenha a imagem do robô na tela
         :param screen: Superfície do pygame onde o robô será desenhado.
+        :param pose: Pose [x, y, ângulo] interpolada para o desenho. Se None, usa o estado atual.
         '''
         # Converte coordenadas virtuais para coordenadas de tela
 
@@ -437,14 +519,18 @@ class Robot:
         # Desenha no backbuffer do screen 
         pass 
 
-    def draw(self, screen):
+    def draw(self, screen, pose=None):
         """
         Desenha o robô na tela com rotação e um vetor indicando a direção.
         :param screen: Superfície do pygame onde o robô será desenhado.
+        :param pose: Pose [x, y, ângulo] interpolada para o desenho. Se None, usa o estado atual.
         """
+        import pygame   # Importação tardia: o modo headless roda sem pygame
+
+        x, y, theta = pose if pose is not None else (self.x, self.y, self.angle)
 
         # Converte o ângulo de rotação para graus
-        angle = np.degrees(self.angle)
+        angle = np.degrees(theta)
 
         # Rotaciona a imagem do robô conforme o ângulo atual
         rotated_image = pygame.transform.rotate(self.initial_image, angle)  # negativo pois y do Pygame cresce para baixo
@@ -470,7 +556,7 @@ class Robot:
 
             rotated_image = selected_image
         # Converte coordenadas virtuais para coordenadas de tela
-        center = virtual_to_screen([self.x, self.y])
+        center = virtual_to_screen([x, y])
 
         # Centraliza a imagem no ponto do robô
         rect = rotated_image.get_rect(center=center)
@@ -1,7 +1,6 @@
 import numpy as np  # Substitui math por numpy
 from simulator.objects.robot import Robot
 from ui.interface_config import *
-import pygame 
 
 #Classe para encapsular as posições
 class Position:
@@ -15,35 +14,15 @@ class Team:
     '''
         Classe criada para organizar os robôs dentro de um time só.
     '''
-    def __init__(self, positions:Position, team_name, initial_angle=0):
+    def __init__(self, positions:Position, team_name, initial_angle=0, load_images=True):
         self.team_name = team_name
         self.initial_angle = initial_angle
         self.positions = positions 
 
         print(f"[DEBUG]: Criando robôs do time {self.team_name}")
 
-        # Escala da imagem original
-        ORIGINAL_SCALE_PX_PER_CM = 3.6
-        TARGET_SCALE_PX_PER_CM = ORIGINAL_SCALE_PX_PER_CM
-
-        # Calcula tamanho da imagem final em pixels para nova escala
-        final_size_px = int(ROBOT_SIZE_CM * TARGET_SCALE_PX_PER_CM)
-        scale = (final_size_px, final_size_px)
-
-        # Imagens dos aliados com máxima qualidade
-        self.ATA1_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ATA1.png").convert_alpha(), scale)
-        self.ATA2_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ATA2.png").convert_alpha(), scale)
-        self.ATGK_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ATGK.png").convert_alpha(), scale)
-        self.ally_images = [self.ATGK_image, self.ATA1_image, self.ATA2_image]
-
-        # Imagens dos inimigos com máxima qualidade
-        self.ETA1_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ETA1.png").convert_alpha(), scale)
-        self.ETA2_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ETA2.png").convert_alpha(), scale)
-        self.ETGK_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ETGK.png").convert_alpha(), scale)
-        self.enemies_images = [self.ETGK_image, self.ETA1_image, self.ETA2_image]
-
-
-        imagesRobot = self.ally_images if team_name == BLUE_TEAM else self.enemies_images
+        # Imagens dos robôs (não são carregadas no modo headless)
+        imagesRobot = self.load_images(team_name) if load_images else [None, None, None]
 
         #Objetos individuais dos robôs que pertencem ao time 
         self.goalkeeaper    = Robot(
@@ -79,6 +58,34 @@ class Team:
         #Lista com os robôs para situações que sejam mais fáceis
         self.robots = [self.goalkeeaper, self.atacker1, self.atacker2]
 
+    def load_images(self, team_name):
+        '''
+            Carrega as imagens dos robôs do time. Exige que o display do pygame esteja inicializado.
+        '''
+        import pygame   # Importação tardia: o modo headless roda sem pygame
+
+        # Escala da imagem original
+        ORIGINAL_SCALE_PX_PER_CM = 3.6
+        TARGET_SCALE_PX_PER_CM = ORIGINAL_SCALE_PX_PER_CM
+
+        # Calcula tamanho da imagem final em pixels para nova escala
+        final_size_px = int(ROBOT_SIZE_CM * TARGET_SCALE_PX_PER_CM)
+        scale = (final_size_px, final_size_px)
+
+        # Imagens dos aliados com máxima qualidade
+        self.ATA1_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ATA1.png").convert_alpha(), scale)
+        self.ATA2_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ATA2.png").convert_alpha(), scale)
+        self.ATGK_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ATGK.png").convert_alpha(), scale)
+        self.ally_images = [self.ATGK_image, self.ATA1_image, self.ATA2_image]
+
+        # Imagens dos inimigos com máxima qualidade
+        self.ETA1_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ETA1.png").convert_alpha(), scale)
+        self.ETA2_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ETA2.png").convert_alpha(), scale)
+        self.ETGK_image = pygame.transform.smoothscale(pygame.image.load("src/assets/ETGK.png").convert_alpha(), scale)
+        self.enemies_images = [self.ETGK_image, self.ETA1_image, self.ETA2_image]
+
+        return self.ally_images if team_name == BLUE_TEAM else self.enemies_images
+
     def reset_positions(self):
         '''
             Método responsável por colocar novamente os robôs na posição inicial
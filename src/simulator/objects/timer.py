@@ -83,3 +83,100 @@ class Stopwatch:
         :return: True se o tempo acabou, False caso contrário.
         """
         return self.get_time_left() <= 0
+
+
+class SimulationClock:
+    '''
+        Cronômetro medido em tempo de simulação: só avança quando a física avança (tick(dt)).
+        Possui a mesma interface do Stopwatch, então o Árbitro e a interface podem usar qualquer
+        um dos dois. Com ele, uma partida acelerada ou em lote dura o tempo simulado correto,
+        e não o tempo de parede.
+    '''
+    def __init__(self, duration):
+        """
+        Inicializa o relógio.
+        :param duration: Duração da partida em segundos simulados.
+        """
+        self.duration = duration           # Tempo total do cronômetro
+        self.elapsed = 0.0                 # Tempo simulado decorrido
+        self.running = False               # Flag indicando se o cronômetro está ativo
+        self.paused = False                # Flag indicando se está pausado
+
+    def set_duration(self, duration):
+        """
+        Define a duração do timer.
+        :param duration: Duração em segundos.
+        """
+        self.duration = duration
+        if self.running:
+            self.elapsed = 0.0
+
+    def start(self):
+        """Inicia o timer do zero."""
+        self.reset()
+        self.running = True
+
+    def reset(self):
+        """Reseta o timer para o estado inicial, sem criar uma nova instância."""
+        self.elapsed = 0.0
+        self.running = False
+        self.paused = False
+
+    def pause(self):
+        """Pausa o timer."""
+        if self.running and not self.paused:
+            self.paused = True
+
+    def resume(self):
+        """Retoma o timer após uma pausa."""
+        if self.running and self.paused:
+            self.paused = False
+
+    def stop(self):
+        """Para completamente o timer (sem considerar pausa)."""
+        self.running = False
+        self.paused = False
+
+    def tick(self, dt):
+        """
+        Avança o relógio pelo passo de física.
+        :param dt: Passo de tempo simulado em segundos.
+        """
+        if self.running and not self.paused:
+            self.elapsed += dt
+
+    def get_elapsed(self):
+        """
+        Retorna o tempo simulado decorrido em segundos.
+        """
+        return self.elapsed
+
+    def get_time_left(self):
+        """
+        Retorna o tempo restante em segundos.
+        :return: Tempo restante (float).
+        """
+        if not self.running:
+            return self.duration
+
+        return max(0, self.duration - self.elapsed)
+
+    def is_finished(self):
+        """
+        Verifica se o tempo acabou.
+        :return: True se o tempo acabou, False caso contrário.
+        """
+        # Pequena tolerância para o acúmulo de erro de ponto flutuante dos passos dt
+        return self.get_time_left() <= 1e-9
+
+    def get_state(self):
+        """
+        Retorna o estado do relógio (duração, tempo decorrido, rodando, pausado) para snapshots.
+        """
+        return (self.duration, self.elapsed, self.running, self.paused)
+
+    def set_state(self, state):
+        """
+        Restaura o estado retornado por get_state().
+        """
+        self.duration, self.elapsed, self.running, self.paused = state
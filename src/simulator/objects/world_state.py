@@ -0,0 +1,239 @@
+import numpy as np
+
+
+class WorldState:
+    '''
+        Estado do mundo em estrutura de arrays (SoA): cada array guarda uma grandeza de todos os
+        corpos móveis de forma contígua, com a linha i correspondendo ao corpo i (bola ou robô).
+
+        Robot e Ball passam a ser apenas visões para uma linha desses arrays, então física,
+        controle e regras podem operar em lote sobre todos os corpos com NumPy.
+    '''
+    # Arrays por corpo e o formato de cada linha
+    FIELDS = {
+        "positions":            (2,),   # [x, y] em cm
+        "previous_positions":   (2,),   # posição no passo anterior
+        "velocities":           (2,),   # [vx, vy] em cm/s
+        "forces":               (2,),   # força acumulada no passo
+        "directions":           (2,),   # vetor unitário da frente do corpo
+        "angles":               (),     # ângulo em radianos
+        "angular_velocities":   (),     # rad/s
+        "torques":              (),     # torque acumulado no passo
+        "wheel_speeds":         (2,),   # [v_l, v_r] em cm/s (zero para a bola)
+        "masses":               (),
+        "inertias":             (),
+        "sleep_frames":         (),     # passos seguidos em repouso
+        "sleeping":             (),     # 1.0 se o corpo está dormindo (fora da fase estreita e da integração)
+    }
+
+    def __init__(self, n_bodies: int):
+        '''
+            Aloca os arrays para n_bodies corpos.
+
+            :param n_bodies (int): Quantidade de corpos móveis.
+        '''
+        self.n_bodies = n_bodies
+        for name, shape in self.FIELDS.items():
+            setattr(self, name, np.zeros((n_bodies,) + shape, dtype=float))
+
+        self.directions[:, 0] = 1.0
+        self.masses[:] = 1.0
+        self.inertias[:] = 1.0
+
+        # Objetos que estão ligados a cada linha
+        self.bodies = [None] * n_bodies
+
+        # Arrays de trabalho do caminho quente (Robot, Ball), no lugar de temporários por passo
+        self.scratch = ScratchBuffers()
+
+    @classmethod
+    def from_bodies(cls, bodies):
+        '''
+            Cria um WorldState com os corpos informados, copiando o estado atual de cada um
+            e passando a usá-lo como armazenamento (o corpo i fica na linha i).
+
+            :param bodies (list): Lista de objetos WorldBody (bola, robôs).
+        '''
+        world = cls(len(bodies))
+        for index, body in enumerate(bodies):
+            body._bind_world(world, index)
+        return world
+
+    def copy_row(self, source, source_index: int, index: int):
+        '''
+            Copia todas as grandezas da linha source_index de outro WorldState para a linha index.
+        '''
+        for name in self.FIELDS:
+            getattr(self, name)[index] = getattr(source, name)[source_index]
+
+    def snapshot(self):
+        '''
+            Retorna uma cópia de todos os arrays, para restaurar depois com restore().
+        '''
+        return {name: getattr(self, name).copy() for name in self.FIELDS}
+
+    def restore(self, snapshot):
+        '''
+            Copia de volta, no lugar, os arrays de um snapshot(). As visões dos corpos continuam válidas.
+        '''
+        for name in self.FIELDS:
+            np.copyto(getattr(self, name), snapshot[name])
+
+    def get_poses(self):
+        '''
+            Retorna as poses atuais [x, y, ângulo] de todos os corpos, uma linha por corpo.
+        '''
+        poses = np.empty((self.n_bodies, 3), dtype=float)
+        poses[:, :2] = self.positions
+        poses[:, 2] = self.angles
+        return poses
+
+
+def interpolate_poses(previous, current, alpha: float):
+    '''
+        Interpola poses [x, y, ângulo] entre dois estados da física, com o ângulo pelo menor arco.
+
+        :param previous (array): Poses (N, 3) do passo anterior.
+
+        :param current (array): Poses (N, 3) do passo atual.
+
+        :param alpha (float): Fator de interpolação em [0, 1].
+    '''
+    poses = previous + (current - previous) * alpha
+    delta = (current[:, 2] - previous[:, 2] + np.pi) % (2 * np.pi) - np.pi
+    poses[:, 2] = previous[:, 2] + delta * alpha
+    return poses
+
+
+class ScratchBuffers:
+    '''
+        Arrays de trabalho pré-alocados para o caminho quente da física. Cada nome é alocado na
+        primeira chamada de get e o mesmo array volta nas seguintes, para ser preenchido com
+        out= ou escrita no lugar. O conteúdo só vale até o próximo uso do mesmo nome.
+    '''
+    def __init__(self):
+        self.buffers = {}
+
+    def get(self, name: str, shape=2):
+        '''
+            :param name (str): Nome do array de trabalho.
+
+            :param shape (int | tuple): Formato, usado só na primeira chamada com esse nome.
+
+            :return: Array float64 (conteúdo indefinido).
+        '''
+        buffer = self.buffers.get(name)
+        if buffer is None:
+            buffer = self.buffers[name] = np.empty(shape, dtype=float)
+        return buffer
+
+
+class WorldBody:
+    '''
+        Base para corpos cujo estado físico mora em uma linha de um WorldState.
+        As propriedades abaixo devolvem visões (arrays) ou escalares dessa linha, e os
+        setters escrevem no lugar, sem trocar o array.
+    '''
+    def _bind_world(self, world: WorldState, index: int):
+        '''
+            Passa a usar a linha index do WorldState como armazenamento, copiando para ela
+            o estado que o corpo já tinha.
+        '''
+        old_world = getattr(self, "_world", None)
+        if old_world is not None:
+            world.copy_row(old_world, self._index, index)
+
+        self._world = world
+        self._index = index
+        world.bodies[index] = self
+
+        # Visões para as linhas (evitam indexar o array a cada acesso)
+        self._position = world.positions[index]
+        self._previous_position = world.previous_positions[index]
+        self._velocity = world.velocities[index]
+        self._force = world.forces[index]
+        self._direction = world.directions[index]
+        self._scratch = world.scratch
+
+    @property
+    def world(self) -> WorldState:
+        return self._world
+
+    @property
+    def world_index(self) -> int:
+        return self._index
+
+    @property
+    def velocity(self):
+        return self._velocity
+
+    @velocity.setter
+    def velocity(self, value):
+        self._velocity[:] = value
+
+    @property
+    def force(self):
+        return self._force
+
+    @force.setter
+    def force(self, value):
+        self._force[:] = value
+
+    @property
+    def direction(self):
+        return self._direction
+
+    @direction.setter
+    def direction(self, value):
+        self._direction[:] = value
+
+    @property
+    def angle(self):
+        return self._world.angles[self._index]
+
+    @angle.setter
+    def angle(self, value):
+        self._world.angles[self._index] = value
+
+    @property
+    def angular_velocity(self):
+        return self._world.angular_velocities[self._index]
+
+    @angular_velocity.setter
+    def angular_velocity(self, value):
+        self._world.angular_velocities[self._index] = value
+
+    @property
+    def torque(self):
+        return self._world.torques[self._index]
+
+    @torque.setter
+    def torque(self, value):
+        self._world.torques[self._index] = value
+
+    @property
+    def mass(self):
+        return self._world.masses[self._index]
+
+    @mass.setter
+    def mass(self, value):
+        self._world.masses[self._index] = value
+
+    @property
+    def inertia(self):
+        return self._world.inertias[self._index]
+
+    @inertia.setter
+    def inertia(self, value):
+        self._world.inertias[self._index] = value
+
+    @property
+    def is_sleeping(self):
+        return bool(self._world.sleeping[self._index])
+
+    def wake(self):
+        '''
+            Acorda o corpo e reinicia a contagem de passos em repouso.
+        '''
+        self._world.sleeping[self._index] = 0.0
+        self._world.sleep_frames[self._index] = 0.0
@@ -3,11 +3,15 @@ from simulator.objects.field import *
 from simulator.objects.robot import *
 from simulator.objects.team  import * 
 
-from ui.interface import Interface
 from simulator.objects.timer import *
 from ui.interface_config import *
 
 from enum import Enum, auto
+from typing import TYPE_CHECKING
+
+# A interface do pygame só é usada para tipagem, para que as regras rodem sem pygame
+if TYPE_CHECKING:
+    from ui.interface import Interface
 
 # Possíveis decisões do Árbitro
 class Decisions(Enum):
@@ -48,7 +52,7 @@ class Arbitrator:
         Classe que representa o árbitro da partida, que irá garantir as regras
         da partida
     '''
-    def __init__(self, ball: Ball, field: Field, ally_bots: Team, enemy_bots: Team, interface: Interface, timer: Stopwatch):
+    def __init__(self, ball: Ball, field: Field, ally_bots: Team, enemy_bots: Team, interface: 'Interface', timer: SimulationClock):
         # Referências para objetos principais da simulação
         self.ball = ball 
         self.field = field 
@@ -76,7 +80,7 @@ class Arbitrator:
         #Pontuação
         self.ally_pontuation  = 0 
         self.enemy_pontuation = 0
-        self.pontuation = self.interface.score
+        self.pontuation = self.interface.score if self.interface else [0, 0]
 
         #Tempo de cada partida
         self.TIME_OF_A_PARTY = TIMER_PARTY   #Segundos
@@ -140,12 +144,14 @@ class Arbitrator:
         if side == 'ALLY':
             print("[Arbitro]: Gol do time A!")
             self.ally_pontuation  += 1 
-            self.interface.update_score(1)
+            if self.interface:
+                self.interface.update_score(1)
             self.current_decision = Decisions.ALLY_GOAL
         elif side == 'ENEMY':
             print("[Arbitro]: Gol do time B!")
             self.enemy_pontuation += 1
-            self.interface.update_score(2)
+            if self.interface:
+                self.interface.update_score(2)
             self.current_decision = Decisions.ENEMY_GOAL
 
         self._reset_initial_positions()
@@ -167,7 +173,7 @@ class Arbitrator:
 
     def _is_party_end(self):
         """
-        Verifica se o tempo da partida acabou.
+        Verifica se o tempo da partida acabou (em tempo simulado, pelo SimulationClock).
         """
         return self.timer.is_finished()
 
@@ -200,7 +206,8 @@ class Arbitrator:
         # Zera pontuações
         self.ally_pontuation = 0
         self.enemy_pontuation = 0
-        self.interface.score = [self.ally_pontuation,self.enemy_pontuation]
+        if self.interface:
+            self.interface.score = [self.ally_pontuation,self.enemy_pontuation]
 
         # Reseta posições iniciais
         self._reset_initial_positions()
@@ -11,12 +11,16 @@ from ui.pages.objects.SimWidget import *
 from data.objects.logs import *
 from simulator.intelligence.core.interface import *
 from simulator.simUtils import *
+from simulator.engine import SimulationEngine
 from PyQt6.QtCore import QTimer
+import time
 
 
 class Simulator:
     '''
         Classe para encapsular a lógica da simulação e controlar o loop de tempo/desenho.
+        A física, o cronômetro e o árbitro ficam no SimulationEngine (headless); esta classe
+        apenas o avança pelo QTimer e desenha o resultado no SimulatorWidget.
     '''
     def __init__(self, page_parent,screen: SimulatorWidget, FPS: int =60):
         '''
@@ -107,27 +111,60 @@ class Simulator:
         # Classe para controle de variáveis externas
         self.extern_variables = SimulatorVariables()
 
-        # Variáveis dos objetos da simulação
-        self.allies:    Team  = None 
-        self.enemies:   Team  = None 
-        self.ball:      Ball  = None 
-        self.field:     Field = None
+        # Avanço rápido / câmera lenta: o tempo real do quadro é multiplicado por vel_sim
+        self.vel_sim = self.extern_variables.vel_sim
+        self._last_frame_time = time.perf_counter()    # Instante do último quadro
+        self._frames_since_draw = 0                     # Quadros sem desenho durante o avanço rápido
+
+        # Motor headless que contém os objetos, a física e o árbitro da simulação
+        # A física roda em passo fixo (PHYSICS_DT), independente do FPS de desenho
+        self.engine = SimulationEngine(
+            dt=PHYSICS_DT,
+            party_time=self.extern_variables.party_time,
+            log_manager=self.log_manager
+        )
+
+    # =============================|OBJETOS DO MOTOR|==============================
+    @property
+    def allies(self) -> Team:
+        return self.engine.allies
+
+    @property
+    def enemies(self) -> Team:
+        return self.engine.enemies
+
+    @property
+    def ball(self) -> Ball:
+        return self.engine.ball
 
-        # Objeto que representa todos robôs
-        self.bots = self.allies.robots + self.enemies.robots
+    @property
+    def field(self) -> Field:
+        return self.engine.field
 
-        # Objeto que irá servir como interface de controle
-        self._control_strategy: ControlInterface = None 
+    @property
+    def bots(self):
+        return self.engine.bots
+
+    @property
+    def Physics_Engine(self) -> Physics:
+        return self.engine.physics
+
+    @property
+    def arbitrator(self) -> Arbitrator:
+        return self.engine.arbitrator
+
+    @property
+    def cronometer(self) -> SimulationClock:
+        return self.engine.cronometer
 
     # =============================|GETTERS E SETTERS|==============================
     def set_FPS(self, fps):
         '''
             Método responsável por definir a taxa de quadros por segundo (FPS) do simulador.
+            Afeta apenas o desenho: a física continua no passo fixo PHYSICS_DT.
         '''
         self.fps = max(1, int(fps))
         self.timer.setInterval(int(1000 / self.fps))
-        if self.Physics_Engine:
-            self.Physics_Engine.dt = 1.0 / self.fps
 
     def set_cronometer(self, time_limit: int):
         '''
@@ -135,7 +172,18 @@ class Simulator:
 
             :param time_limit (int): Limite de tempo da partida em segundos.
         '''
-        self.cronometer.set_duration = time_limit
+        self.engine.set_party_time(time_limit)
+
+    def set_simulation_speed(self, multiplier: float):
+        '''
+            Método responsável por definir o multiplicador de velocidade da simulação.
+            O passo da física não muda: o tempo real de cada quadro é multiplicado por
+            'multiplier' antes de ir para o acumulador de passo fixo, então 0.5 é câmera
+            lenta e 10 executa 10x mais passos de física por quadro.
+
+            :param multiplier (float): Multiplicador de velocidade (velocidade_simulacao).
+        '''
+        self.vel_sim = float(np.clip(multiplier, MIN_SIMULATION_SPEED, MAX_SIMULATION_SPEED))
 
     def start(self):
         '''
@@ -145,6 +193,8 @@ class Simulator:
             self.is_simulation_started= True
             self.is_simulation_paused  = False
             self.simulation_started = True
+            self.engine.start()
+            self._last_frame_time = time.perf_counter()
             self.timer.start(int(1000 / self.fps))
 
     def pause(self):
@@ -153,6 +203,7 @@ class Simulator:
         '''
         if self.is_simulation_started and not self.is_simulation_paused :
             self.is_simulation_paused  = True
+            self.engine.pause()
             self.timer.stop()
 
     def resume(self):
@@ -161,6 +212,8 @@ class Simulator:
         '''
         if self.is_simulation_started and self.is_simulation_paused :
             self.is_simulation_paused  = False
+            self.engine.resume()
+            self._last_frame_time = time.perf_counter()
             self.timer.start(int(1000 / self.fps))
 
     def stop(self):
@@ -178,17 +231,9 @@ class Simulator:
         '''
         self.stop()
         self.get_variables_simulation()
-        self.create_objects()
-        self.cronometer = Stopwatch(60)
-        self.Physics_Engine = Physics(
-            allies=self.allies,
-            enemies=self.enemies,
-            ball=self.ball,
-            dt=1.0/self.fps,
-            field=self.field,
-            screen=self.screen
-        )
-        self.arbitrator = Arbitrator(self.ball, self.field, self.allies, self.enemies, self.screen, self.cronometer)
+        self.engine.set_party_time(self.extern_variables.party_time)
+        self.set_simulation_speed(self.extern_variables.vel_sim)
+        self.engine.reset()
         self.screen.flip()
     
     def get_variables_simulation(self):
@@ -204,8 +249,23 @@ class Simulator:
         '''
         if not self.is_simulation_started or self.is_simulation_paused :
             return
-        self.update()
+
+        # Tempo real desde o último quadro, escalado pelo multiplicador de velocidade. O limite de
+        # passos vale depois da escala: em avanço rápido um quadro nunca roda mais que
+        # MAX_FRAME_TIME de passos, mesmo que a simulação fique abaixo da velocidade pedida.
+        now = time.perf_counter()
+        frame_time = min(now - self._last_frame_time, MAX_FRAME_TIME)
+        self._last_frame_time = now
+        self.update(frame_time * self.vel_sim, max_steps=max(1, int(MAX_FRAME_TIME / self.engine.dt)))
+
+        # Em avanços muito rápidos o desenho é feito só de tempos em tempos
+        self._frames_since_draw += 1
+        if self.vel_sim >= FAST_FORWARD_SKIP_RENDER_SPEED and self._frames_since_draw < FAST_FORWARD_RENDER_INTERVAL:
+            return
+        self._frames_since_draw = 0
+
         self.draw()
+        self.update_info_simulation()
 
     # Função para escolher qual a forma de controle dos robôs será utilizada
     def set_control_strategy(self, strategy: ControlInterface):
@@ -214,23 +274,23 @@ class Simulator:
 
             :param control_function (function): Função de controle a ser atribuída ao robô.
         '''
-        self._control_strategy = strategy
+        self.engine.set_control_strategy(strategy)
 
 
-    def update(self):
+    def update(self, frame_time: float, max_steps: int = None):
         '''
             Método responsável por atualizar a lógica do jogo.
-        '''
-        try:
-            # Aciona a interface de controle
 
+            :param frame_time (float): Tempo simulado a avançar neste quadro (em segundos).
 
-            # Atualiza física e lógica do jogo
-            if self.Physics_Engine:
-                self.Physics_Engine.update()
+            :param max_steps (int): Limite de passos de física neste quadro (ver SimulationEngine.advance).
+        '''
+        try:
+            # Controle, física e árbitro são avançados pelo motor em passos fixos
+            decisions = self.engine.advance(frame_time, max_steps=max_steps)
 
             # Verifica situação do jogo 
-            if self.arbitrator and self.arbitrator.analyzer() == Decisions.FINISH:
+            if Decisions.FINISH in decisions:
                 self.simulation_started = False
                 self.reset()
 
@@ -244,6 +304,12 @@ class Simulator:
         if self.arbitrator:
             return self.arbitrator.analyzer()
         return None
+
+    def get_state(self):
+        '''
+            Retorna o estado atual do mundo simulado (ver SimulationEngine.get_state).
+        '''
+        return self.engine.get_state()
     
     # Método responsável por obter as variáveis da simulação na tela configurada
     def draw(self):
@@ -255,13 +321,16 @@ class Simulator:
             # Limpa o backbuffer
             self.screen.back_buffer.clear()
 
+            # Poses interpoladas entre os dois últimos passos de física (linha 0 = bola)
+            poses = self.engine.get_interpolated_poses()
+
             # Desenha robôs
             if self.allies and self.enemies:
-                for bot in self.allies.robots + self.enemies.robots:
-                    bot._draw_(screen=self.screen)
+                for bot, pose in zip(self.bots, poses[1:]):
+                    bot._draw_(screen=self.screen, pose=pose)
             # Desenha bola
             if self.ball:
-                self.ball._draw_(self.screen)
+                self.ball._draw_(self.screen, pose=poses[0])
 
             if self.Physics_Engine and self.screen:
                 # Desenhos de debug
@@ -285,6 +354,10 @@ class Simulator:
         '''
             Atualiza os dados do jogo no widget que for passado
         '''
+        # O tempo exibido é o tempo simulado, então acompanha acelerações e execuções em lote
+        if hasattr(self.page_parent, "update_timer"):
+            minutes, seconds = divmod(int(np.ceil(self.cronometer.get_time_left())), 60)
+            self.page_parent.update_timer(minutes, seconds)
     # =============================|Construtores|============================
     def set_variables_simulation(self, variables: SimulatorVariables):
         '''
@@ -293,7 +366,7 @@ class Simulator:
         ## Parâmetros de exibição
         self.FPS = variables.FPS 
         self.party_time = variables.party_time 
-        self.vel_sim = variables.vel_sim  
+        self.set_simulation_speed(variables.vel_sim)
         
         ## Parâmetros de física
         # robôs
@@ -351,16 +424,8 @@ class Simulator:
         '''
             Método responsável por criar os objetos da simulação no modo padrão.
         '''
-        # Cria times, robôs, bola, campo, etc na posição inicial correta
-        
-
-        # Cria cronômetro
-
-
-        # Cria objeto de física e aplica as variáveis 
-
-
-        # Cria o árbitro 
+        # Times, robôs, bola, campo, cronômetro, física e árbitro são criados pelo motor
+        self.engine.create_objects()
 
     def create_bot(self, x, y, team: Team, bot_id: int, bot_type: str, initial_angle: float = 0.0):
         '''
@@ -391,8 +456,8 @@ class Simulator:
             :param ball_type (str): Tipo da bola a ser criada.
         '''
         if ball_id and ball_type:
-            self.ball = Ball(ball_id, ball_type)
-            return self.ball
+            self.engine.ball = Ball(ball_id, ball_type)
+            return self.engine.ball
         return None
     
     # =============================|FUNÇÕES DE CONTROLE|============================
@@ -0,0 +1,259 @@
+#Torneio: várias partidas headless em paralelo com um pool de processos
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from simulator.engine import SimulationEngine
+from simulator.rules.rules import Decisions
+from simulator.intelligence.core.interface import ControlInterface
+from ui.interface_config import *
+import numpy as np
+import contextlib
+import importlib
+import itertools
+import traceback
+import argparse
+import random
+import time
+import io
+import os
+
+
+@dataclass
+class MatchSpec:
+    '''
+        Descrição de uma partida do torneio.
+
+        As estratégias são fábricas strategy(team_name) -> ControlInterface, passadas como objeto
+        (precisa ser serializável pelo pickle) ou como texto "modulo:atributo". None deixa o time parado.
+    '''
+    match_id: int
+    blue: object = None
+    red: object = None
+    seed: int = 0
+    duration: float = TIMER_PARTY
+    dt: float = PHYSICS_DT
+
+
+@dataclass
+class MatchResult:
+    '''
+        Resultado de uma partida do torneio.
+    '''
+    match_id: int
+    blue: str
+    red: str
+    seed: int
+    score: dict = field(default_factory=lambda: {'ally': 0, 'enemy': 0})
+    possession: float = 0.0         # Fração do tempo com o time azul mais perto da bola
+    duration: float = 0.0           # Tempo simulado (s)
+    wall_time: float = 0.0          # Tempo real gasto (s)
+    steps: int = 0
+    error: str = None               # Traceback, se a partida falhou
+
+
+class _MatchControl(ControlInterface):
+    '''
+        Junta as estratégias dos dois times em uma só, que é o que o SimulationEngine aceita.
+    '''
+    def __init__(self, strategies):
+        self.strategies = [strategy for strategy in strategies if strategy is not None]
+
+    def initialize(self, simulator):
+        for strategy in self.strategies:
+            strategy.initialize(simulator)
+
+    def update(self, simulator, dt):
+        for strategy in self.strategies:
+            strategy.update(simulator, dt)
+
+    def on_event(self, simulator, event, data):
+        for strategy in self.strategies:
+            strategy.on_event(simulator, event, data)
+
+
+# =============================|Execução de uma partida|============================
+def _strategy_name(factory):
+    if factory is None:
+        return "-"
+    if isinstance(factory, str):
+        return factory
+    return getattr(factory, "__qualname__", repr(factory))
+
+
+def _load_strategy(factory, team_name):
+    '''
+        Cria a estratégia de um time a partir da fábrica (objeto ou "modulo:atributo").
+    '''
+    if factory is None:
+        return None
+    if isinstance(factory, str):
+        module_name, attribute = factory.split(":")
+        factory = getattr(importlib.import_module(module_name), attribute)
+    return factory(team_name)
+
+
+def play_match(spec: MatchSpec, quiet: bool = True) -> MatchResult:
+    '''
+        Joga uma partida completa em um motor headless. Roda dentro dos processos do pool.
+        Exceções são capturadas e devolvidas no resultado, sem derrubar o torneio.
+
+        :param spec (MatchSpec): Partida a jogar.
+
+        :param quiet (bool): Descarta as mensagens impressas pelo simulador durante a partida.
+    '''
+    result = MatchResult(spec.match_id, _strategy_name(spec.blue), _strategy_name(spec.red), spec.seed)
+    start = time.perf_counter()
+    output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+
+    try:
+        with output:
+            random.seed(spec.seed)
+            np.random.seed(spec.seed)
+
+            engine = SimulationEngine(dt=spec.dt, party_time=spec.duration)
+            engine.set_control_strategy(_MatchControl([
+                _load_strategy(spec.blue, BLUE_TEAM),
+                _load_strategy(spec.red, RED_TEAM),
+            ]))
+
+            # Saída de bola levemente deslocada conforme a semente
+            rng = np.random.default_rng(spec.seed)
+            engine.ball.position = engine.ball.position + rng.uniform(-TOURNAMENT_KICKOFF_JITTER_CM, TOURNAMENT_KICKOFF_JITTER_CM, 2)
+
+            world = engine.physics.world
+            n_blue = len(engine.allies.robots)
+            blue_closest = 0
+
+            engine.start()
+            while not engine.is_finished:
+                decisions = engine.step()
+
+                # Posse: time do robô mais próximo da bola
+                distances = np.linalg.norm(world.positions[1:] - world.positions[0], axis=1)
+                blue_closest += int(np.argmin(distances) < n_blue)
+
+                # O árbitro zera o placar ao fim da partida, então ele é contado pelas decisões
+                for decision in decisions:
+                    if decision == Decisions.ALLY_GOAL:
+                        result.score['ally'] += 1
+                    elif decision == Decisions.ENEMY_GOAL:
+                        result.score['enemy'] += 1
+
+            result.steps = engine.steps
+            result.duration = engine.steps * engine.dt
+            result.possession = blue_closest / max(engine.steps, 1)
+    except Exception:
+        result.error = traceback.format_exc()
+
+    result.wall_time = time.perf_counter() - start
+    return result
+
+
+# =============================|Torneio|============================
+def make_schedule(strategies, seeds=(0,), duration: float = TIMER_PARTY, dt: float = PHYSICS_DT):
+    '''
+        Monta um torneio todos contra todos (ida e volta) para cada semente.
+
+        :param strategies (list): Fábricas de estratégia (objeto, "modulo:atributo" ou None).
+
+        :param seeds (list): Sementes de cada rodada.
+
+        :return: Lista de MatchSpec.
+    '''
+    pairs = list(itertools.permutations(strategies, 2)) if len(strategies) > 1 else [(strategies[0], strategies[0])]
+    specs = []
+    for seed in seeds:
+        for blue, red in pairs:
+            specs.append(MatchSpec(len(specs), blue, red, seed, duration, dt))
+    return specs
+
+
+def iter_results(specs, workers: int = None):
+    '''
+        Distribui as partidas em um ProcessPoolExecutor e devolve os resultados conforme cada
+        partida termina (não na ordem de envio).
+
+        :param specs (list): Lista de MatchSpec.
+
+        :param workers (int): Quantidade de processos. Se None, usa todos os núcleos.
+    '''
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(workers, max(len(specs), 1))) as pool:
+        futures = {pool.submit(play_match, spec): spec for spec in specs}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception:
+                # Falha do próprio processo (ex: resultado não serializável)
+                spec = futures[future]
+                yield MatchResult(spec.match_id, _strategy_name(spec.blue), _strategy_name(spec.red), spec.seed,
+                                  error=traceback.format_exc())
+
+
+def run_tournament(specs, workers: int = None, on_result=None):
+    '''
+        Executa todas as partidas e retorna os resultados ordenados por match_id.
+
+        :param on_result (callable): Chamada opcional on_result(result) a cada partida concluída.
+    '''
+    results = []
+    for result in iter_results(specs, workers):
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return sorted(results, key=lambda result: result.match_id)
+
+
+def format_result(result: MatchResult) -> str:
+    '''
+        Linha da tabela de resultados para uma partida.
+    '''
+    if result.error:
+        status = "ERRO: " + result.error.strip().splitlines()[-1]
+    else:
+        status = f"{result.score['ally']:>2} x {result.score['enemy']:<2}  posse {100 * result.possession:5.1f}%"
+    return (f"{result.match_id:>4}  {result.blue[:24]:<24}  {result.red[:24]:<24}  {result.seed:>5}  "
+            f"{result.duration:7.1f}s  {result.wall_time:7.2f}s  {status}")
+
+
+def results_table(results) -> str:
+    '''
+        Tabela de resultados do torneio, com uma linha por partida e o resumo por estratégia.
+    '''
+    header = f"{'id':>4}  {'azul':<24}  {'vermelho':<24}  {'seed':>5}  {'jogo':>8}  {'real':>8}  placar"
+    lines = [header, "-" * len(header)] + [format_result(result) for result in results]
+
+    # Resumo: vitórias, empates, derrotas e saldo de gols por estratégia. Uma estratégia contra ela
+    # mesma conta uma vez, como empate sem saldo (venceu e perdeu a mesma partida)
+    summary = {}
+    for result in results:
+        if result.error:
+            continue
+        if result.blue == result.red:
+            sides = ((result.blue, 0, 0),)
+        else:
+            sides = ((result.blue, result.score['ally'], result.score['enemy']),
+                     (result.red, result.score['enemy'], result.score['ally']))
+        for name, scored, conceded in sides:
+            row = summary.setdefault(name, [0, 0, 0, 0])
+            row[0 if scored > conceded else 1 if scored == conceded else 2] += 1
+            row[3] += scored - conceded
+
+    lines += ["", f"{'estratégia':<24}  {'V':>3}  {'E':>3}  {'D':>3}  {'saldo':>5}"]
+    for name, (wins, draws, losses, balance) in sorted(summary.items(), key=lambda item: (-item[1][0], -item[1][3])):
+        lines.append(f"{name[:24]:<24}  {wins:>3}  {draws:>3}  {losses:>3}  {balance:>5}")
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Torneio de estratégias do FoxSIM em paralelo (headless).")
+    parser.add_argument("strategies", nargs="*", help='Fábricas de estratégia no formato "modulo:atributo". Vazio = times parados.')
+    parser.add_argument("--seeds", type=int, default=4, help="Quantidade de sementes (rodadas).")
+    parser.add_argument("--duration", type=float, default=TIMER_PARTY, help="Duração de cada partida em segundos simulados.")
+    parser.add_argument("--workers", type=int, default=None, help="Processos do pool (padrão: todos os núcleos).")
+    args = parser.parse_args()
+
+    specs = make_schedule(args.strategies or [None], seeds=range(args.seeds), duration=args.duration)
+    print(f"[Torneio]: {len(specs)} partidas em {args.workers or os.cpu_count()} processos")
+    results = run_tournament(specs, args.workers, on_result=lambda result: print(format_result(result), flush=True))
+    print()
+    print(results_table(results))
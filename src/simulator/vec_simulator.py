@@ -0,0 +1,325 @@
+#Definição do simulador vetorizado (K partidas em paralelo)
+from ui.interface_config import *
+import numpy as np
+
+
+class VecSimulator:
+    '''
+        Simulador vetorizado: mantém K cópias independentes do mundo do FoxSIM (partidas 3x3)
+        em arrays empilhados e avança todas em uma única passada de NumPy, para treino de
+        políticas por aprendizado por reforço.
+
+        Os arrays seguem o mesmo layout do WorldState: na dimensão dos corpos, a linha 0 é a
+        bola e as seguintes são os robôs (aliados e depois inimigos). Ex: positions tem formato
+        (K, 1 + N_ROBOTS, 2).
+
+        Modelo simplificado em relação ao Physics:
+        - Integração dos robôs idêntica ao Robot.move (rodas -> força/torque, Euler, amortecimento).
+        - Movimento linear da bola idêntico ao Ball.update_position (resistência ao rolamento). A
+          rotação da bola é só a de rolamento (|v| / raio), sem o incremento fixo por passo do Ball.
+        - Robôs e bola colidem como discos (robô com raio ROBOT_SIZE_CM/2), com as restituições
+          de interface_config.
+        - Paredes do campo (laterais, fundo, quinas chanfradas e gols) como semiplanos.
+        - Gol quando o centro da bola entra na área interna do gol, como no Arbitrator.
+
+        Cada ambiente tem o próprio cronômetro e placar; um ambiente que termina a partida é
+        reiniciado sozinho, sem parar os demais.
+    '''
+    N_TEAM = 3
+    N_ROBOTS = 2 * N_TEAM
+
+    def __init__(self, n_envs: int, dt: float = PHYSICS_DT, party_time: float = TIMER_PARTY):
+        '''
+        Inicializa os K ambientes na posição de saída.
+
+        :param n_envs (int): Quantidade de partidas simuladas em paralelo.
+
+        :param dt (float): Passo de tempo da física em segundos.
+
+        :param party_time (float): Duração de cada partida em segundos (tempo simulado).
+        '''
+        self.n_envs = n_envs
+        self.dt = float(dt)
+        self.party_time = party_time
+
+        n_bodies = 1 + self.N_ROBOTS
+        self.n_bodies = n_bodies
+
+        # Estado dinâmico (K, corpos, ...)
+        self.positions          = np.zeros((n_envs, n_bodies, 2), dtype=float)
+        self.velocities         = np.zeros((n_envs, n_bodies, 2), dtype=float)
+        self.angles             = np.zeros((n_envs, n_bodies), dtype=float)
+        self.angular_velocities = np.zeros((n_envs, n_bodies), dtype=float)
+        self.wheel_speeds       = np.zeros((n_envs, n_bodies, 2), dtype=float)   # [v_l, v_r], zero para a bola
+
+        # Propriedades constantes por corpo
+        self.masses = np.full(n_bodies, float(ROBOT_MASS))
+        self.masses[0] = BALL_MASS
+        self.inertias = np.full(n_bodies, (1/12) * ROBOT_MASS * 2 * ROBOT_SIZE_CM**2)
+        self.inertias[0] = 0.5 * BALL_MASS * BALL_RADIUS_CM**2
+        self.radii = np.full(n_bodies, ROBOT_SIZE_CM / 2)
+        self.radii[0] = BALL_RADIUS_CM
+
+        # Restituição por par de corpos e por corpo contra a parede
+        is_ball = np.zeros(n_bodies, dtype=bool)
+        is_ball[0] = True
+        self.pair_restitution = np.where(
+            is_ball[:, None] | is_ball[None, :],
+            COEFFICIENT_RESTITUTION_BALL_ROBOT,
+            COEFFICIENT_RESTITUTION_ROBOT_ROBOT
+        )
+        self.wall_restitution = np.where(is_ball, COEFFICIENT_RESTITUTION_BALL_FIELD, COEFFICIENT_RESTITUTION_ROBOT_FIELD)
+
+        # Posições de saída (mesmas do Team / Arbitrator)
+        self.initial_positions = np.array([
+            [XVBALL_INIT, YVBALL_INIT],
+            MID_GOALAREA_A, ATK1_POSITION_SITUATION1_ALLY, ATK2_POSITION_SITUATION2_ALLY,
+            MID_GOALAREA_E, ATK1_POSITION_SITUATION1_ENEMY, ATK2_POSITION_SITUATION2_ENEMY,
+        ], dtype=float)
+        self.initial_angles = np.zeros(n_bodies, dtype=float)
+        self.initial_angles[1 + self.N_TEAM:] = np.pi
+
+        # Partida de cada ambiente
+        self.scores = np.zeros((n_envs, 2), dtype=int)     # [aliado, inimigo]
+        self.final_scores = np.zeros((n_envs, 2), dtype=int)   # Placar da última partida encerrada
+        self.elapsed = np.zeros(n_envs, dtype=float)
+        self.steps = np.zeros(n_envs, dtype=int)
+
+        self._build_field()
+        self.reset()
+
+    # =============================|Construtores|============================
+    def _build_field(self):
+        '''
+            Monta os limites do campo a partir dos pontos virtuais de interface_config.
+        '''
+        # Faixa vertical da boca dos gols e limites em x do campo e do fundo dos gols
+        self.goal_y_min = GAI3v[1]
+        self.goal_y_max = GAI1v[1]
+        self.field_x_min = GAI2v[0]
+        self.field_x_max = GEI1v[0]
+        self.goal_x_min = GAI1v[0]
+        self.goal_x_max = GEI2v[0]
+        self.field_y_min = Q4A1v[1]
+        self.field_y_max = Q1A2v[1]
+
+        # Quinas chanfradas como semiplanos n·p >= c, com n apontando para o centro do campo
+        normals, offsets = [], []
+        for p1, p2 in ((Q1A1v, Q1A2v), (Q2A1v, Q2A2v), (Q3A1v, Q3A2v), (Q4A1v, Q4A2v)):
+            edge = p2 - p1
+            normal = np.array([-edge[1], edge[0]]) / np.linalg.norm(edge)
+            if np.dot(fieldC - p1, normal) < 0:
+                normal = -normal
+            normals.append(normal)
+            offsets.append(np.dot(normal, p1))
+        self.corner_normals = np.array(normals)
+        self.corner_offsets = np.array(offsets)
+
+    # =============================|FUNÇÕES PRINCIPAIS|============================
+    def reset(self, mask: np.ndarray = None):
+        '''
+            Reinicia a partida dos ambientes indicados (posições, placar e cronômetro).
+
+            :param mask (np.ndarray): Vetor booleano (K,) com os ambientes a reiniciar. Se None, reinicia todos.
+        '''
+        if mask is None:
+            mask = np.ones(self.n_envs, dtype=bool)
+        self.reset_positions(mask)
+        self.wheel_speeds[mask] = 0.0
+        self.scores[mask] = 0
+        self.elapsed[mask] = 0.0
+        self.steps[mask] = 0
+
+    def reset_positions(self, mask: np.ndarray):
+        '''
+            Recoloca bola e robôs dos ambientes indicados na posição de saída, zerando as velocidades.
+
+            :param mask (np.ndarray): Vetor booleano (K,) com os ambientes a reposicionar.
+        '''
+        self.positions[mask] = self.initial_positions
+        self.angles[mask] = self.initial_angles
+        self.velocities[mask] = 0.0
+        self.angular_velocities[mask] = 0.0
+
+    def step(self, wheel_speeds: np.ndarray = None):
+        '''
+            Avança todos os ambientes em um passo de física.
+
+            :param wheel_speeds (np.ndarray): Velocidades das rodas (K, N_ROBOTS, 2) em cm/s. Se None, mantém as atuais.
+
+            :return: Tupla (ally_goal, enemy_goal, finished) de vetores booleanos (K,). Os ambientes
+                     com finished verdadeiro já foram reiniciados; o placar final está em final_scores.
+        '''
+        if wheel_speeds is not None:
+            self.wheel_speeds[:, 1:] = wheel_speeds
+
+        # Mesma ordem do Physics.update: colisões, bola, robôs
+        self._resolve_body_collisions()
+        self._resolve_wall_collisions()
+        self._update_ball()
+        self._update_bots()
+
+        self.elapsed += self.dt
+        self.steps += 1
+
+        # Gols: reposiciona apenas os ambientes onde houve gol
+        ally_goal, enemy_goal = self._check_goals()
+        self.scores[:, 0] += ally_goal
+        self.scores[:, 1] += enemy_goal
+        scored = ally_goal | enemy_goal
+        if scored.any():
+            self.reset_positions(scored)
+
+        # Fim de partida: guarda o placar e reinicia apenas esses ambientes
+        finished = self.elapsed >= self.party_time - 1e-9
+        if finished.any():
+            self.final_scores[finished] = self.scores[finished]
+            self.reset(finished)
+
+        return ally_goal, enemy_goal, finished
+
+    # =============================|FÍSICA|============================
+    def _update_bots(self):
+        '''
+            Integração dos robôs em lote, equivalente ao Robot.move.
+        '''
+        dt = self.dt
+        mass = self.masses[1:]
+        v_l = self.wheel_speeds[:, 1:, 0]
+        v_r = self.wheel_speeds[:, 1:, 1]
+        angles = self.angles[:, 1:]
+        velocities = self.velocities[:, 1:]
+        angular_velocities = self.angular_velocities[:, 1:]
+
+        # Força das rodas na direção do robô e torque do diferencial
+        force_magnitude = (v_l + v_r) * mass / 2
+        torque = (v_r - v_l) * mass * ROBOT_DISTANCE_WHEELS_CM / 2
+        direction = np.stack((np.cos(angles), np.sin(angles)), axis=-1)
+
+        velocities += direction * (force_magnitude / mass)[..., None] * dt
+        angular_velocities += (torque / self.inertias[1:]) * dt
+
+        self.positions[:, 1:] += velocities * dt
+        angles += angular_velocities * dt
+        angles %= 2 * np.pi
+
+        # Amortecimento (atrito com o solo)
+        velocities *= (1 - 0.01)
+        angular_velocities *= (1 - 0.05)
+
+    def _update_ball(self):
+        '''
+            Rolamento da bola em lote: velocidade e posição como no Ball.update_position, rotação
+            igual a |v| / raio.
+        '''
+        dt = self.dt
+        velocity = self.velocities[:, 0]
+        speed = np.linalg.norm(velocity, axis=1)
+        moving = speed > 0
+
+        # Desaceleração constante por resistência ao rolamento, sem inverter o sentido
+        friction_accel = 0.002 * 980
+        new_speed = np.maximum(speed - friction_accel * dt, 0.0)
+        scale = np.divide(new_speed, speed, out=np.zeros_like(speed), where=moving)
+        velocity *= np.where(moving, scale, 1.0)[:, None]
+        self.angular_velocities[:, 0] = np.where(moving, new_speed / BALL_RADIUS_CM, self.angular_velocities[:, 0])
+
+        self.positions[:, 0] += velocity * dt
+
+    def _resolve_body_collisions(self):
+        '''
+            Colisões entre todos os pares de corpos (discos) de todos os ambientes ao mesmo tempo:
+            correção de posição proporcional à massa e impulso normal com restituição.
+        '''
+        positions = self.positions
+        diff = positions[:, :, None, :] - positions[:, None, :, :]            # (K, B, B, 2), de j para i
+        distance = np.linalg.norm(diff, axis=-1)
+        radius_sum = self.radii[:, None] + self.radii[None, :]
+        overlap = radius_sum - distance
+        overlap[:, np.arange(self.n_bodies), np.arange(self.n_bodies)] = 0.0
+        colliding = overlap > 0
+        if not colliding.any():
+            return
+
+        safe_distance = np.where(distance > 1e-9, distance, 1.0)
+        normal = np.where((distance > 1e-9)[..., None], diff / safe_distance[..., None], np.array([1.0, 0.0]))
+        normal *= colliding[..., None]
+
+        # Correção de posição: cada corpo anda a fração da massa do outro
+        inv_mass = 1.0 / self.masses
+        mass_share = inv_mass[:, None] / (inv_mass[:, None] + inv_mass[None, :])
+        positions += np.einsum('kij,kijd->kid', overlap * colliding * mass_share, normal)
+
+        # Impulso normal apenas para pares que estão se aproximando
+        velocities = self.velocities
+        relative_velocity = velocities[:, :, None, :] - velocities[:, None, :, :]
+        velocity_along_normal = np.einsum('kijd,kijd->kij', relative_velocity, normal)
+        approaching = colliding & (velocity_along_normal < 0)
+        impulse = -(1 + self.pair_restitution) * velocity_along_normal / (inv_mass[:, None] + inv_mass[None, :])
+        impulse *= approaching
+        velocities += np.einsum('kij,kijd->kid', impulse, normal) * inv_mass[None, :, None]
+
+    def _resolve_wall_collisions(self):
+        '''
+            Colisões com as paredes do campo como semiplanos, com os mesmos amortecimentos do
+            CollisionManagerSAT.resolve_collision_with_field.
+        '''
+        x = self.positions[..., 0]
+        y = self.positions[..., 1]
+        radii = self.radii
+        hit = np.zeros(x.shape, dtype=bool)
+
+        in_goal_mouth = (y > self.goal_y_min) & (y < self.goal_y_max)
+        in_ally_goal = x < self.field_x_min
+        in_enemy_goal = x > self.field_x_max
+        always = np.ones(x.shape, dtype=bool)
+
+        # (normal, offset, ativo): n·p >= offset + raio
+        planes = (
+            ((0.0, 1.0),  self.field_y_min,  always),
+            ((0.0, -1.0), -self.field_y_max, always),
+            ((1.0, 0.0),  self.field_x_min,  ~in_goal_mouth),
+            ((-1.0, 0.0), -self.field_x_max, ~in_goal_mouth),
+            ((1.0, 0.0),  self.goal_x_min,   always),
+            ((-1.0, 0.0), -self.goal_x_max,  always),
+            ((0.0, 1.0),  self.goal_y_min,   in_ally_goal | in_enemy_goal),
+            ((0.0, -1.0), -self.goal_y_max,  in_ally_goal | in_enemy_goal),
+        ) + tuple(
+            (normal, offset, always) for normal, offset in zip(self.corner_normals, self.corner_offsets)
+        )
+
+        for normal, offset, active in planes:
+            normal = np.asarray(normal)
+            penetration = offset + radii - self.positions @ normal
+            touching = active & (penetration > 0)
+            if not touching.any():
+                continue
+            hit |= touching
+            self.positions += (penetration * touching)[..., None] * normal
+
+            velocity_along_normal = self.velocities @ normal
+            bounce = touching & (velocity_along_normal < 0)
+            self.velocities -= ((1 + self.wall_restitution) * velocity_along_normal * bounce)[..., None] * normal
+
+        # Amortecimento de quem encostou na parede
+        self.velocities *= np.where(hit, 1 - 0.02 * self.dt * 60, 1.0)[..., None]
+        self.angular_velocities *= np.where(hit, 1 - 0.5 * self.dt * 60, 1.0)
+
+    def _check_goals(self):
+        '''
+            Verifica, em cada ambiente, se o centro da bola entrou em um dos gols.
+
+            :return: Tupla (ally_goal, enemy_goal) de vetores booleanos (K,).
+        '''
+        ball = self.positions[:, 0]
+        in_goal_mouth = (ball[:, 1] >= self.goal_y_min) & (ball[:, 1] <= self.goal_y_max)
+        ally_goal = in_goal_mouth & (ball[:, 0] >= self.field_x_max)
+        enemy_goal = in_goal_mouth & (ball[:, 0] <= self.field_x_min)
+        return ally_goal, enemy_goal
+
+    # =============================|LEITURA DE ESTADO|============================
+    def get_poses(self):
+        '''
+            Retorna as poses [x, y, ângulo] de todos os corpos de todos os ambientes, formato (K, B, 3).
+        '''
+        return np.concatenate((self.positions, self.angles[..., None]), axis=-1)
@@ -69,7 +69,11 @@ class Interface:
         self.is_game_paused = is_game_paused
         self.draw_grid_collision = draw_grid_collision 
 
-    def draw(self, time_left, screen, ball:Ball, robots:Robot, field:Field):
+    def draw(self, time_left, screen, ball:Ball, robots:Robot, field:Field, poses=None):
+        '''
+            :param poses (array): Poses [x, y, ângulo] interpoladas, com a bola na linha 0 e os
+                robôs na ordem de robots. Se None, desenha o estado atual da física.
+        '''
         screen.fill((200, 200, 200))
 
         minutes = int(time_left // 60)
@@ -82,9 +86,14 @@ class Interface:
         screen.blit(self.field_image, (0, SCOREBOARD_HEIGHT_PX))
 
         #Desenhando objetos do jogo
-        for robot in robots:
-            robot.draw(screen)
-        ball.draw(screen)
+        if poses is None:
+            for robot in robots:
+                robot.draw(screen)
+            ball.draw(screen)
+        else:
+            for robot, pose in zip(robots, poses[1:]):
+                robot.draw(screen, pose=pose)
+            ball.draw(screen, pose=poses[0])
         
         # Desenho extra se ativado
         if self.draw_collision_objects:
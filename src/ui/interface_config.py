@@ -156,14 +156,100 @@ GRID_COLS           = FIELD_INTERNAL_WIDTH_IN_PX // CELL_SIZE
 QUANT_CELLS_GRID    = (GRID_COLS, GRID_ROWS)
 GRID_COLOR          = (255, 0, 0)
 
+# Fase estreita: SAT de todos os pares retângulo-retângulo em uma única chamada NumPy
+BATCH_NARROWPHASE   = True
+
+# Integração de todos os robôs em uma única passada sobre os arrays do WorldState (False: Robot.move por robô)
+BATCH_INTEGRATION   = True
+
+# Fase ampla: "grid" (spatial hashing em células de CELL_SIZE) ou "sap" (sweep and prune incremental)
+BROADPHASE          = "grid"
+SAP_MARGIN          = 1.0         # Folga (cm) nas caixas dos objetos móveis no sweep and prune
+
+# Paredes do campo por SDF (distância com sinal pré-calculada e salva em src/data/temp)
+FIELD_SDF_COLLISIONS = True
+FIELD_SDF_RESOLUTION = 0.5        # Tamanho da célula da grade (cm)
+FIELD_SDF_MARGIN     = 5.0        # Folga da grade além do contorno do campo (cm)
+
+# Colisão contínua (CCD)
+CCD_MIN_SPEED        = 50.0       # Velocidade da bola (cm/s) a partir da qual a CCD é usada
+CCD_ROBOT_MIN_TRAVEL = 2.0        # Deslocamento relativo por passo (cm) a partir do qual robô-robô usa avanço conservador
+CCD_MAX_ITERATIONS   = 20         # Iterações do avanço conservador / sphere tracing
+CCD_TOLERANCE        = 0.05       # Distância (cm) considerada contato
+MAX_SEPARATION_SCALE = 2.0        # Limite do fator de velocidade aplicado ao MTV na correção de posição
+
+# Kernels compilados da física: "auto" (Numba se instalado), "numpy" ou "numba"
+KERNEL_BACKEND       = "auto"
+
+# Resolução de contatos: "sequential" (impulsos sequenciais iterados, com warm starting) ou "pairwise" (um impulso por par)
+CONTACT_SOLVER               = "sequential"
+SOLVER_VELOCITY_ITERATIONS   = 8       # Iterações de velocidade por passo
+SOLVER_POSITION_ITERATIONS   = 3       # Iterações da correção de penetração por passo
+SOLVER_WARM_START            = 0.8     # Fração dos impulsos do passo anterior reaplicada (0 desliga)
+SOLVER_WARM_START_DISTANCE   = 1.0     # Distância máxima (cm) para casar um ponto com o do passo anterior
+SOLVER_MANIFOLD_TOLERANCE    = 0.5     # Pontos até essa distância do mais profundo entram no manifold (cm)
+SOLVER_BAUMGARTE             = 0.8     # Fração da penetração corrigida por iteração de posição
+SOLVER_SLOP                  = 0.05    # Penetração tolerada (cm): mantém o contato vivo para o warm starting
+SOLVER_RESTITUTION_THRESHOLD = 5.0     # Velocidade de aproximação (cm/s) abaixo da qual não há quique
+SOLVER_MAX_VELOCITY          = 200.0   # Limite de velocidade linear após o solver (cm/s)
+SOLVER_MAX_ANGULAR_VELOCITY  = 10.0    # Limite de velocidade angular após o solver (rad/s)
+
+# Corpos dormindo: parados por SLEEP_FRAMES passos saem da fase estreita e da integração até um contato ou comando de roda
+SLEEPING_BODIES        = True
+SLEEP_FRAMES           = 30      # Passos seguidos em repouso para dormir
+SLEEP_LINEAR_VELOCITY  = 0.5     # Velocidade linear (cm/s) considerada repouso
+SLEEP_ANGULAR_VELOCITY = 0.05    # Velocidade angular (rad/s) considerada repouso
+
 # ------------------------------------------------------------
 # CONFIGURAÇÕES DE EXIBIÇÃO E TEMPO DE JOGO
 # ------------------------------------------------------------
 FPS = 100
 
+# Passo fixo da física (independente do FPS de desenho)
+PHYSICS_HZ      = 240               # Frequência fixa da física
+PHYSICS_DT      = 1.0 / PHYSICS_HZ  # Passo de tempo da física (s)
+MAX_FRAME_TIME  = 0.25              # Maior tempo real considerado por quadro, evita espiral de passos
+
+# Integrador da física: "legacy" (Robot.move / Ball.update_position, amortecimento por passo) ou, no
+# modelo contínuo de simulator/integrators.py, "semi_implicit_euler", "verlet" ou "rk4"
+INTEGRATOR = "legacy"
+
+# Modelo contínuo: taxas (1/s) com as mesmas perdas por passo do Robot.move no passo padrão
+ROBOT_LINEAR_DAMPING_RATE  = -np.log(1 - 0.01) / PHYSICS_DT
+ROBOT_ANGULAR_DAMPING_RATE = -np.log(1 - 0.05) / PHYSICS_DT
+BALL_ROLLING_DECELERATION  = 0.002 * 980    # Resistência ao rolamento da bola (cm/s²)
+
+# Rolamento livre da bola em forma fechada (Ball.roll): sem força acumulada, a bola avança de forma
+# exata com desaceleração constante para qualquer dt, inclusive além do ponto de parada
+BALL_ANALYTIC_ROLLING = False
+
+# Passo adaptativo da física headless (SimulationEngine.run_adaptive, ver simulator/adaptive.py):
+# passos longos com os corpos longe e lentos, curtos perto de impactos e da linha do gol. Com robôs
+# encostados os passos são fixos (ADAPTIVE_MIN_DT), com o custo do passo fixo comum
+ADAPTIVE_TIMESTEP       = False             # Se True, SimulationEngine.run usa o passo adaptativo
+ADAPTIVE_MIN_DT         = PHYSICS_DT        # Menor passo (s)
+ADAPTIVE_MAX_DT         = 8 * PHYSICS_DT    # Maior passo (s)
+ADAPTIVE_SAFETY         = 0.5               # Fração do tempo até um possível contato usada como passo
+ADAPTIVE_CONTACT_MARGIN = 1.0               # Folga (cm) abaixo da qual um par é tratado como em contato
+ADAPTIVE_INTEGRATOR     = "rk4"             # Integrador dos passos variáveis se INTEGRATOR for "legacy"
+
 # Tempo da partida em segundos
 TIMER_PARTY = 60
 
+# Multiplicador de velocidade da simulação (velocidade_simulacao)
+MIN_SIMULATION_SPEED            = 0.1   # Câmera lenta máxima
+MAX_SIMULATION_SPEED            = 100.0 # Avanço rápido máximo
+FAST_FORWARD_SKIP_RENDER_SPEED  = 20.0  # A partir desse multiplicador nem todo quadro é desenhado
+FAST_FORWARD_RENDER_INTERVAL    = 10    # Desenha 1 a cada N quadros durante o avanço rápido
+
+# Ambiente de aprendizado por reforço (simulator/env.py)
+ENV_FRAME_SKIP          = 4         # Passos de física por ação
+ENV_MAX_WHEEL_SPEED     = 50.0      # Velocidade máxima das rodas aceita como ação (cm/s)
+ENV_GOAL_REWARD         = 1.0       # Recompensa por gol feito (negativa para gol sofrido)
+
+# Torneio em paralelo (simulator/tournament.py)
+TOURNAMENT_KICKOFF_JITTER_CM = 3.0  # Deslocamento máximo da bola na saída, sorteado pela semente
+
 FIELD_MARGIN_TOP    = 20
 FIELD_MARGIN_BOTTOM = 20
 FIELD_MARGIN_LEFT   = 20
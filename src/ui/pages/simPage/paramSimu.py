@@ -76,8 +76,9 @@ class ParamSimuPage(BasicPage):
         general_layout.addRow("Tempo de Partida:", self.time_input)
 
         self.speed_input = QDoubleSpinBox()
-        self.speed_input.setRange(0.1, 10.0)
+        self.speed_input.setRange(0.1, 100.0)
         self.speed_input.setSingleStep(0.1)
+        self.speed_input.setSuffix(" x")
         self.speed_input.setFixedWidth(80)
         general_layout.addRow("Velocidade Simulação:", self.speed_input)
 
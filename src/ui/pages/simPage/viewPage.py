@@ -191,7 +191,7 @@ class SimulationViewPage(BasicPage):
 
     #Método para atualizar o cronometro 
     def update_timer(self, minutes, seconds):
-        pass 
+        self.timer_widget.set_time(minutes, seconds)
 
 
     #Método para atualizar os logs estatísticos 